@@ -58,6 +58,9 @@ class AttributeContainer:
     Attributes are public class members of a serializable type. Protected and
     private class members are not to be serialized, with the exception of those
     defined in _SERIALIZABLE_PROTECTED_ATTRIBUTES.
+
+    A store can set attribute values in their serialized form, which are
+    deserialized when first accessed.
     """
 
     CONTAINER_TYPE = None
@@ -73,6 +76,65 @@ class AttributeContainer:
             name=self.CONTAINER_TYPE, sequence_number=id(self)
         )
 
+    def __getattr__(self, name):
+        """Retrieves an attribute that has not been deserialized yet.
+
+        This method is only called when the attribute was not found by
+        the regular attribute lookup.
+
+        Args:
+          name (str): name of the attribute.
+
+        Returns:
+          object: value of the attribute.
+
+        Raises:
+          AttributeError: if the attribute does not exist.
+        """
+        serialized_attribute_values = self.__dict__.get("_serialized_attribute_values")
+        if not serialized_attribute_values or name not in serialized_attribute_values:
+            raise AttributeError(name)
+
+        deserialize_function, serialized_value = serialized_attribute_values.pop(name)
+        if not serialized_attribute_values:
+            del self.__dict__["_serialized_attribute_values"]
+
+        attribute_value = deserialize_function(serialized_value)
+        self.__dict__[name] = attribute_value
+
+        return attribute_value
+
+    def __reduce_ex__(self, protocol):
+        """Reduces the attribute container for copying and pickling.
+
+        Args:
+          protocol (int): pickle protocol.
+
+        Returns:
+          tuple[object]: reduced attribute container.
+        """
+        # The functions to deserialize attribute values are not necessarily
+        # picklable, therefore the attribute values are deserialized first.
+        if "_serialized_attribute_values" in self.__dict__:
+            self._DeserializeAttributeValues()
+
+        return super().__reduce_ex__(protocol)
+
+    def _DeserializeAttributeValues(self):
+        """Deserializes the attribute values that have not been deserialized yet."""
+        serialized_attribute_values = self.__dict__.pop(
+            "_serialized_attribute_values", None
+        )
+        if serialized_attribute_values:
+            for attribute_name, values in serialized_attribute_values.items():
+                # Attributes that were set after the serialized value take
+                # precedence.
+                if attribute_name not in self.__dict__:
+                    deserialize_function, serialized_value = values
+                    self.__dict__[attribute_name] = deserialize_function(
+                        serialized_value
+                    )
+
     def CopyFromDict(self, attributes):
         """Copies the attribute container from a dictionary.
 
@@ -107,6 +169,10 @@ class AttributeContainer:
             if attribute_name[0] != "_":
                 attribute_names.append(attribute_name)
 
+        for attribute_name in self.__dict__.get("_serialized_attribute_values", {}):
+            if attribute_name[0] != "_" and attribute_name not in self.__dict__:
+                attribute_names.append(attribute_name)
+
         return attribute_names
 
     def GetAttributes(self):
@@ -117,6 +183,9 @@ class AttributeContainer:
         Yields:
           tuple[str, object]: attribute name and value.
         """
+        if "_serialized_attribute_values" in self.__dict__:
+            self._DeserializeAttributeValues()
+
         for attribute_name, attribute_value in self.__dict__.items():
             # Not using startswith to improve performance.
             if attribute_value is not None and (
@@ -139,6 +208,9 @@ class AttributeContainer:
         Returns:
           str: comparable string of the attribute values.
         """
+        if "_serialized_attribute_values" in self.__dict__:
+            self._DeserializeAttributeValues()
+
         attributes = []
         for attribute_name, attribute_value in sorted(self.__dict__.items()):
             # Not using startswith to improve performance.
@@ -178,6 +250,9 @@ class AttributeContainer:
         """
         result = not expression
         if expression:
+            if "_serialized_attribute_values" in self.__dict__:
+                self._DeserializeAttributeValues()
+
             namespace = {}
             for attribute_name, attribute_value in self.__dict__.items():
                 # Not using startswith to improve performance.
@@ -209,3 +284,73 @@ class AttributeContainer:
           identifier (AttributeContainerIdentifier): identifier.
         """
         self._identifier = identifier
+
+    def SetSerializedAttributeValues(self, serialized_attribute_values):
+        """Sets attribute values that are deserialized when first accessed.
+
+        Args:
+          serialized_attribute_values (dict[str, tuple[function, object]]):
+              function to deserialize the value and the serialized value per
+              attribute name.
+        """
+        for attribute_name in serialized_attribute_values.keys():
+            self.__dict__.pop(attribute_name, None)
+
+        self.__dict__["_serialized_attribute_values"] = serialized_attribute_values
+
+
+class TrackedAttributeContainer(AttributeContainer):
+    """The attribute container interface with changed attribute tracking.
+
+    Assignments to attributes that are serialized are tracked, so that a store
+    only needs to write the attributes that changed since the attribute
+    container was read from or written to the store. Note that changes made
+    in-place to a mutable attribute value, such as a list, are not tracked
+    and require the attribute to be assigned again.
+    """
+
+    def __init__(self):
+        """Initializes an attribute container."""
+        self._changed_attribute_names = set()
+        super().__init__()
+
+    def __setattr__(self, name, value):
+        """Sets an attribute and tracks the change.
+
+        Args:
+          name (str): name of the attribute.
+          value (object): value of the attribute.
+        """
+        # Not using startswith to improve performance.
+        if name[0] != "_" or name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES:
+            self._changed_attribute_names.add(name)
+
+        super().__setattr__(name, value)
+
+    def ClearChangedAttributeNames(self):
+        """Clears the names of the changed attributes."""
+        self._changed_attribute_names = set()
+
+    def CopyFromDict(self, attributes):
+        """Copies the attribute container from a dictionary.
+
+        Args:
+          attributes (dict[str, object]): attribute values per name.
+        """
+        super().CopyFromDict(attributes)
+
+        for attribute_name in attributes.keys():
+            # Not using startswith to improve performance.
+            if (
+                attribute_name[0] != "_"
+                or attribute_name in self._SERIALIZABLE_PROTECTED_ATTRIBUTES
+            ):
+                self._changed_attribute_names.add(attribute_name)
+
+    def GetChangedAttributeNames(self):
+        """Retrieves the names of the attributes changed since the last clear.
+
+        Returns:
+          set[str]: names of the changed attributes.
+        """
+        return set(self._changed_attribute_names)
@@ -6,6 +6,10 @@ class AttributeContainersManager:
 
     _attribute_container_classes = {}
 
+    # Revision of the registered attribute container classes, which changes
+    # every time an attribute container class is registered or deregistered.
+    _revision = 0
+
     @classmethod
     def CreateAttributeContainer(cls, container_type):
         """Creates an instance of a specific attribute container type.
@@ -47,6 +51,7 @@ class AttributeContainersManager:
             )
 
         del cls._attribute_container_classes[container_type]
+        cls._revision += 1
 
     @classmethod
     def GetContainerTypes(cls):
@@ -57,6 +62,19 @@ class AttributeContainersManager:
         """
         return list(cls._attribute_container_classes.keys())
 
+    @classmethod
+    def GetRevision(cls):
+        """Retrieves the revision of the registered attribute containers.
+
+        The revision can be used to determine if information derived from
+        the registered attribute containers, such as their schema, is outdated.
+
+        Returns:
+          int: revision, which changes every time an attribute container class
+              is registered or deregistered.
+        """
+        return cls._revision
+
     @classmethod
     def GetSchema(cls, container_type):
         """Retrieves the schema of a registered attribute container.
@@ -99,6 +117,7 @@ class AttributeContainersManager:
             )
 
         cls._attribute_container_classes[container_type] = attribute_container_class
+        cls._revision += 1
 
     @classmethod
     def RegisterAttributeContainers(cls, attribute_container_classes):
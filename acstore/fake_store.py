@@ -1,11 +1,13 @@
 """Fake (in-memory only) attribute container store for testing."""
 
-import ast
 import collections
 import copy
+import itertools
 
 from acstore import interface
 from acstore.containers import interface as containers_interface
+from acstore.helpers import filter_predicate
+from acstore.helpers import schema as schema_helper
 
 
 class FakeAttributeContainerStore(interface.AttributeContainerStore):
@@ -18,6 +20,28 @@ class FakeAttributeContainerStore(interface.AttributeContainerStore):
         self._attribute_containers = {}
         self._is_open = False
 
+    def _CopyAttributeContainer(self, container, attribute_names):
+        """Copies specific attributes of an attribute container.
+
+        Args:
+          container (AttributeContainer): attribute container.
+          attribute_names (list[str]): names of the attributes to copy.
+
+        Returns:
+          AttributeContainer: partially populated attribute container.
+        """
+        container_copy = container.__class__()
+        for name in attribute_names:
+            if name in container.__dict__:
+                setattr(container_copy, name, getattr(container, name))
+
+        if isinstance(container_copy, containers_interface.TrackedAttributeContainer):
+            container_copy.ClearChangedAttributeNames()
+
+        container_copy.SetIdentifier(container.GetIdentifier())
+
+        return container_copy
+
     def _RaiseIfNotReadable(self):
         """Raises if the store is not readable.
 
@@ -119,12 +143,16 @@ class FakeAttributeContainerStore(interface.AttributeContainerStore):
         lookup_key = identifier.CopyToString()
         return containers.get(lookup_key)
 
-    def GetAttributeContainerByIndex(self, container_type, index):
+    def GetAttributeContainerByIndex(self, container_type, index, attribute_names=None):
         """Retrieves a specific attribute container.
 
         Args:
           container_type (str): attribute container type.
           index (int): attribute container index.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. Note that the
+              store can return an attribute container with more attributes
+              than requested.
 
         Returns:
           AttributeContainer: attribute container or None if not available.
@@ -137,53 +165,174 @@ class FakeAttributeContainerStore(interface.AttributeContainerStore):
         container_indexes = self._attribute_container_indexes.get(container_type, None)
         lookup_key = container_indexes[index]
 
-        return containers[lookup_key]
-
-    def GetAttributeContainers(self, container_type, filter_expression=None):
+        container = containers[lookup_key]
+        if attribute_names is not None:
+            container = self._CopyAttributeContainer(container, attribute_names)
+
+        return container
+
+    def GetAttributeContainers(
+        self,
+        container_type,
+        filter_expression=None,
+        attribute_names=None,
+        order_by=None,
+        start_index=None,
+        end_index=None,
+        limit=None,
+        after_key=None,
+    ):
         """Retrieves a specific type of attribute containers.
 
+        To page through the attribute containers in order of index, retrieve
+        the next page with start_index set to the index after that of the last
+        attribute container of the previous page. To page through the attribute
+        containers in order of an attribute, retrieve the next page with
+        after_key set to the value of the attribute and the index of the last
+        attribute container of the previous page.
+
         Args:
           container_type (str): attribute container type.
           filter_expression (Optional[str]): expression to filter the resulting
               attribute containers by.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. The attribute
+              containers are partially populated when only specific attributes
+              are retrieved, and should not be used to update the store,
+              unless these track changed attributes.
+          order_by (Optional[str]): name of the attribute to order the attribute
+              containers by, where attribute containers with the same value are
+              ordered by index. By default the attribute containers are ordered
+              by index.
+          start_index (Optional[int]): index of the first attribute container
+              to retrieve, where a negative index represents the first
+              attribute container.
+          end_index (Optional[int]): index after the last attribute container to
+              retrieve, where None represents all remaining attribute containers.
+          limit (Optional[int]): maximum number of attribute containers to
+              retrieve, where a limit of 0 or less retrieves no attribute
+              containers.
+          after_key (Optional[tuple[object, int]]): value of the attribute to
+              order by and index of the attribute container after which to
+              retrieve attribute containers in order.
 
         Yield:
           AttributeContainer: attribute container.
+
+        Raises:
+          ValueError: if the values of the attribute to order by are serialized
+              as JSON or if an after key is provided without an attribute to
+              order by.
         """
-        if filter_expression:
-            expression_ast = ast.parse(filter_expression, mode="eval")
-            filter_expression = compile(expression_ast, "<string>", mode="eval")
+        if order_by:
+            # Values serialized as JSON are ordered differently by the other
+            # stores and their runtime values cannot always be compared.
+            schema = self._GetAttributeContainerSchema(container_type)
+            data_type = schema.get(order_by)
+            if data_type and schema_helper.SchemaHelper.GetAttributeSerializer(
+                data_type, "json"
+            ):
+                raise ValueError(f"Unsupported attribute to order by: {order_by:s}")
+
+        if after_key is not None and not order_by:
+            raise ValueError("Unsupported after key without attribute to order by")
+
+        if limit is not None and limit <= 0:
+            return
+
+        # Negative indexes are not relative to the end of the attribute
+        # containers, which is consistent with the other stores.
+        if start_index is not None:
+            start_index = max(start_index, 0)
+        if end_index is not None:
+            end_index = max(end_index, 0)
 
-        for attribute_container in self._attribute_containers.get(
-            container_type, {}
-        ).values():
-            if attribute_container.MatchesExpression(filter_expression):
-                yield attribute_container
+        containers = self._attribute_containers.get(container_type, {})
+        container_indexes = self._attribute_container_indexes.get(container_type, [])
 
-    def GetNumberOfAttributeContainers(self, container_type):
+        attribute_containers = (
+            containers[lookup_key]
+            for lookup_key in container_indexes[start_index:end_index]
+        )
+        if filter_expression:
+            predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+                filter_expression
+            )
+            attribute_containers = filter(predicate, attribute_containers)
+
+        if order_by:
+            # Attribute containers without the value are ordered first and
+            # the index makes the order deterministic for pagination.
+            def _GetSortKey(attribute_container):
+                value = getattr(attribute_container, order_by, None)
+                index = attribute_container.GetIdentifier().sequence_number - 1
+                return value is not None, value, index
+
+            attribute_containers = sorted(attribute_containers, key=_GetSortKey)
+
+            if after_key is not None:
+                after_value, after_index = after_key
+                after_sort_key = (after_value is not None, after_value, after_index)
+                attribute_containers = (
+                    attribute_container
+                    for attribute_container in attribute_containers
+                    if _GetSortKey(attribute_container) > after_sort_key
+                )
+
+        for attribute_container in itertools.islice(attribute_containers, limit):
+            if attribute_names is not None:
+                attribute_container = self._CopyAttributeContainer(
+                    attribute_container, attribute_names
+                )
+
+            yield attribute_container
+
+    def GetNumberOfAttributeContainers(self, container_type, filter_expression=None):
         """Retrieves the number of a specific type of attribute containers.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
-          int: the number of containers of a specified type.
+          int: the number of containers of a specified type, that match the filter
+              expression if provided.
         """
         containers = self._attribute_containers.get(container_type, {})
-        return len(containers)
+        if not filter_expression:
+            return len(containers)
+
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+            filter_expression
+        )
+
+        return sum(1 for _ in filter(predicate, containers.values()))
 
-    def HasAttributeContainers(self, container_type):
+    def HasAttributeContainers(self, container_type, filter_expression=None):
         """Determines if a store contains a specific type of attribute container.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
           bool: True if the store contains the specified type of attribute
-              containers.
+              containers, that match the filter expression if provided.
         """
         containers = self._attribute_containers.get(container_type, {})
-        return bool(containers)
+        if not filter_expression:
+            return bool(containers)
+
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+            filter_expression
+        )
+
+        return any(
+            predicate(attribute_container)
+            for attribute_container in containers.values()
+        )
 
     def Open(self, **kwargs):
         """Opens the store.
@@ -0,0 +1,282 @@
+"""Filter predicate helper."""
+
+import ast
+import collections
+import copy
+
+from acstore.containers import interface as containers_interface
+
+
+def _GetAttributeValue(container, attribute_name):
+    """Retrieves the value of an attribute for a filter expression.
+
+    Args:
+      container (AttributeContainer): attribute container.
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      object: value of the attribute, where identifiers are represented as
+          strings.
+
+    Raises:
+      NameError: if the attribute container has no value for the attribute.
+    """
+    value = container.__dict__.get(attribute_name)
+    if value is None:
+        # Attribute values that have not been deserialized yet are deserialized
+        # on access.
+        serialized_attribute_values = container.__dict__.get(
+            "_serialized_attribute_values"
+        )
+        if serialized_attribute_values and attribute_name in (
+            serialized_attribute_values
+        ):
+            value = getattr(container, attribute_name)
+
+        if value is None:
+            raise NameError(attribute_name)
+
+    if isinstance(value, containers_interface.AttributeContainerIdentifier):
+        value = value.CopyToString()
+
+    return value
+
+
+def _GetProtectedAttributeValue(container, attribute_name):
+    """Retrieves the value of a protected attribute for a filter expression.
+
+    Args:
+      container (AttributeContainer): attribute container.
+      attribute_name (str): name of the attribute.
+
+    Returns:
+      object: value of the attribute, where identifiers are represented as
+          strings.
+
+    Raises:
+      NameError: if the attribute is not serializable or the attribute
+          container has no value for the attribute.
+    """
+    # pylint: disable=protected-access
+    if attribute_name not in container._SERIALIZABLE_PROTECTED_ATTRIBUTES:
+        raise NameError(attribute_name)
+
+    return _GetAttributeValue(container, attribute_name)
+
+
+class _AttributeNameTransformer(ast.NodeTransformer):
+    """Replaces names in a filter expression by attribute value lookups."""
+
+    # pylint: disable=invalid-name
+
+    # Attribute values that are set and are not identifiers are looked up
+    # directly in the attribute values of the attribute container, other
+    # attribute values with _GetAttributeValue.
+    _LOOKUP_TEMPLATE = " ".join(
+        [
+            "value if (value := attribute_values.get({0!r})) is not None",
+            "and type(value) is not AttributeContainerIdentifier",
+            "else _GetAttributeValue(container, {0!r})",
+        ]
+    )
+
+    _PROTECTED_LOOKUP_TEMPLATE = "_GetProtectedAttributeValue(container, {0!r})"
+
+    def visit_Name(self, node):
+        """Replaces a name node by an attribute value lookup.
+
+        Args:
+          node (ast.Name): name node.
+
+        Returns:
+          ast.expr: expression node that looks up the value of the attribute.
+        """
+        if node.id[0] == "_":
+            lookup_template = self._PROTECTED_LOOKUP_TEMPLATE
+        else:
+            lookup_template = self._LOOKUP_TEMPLATE
+
+        lookup_expression = lookup_template.format(node.id)
+        lookup_node = ast.parse(lookup_expression, mode="eval").body
+        return ast.copy_location(lookup_node, node)
+
+
+class FilterPredicateHelper:
+    """Filter predicate helper.
+
+    Compiles filter expressions into predicates, functions that determine if
+    an attribute container matches the filter expression, with the semantics
+    of AttributeContainer.MatchesExpression. A predicate only looks up
+    the attributes referenced by the filter expression, instead of building
+    a namespace of all the attributes of every attribute container to
+    evaluate the filter expression in.
+    """
+
+    # Maximum number of cached predicates.
+    _MAXIMUM_CACHED_PREDICATES = 256
+
+    _PREDICATE_TEMPLATE = "\n".join(
+        [
+            "def _Predicate(container):",
+            "    attribute_values = container.__dict__",
+            "    try:",
+            "        return None",
+            "    except Exception:",
+            "        return False",
+        ]
+    )
+
+    _SUPPORTED_NODE_TYPES = frozenset(
+        [
+            ast.Attribute,
+            ast.BinOp,
+            ast.BoolOp,
+            ast.Call,
+            ast.Compare,
+            ast.Constant,
+            ast.Expression,
+            ast.List,
+            ast.Load,
+            ast.Name,
+            ast.Set,
+            ast.Slice,
+            ast.Subscript,
+            ast.Tuple,
+            ast.UnaryOp,
+        ]
+    )
+
+    _SUPPORTED_OPERATOR_TYPES = (ast.boolop, ast.cmpop, ast.operator, ast.unaryop)
+
+    _predicates = collections.OrderedDict()
+
+    @classmethod
+    def _IsSupported(cls, expression_ast):
+        """Determines if the nodes of a filter expression are supported.
+
+        Supported are constants, names, attributes, subscripts, operators and
+        calls with positional arguments, such as of a method of an attribute
+        value. Nodes that introduce names, such as lambda and comprehension
+        nodes, are not supported.
+
+        Args:
+          expression_ast (ast.Expression): AST of the filter expression.
+
+        Returns:
+          bool: True if all nodes of the filter expression are supported.
+        """
+        for ast_node in ast.walk(expression_ast):
+            if isinstance(ast_node, cls._SUPPORTED_OPERATOR_TYPES):
+                continue
+
+            if type(ast_node) not in cls._SUPPORTED_NODE_TYPES:
+                return False
+
+            if isinstance(ast_node, ast.Call) and ast_node.keywords:
+                return False
+
+        return True
+
+    @classmethod
+    def CompilePredicate(cls, expression):
+        """Compiles a filter expression into a predicate.
+
+        The predicates are cached per filter expression.
+
+        Args:
+          expression (str): filter expression.
+
+        Returns:
+          function: predicate, that determines if an attribute container
+              matches the filter expression.
+
+        Raises:
+          SyntaxError: if the filter expression is not valid.
+        """
+        predicate = cls._predicates.get(expression)
+        if predicate:
+            cls._predicates.move_to_end(expression, last=False)
+            return predicate
+
+        expression_ast = ast.parse(expression, mode="eval")
+        predicate = cls.CompilePredicateFromAST(expression_ast)
+
+        if len(cls._predicates) >= cls._MAXIMUM_CACHED_PREDICATES:
+            cls._predicates.popitem(last=True)
+
+        cls._predicates[expression] = predicate
+        cls._predicates.move_to_end(expression, last=False)
+
+        return predicate
+
+    @classmethod
+    def CompilePredicateFromAST(cls, expression_ast):
+        """Compiles the AST of a filter expression into a predicate.
+
+        The filter expression is compiled once into a function, in which
+        the names are replaced by lookups of the corresponding attribute values.
+        Filter expressions with nodes that are not supported are evaluated by
+        the predicate with AttributeContainer.MatchesExpression.
+
+        The names referenced by the filter expression, which include
+        the names of the attributes it depends on, are stored in
+        the attribute_names attribute of the predicate.
+
+        Args:
+          expression_ast (ast.Expression): AST of the filter expression.
+
+        Returns:
+          function: predicate, that determines if an attribute container
+              matches the filter expression.
+        """
+        attribute_names = frozenset(
+            ast_node.id
+            for ast_node in ast.walk(expression_ast)
+            if isinstance(ast_node, ast.Name)
+        )
+
+        if not cls._IsSupported(expression_ast):
+            expression_ast = ast.fix_missing_locations(expression_ast)
+            code = compile(expression_ast, "<string>", mode="eval")
+
+            def _MatchesExpression(container):
+                """Determines if an attribute container matches the expression.
+
+                Args:
+                  container (AttributeContainer): attribute container.
+
+                Returns:
+                  bool: True if the attribute container matches the expression,
+                      False otherwise.
+                """
+                return container.MatchesExpression(code)
+
+            _MatchesExpression.attribute_names = attribute_names
+            return _MatchesExpression
+
+        # The transformer modifies the AST, hence it is applied on a copy.
+        body_ast = _AttributeNameTransformer().visit(copy.deepcopy(expression_ast.body))
+
+        module_ast = ast.parse(cls._PREDICATE_TEMPLATE)
+        module_ast.body[0].body[1].body[0].value = body_ast
+        module_ast = ast.fix_missing_locations(module_ast)
+
+        # All the names in the filter expression are replaced by attribute
+        # value lookups, hence the predicate can only reference the names in
+        # the namespace.
+        namespace = {
+            "AttributeContainerIdentifier": (
+                containers_interface.AttributeContainerIdentifier
+            ),
+            "Exception": Exception,
+            "_GetAttributeValue": _GetAttributeValue,
+            "_GetProtectedAttributeValue": _GetProtectedAttributeValue,
+            "__builtins__": {},
+            "type": type,
+        }
+        exec(  # pylint: disable=exec-used
+            compile(module_ast, "<string>", mode="exec"), namespace
+        )
+        predicate = namespace["_Predicate"]
+        predicate.attribute_names = attribute_names
+        return predicate
@@ -9,6 +9,14 @@ from acstore.containers import manager as containers_manager
 class AttributeSerializer:
     """Attribute serializer."""
 
+    # Type of the runtime values, if the serialized JSON values have the same
+    # structure, which is "dict" for a dictionary with the keys and values of
+    # a JSON object, "list" for a list with the values of a JSON array or
+    # "object" for an object with an attribute per key of a JSON object.
+    # The nested values must be the same as the corresponding JSON values.
+    # A store can use the type to filter on the serialized values.
+    JSON_VALUE_TYPE = None
+
     @abc.abstractmethod
     def DeserializeValue(self, value):
         """Deserializes a value.
@@ -39,6 +47,9 @@ class AttributeContainerStore:
       format_version (int): storage format version.
     """
 
+    # Names of the supported aggregate functions.
+    _AGGREGATE_FUNCTION_NAMES = frozenset(["count", "max", "min", "sum"])
+
     def __init__(self):
         """Initializes an attribute container store."""
         super().__init__()
@@ -60,6 +71,29 @@ class AttributeContainerStore:
         self._attribute_container_sequence_numbers[container_type] += 1
         return self._attribute_container_sequence_numbers[container_type]
 
+    def _GetAttributeContainerNextSequenceNumbers(
+        self, container_type, number_of_sequence_numbers
+    ):
+        """Retrieves a block of next sequence numbers of an attribute container.
+
+        Args:
+          container_type (str): attribute container type.
+          number_of_sequence_numbers (int): number of sequence numbers to retrieve.
+
+        Returns:
+          range: next sequence numbers.
+        """
+        last_sequence_number = self._attribute_container_sequence_numbers[
+            container_type
+        ]
+        self._attribute_container_sequence_numbers[
+            container_type
+        ] += number_of_sequence_numbers
+        return range(
+            last_sequence_number + 1,
+            last_sequence_number + number_of_sequence_numbers + 1,
+        )
+
     def _GetAttributeContainerSchema(self, container_type):
         """Retrieves the schema of an attribute container.
 
@@ -114,6 +148,15 @@ class AttributeContainerStore:
           container (AttributeContainer): attribute container.
         """
 
+    def _WriteExistingAttributeContainers(self, containers):
+        """Writes existing attribute containers to the store.
+
+        Args:
+          containers (list[AttributeContainer]): attribute containers.
+        """
+        for container in containers:
+            self._WriteExistingAttributeContainer(container)
+
     @abc.abstractmethod
     def _WriteNewAttributeContainer(self, container):
         """Writes a new attribute container to the store.
@@ -122,6 +165,15 @@ class AttributeContainerStore:
           container (AttributeContainer): attribute container.
         """
 
+    def _WriteNewAttributeContainers(self, containers):
+        """Writes new attribute containers to the store.
+
+        Args:
+          containers (list[AttributeContainer]): attribute containers.
+        """
+        for container in containers:
+            self._WriteNewAttributeContainer(container)
+
     def AddAttributeContainer(self, container):
         """Adds a new attribute container.
 
@@ -134,10 +186,101 @@ class AttributeContainerStore:
         self._RaiseIfNotWritable()
         self._WriteNewAttributeContainer(container)
 
+    def AddAttributeContainers(self, containers):
+        """Adds new attribute containers.
+
+        Args:
+          containers (Iterable[AttributeContainer]): attribute containers.
+
+        Raises:
+          OSError: if the store cannot be written to.
+        """
+        self._RaiseIfNotWritable()
+        self._WriteNewAttributeContainers(list(containers))
+
     @abc.abstractmethod
     def Close(self):
         """Closes the store."""
 
+    def GetAggregatedAttributeValues(
+        self,
+        container_type,
+        function_name,
+        attribute_name=None,
+        group_by=None,
+        filter_expression=None,
+    ):
+        """Aggregates the attribute values of a specific type of attribute containers.
+
+        Attribute values that are None are ignored by the aggregate functions,
+        except for "count" without an attribute name, which counts the attribute
+        containers.
+
+        Args:
+          container_type (str): attribute container type.
+          function_name (str): name of the aggregate function, which can be
+              "count", "max", "min" or "sum".
+          attribute_name (Optional[str]): name of the attribute to aggregate,
+              where None is only supported by "count".
+          group_by (Optional[str]): name of the attribute to group the attribute
+              containers by, where None represents all attribute containers.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
+
+        Returns:
+          object: aggregated value or a dictionary of the aggregated value per
+              value of the group by attribute, if provided. The aggregated value
+              of "count" is 0 and that of the other functions None if there are
+              no attribute values to aggregate.
+
+        Raises:
+          ValueError: if the aggregate function is not supported or the
+              attribute name is missing.
+        """
+        if function_name not in self._AGGREGATE_FUNCTION_NAMES:
+            raise ValueError(f"Unsupported aggregate function: {function_name!s}")
+
+        if not attribute_name and function_name != "count":
+            raise ValueError(
+                f"Missing attribute name for aggregate function: {function_name:s}"
+            )
+
+        attribute_names = [name for name in (group_by, attribute_name) if name]
+
+        values_per_group = {}
+        for _, values in self.IterateAttributeValues(
+            container_type,
+            attribute_names=attribute_names,
+            filter_expression=filter_expression,
+        ):
+            group_value = values[0] if group_by else None
+            group_values = values_per_group.setdefault(group_value, [])
+
+            value = values[-1] if attribute_name else True
+            if value is not None:
+                group_values.append(value)
+
+        aggregated_values = {}
+        for group_value, values in values_per_group.items():
+            if function_name == "count":
+                aggregated_value = len(values)
+            elif not values:
+                aggregated_value = None
+            elif function_name == "max":
+                aggregated_value = max(values)
+            elif function_name == "min":
+                aggregated_value = min(values)
+            else:
+                aggregated_value = sum(values)
+
+            aggregated_values[group_value] = aggregated_value
+
+        if group_by:
+            return aggregated_values
+
+        default_value = 0 if function_name == "count" else None
+        return aggregated_values.get(None, default_value)
+
     @abc.abstractmethod
     def GetAttributeContainerByIdentifier(self, container_type, identifier):
         """Retrieves a specific type of container with a specific identifier.
@@ -151,52 +294,218 @@ class AttributeContainerStore:
         """
 
     @abc.abstractmethod
-    def GetAttributeContainerByIndex(self, container_type, index):
+    def GetAttributeContainerByIndex(self, container_type, index, attribute_names=None):
         """Retrieves a specific attribute container.
 
         Args:
           container_type (str): attribute container type.
           index (int): attribute container index.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. Note that the
+              store can return an attribute container with more attributes
+              than requested.
 
         Returns:
           AttributeContainer: attribute container or None if not available.
         """
 
     @abc.abstractmethod
-    def GetAttributeContainers(self, container_type, filter_expression=None):
+    def GetAttributeContainers(
+        self,
+        container_type,
+        filter_expression=None,
+        attribute_names=None,
+        order_by=None,
+        start_index=None,
+        end_index=None,
+        limit=None,
+        after_key=None,
+    ):
         """Retrieves a specific type of attribute containers.
 
+        To page through the attribute containers in order of index, retrieve
+        the next page with start_index set to the index after that of the last
+        attribute container of the previous page. To page through the attribute
+        containers in order of an attribute, retrieve the next page with
+        after_key set to the value of the attribute and the index of the last
+        attribute container of the previous page.
+
         Args:
           container_type (str): attribute container type.
           filter_expression (Optional[str]): expression to filter the resulting
               attribute containers by.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. The attribute
+              containers are partially populated when only specific attributes
+              are retrieved, and should not be used to update the store,
+              unless these track changed attributes.
+          order_by (Optional[str]): name of the attribute to order the attribute
+              containers by, where attribute containers with the same value are
+              ordered by index. By default the attribute containers are ordered
+              by index.
+          start_index (Optional[int]): index of the first attribute container
+              to retrieve, where a negative index represents the first
+              attribute container.
+          end_index (Optional[int]): index after the last attribute container to
+              retrieve, where None represents all remaining attribute containers.
+          limit (Optional[int]): maximum number of attribute containers to
+              retrieve, where a limit of 0 or less retrieves no attribute
+              containers.
+          after_key (Optional[tuple[object, int]]): value of the attribute to
+              order by and index of the attribute container after which to
+              retrieve attribute containers in order.
 
         Returns:
           generator(AttributeContainer): attribute container generator.
         """
 
+    def GetAttributeContainersByIdentifiers(self, container_type, identifiers):
+        """Retrieves specific attribute containers by their identifiers.
+
+        Args:
+          container_type (str): attribute container type.
+          identifiers (Iterable[AttributeContainerIdentifier]): attribute
+              container identifiers.
+
+        Returns:
+          list[AttributeContainer]: attribute containers in the order of
+              the identifiers, where None represents an attribute container
+              that is not available.
+        """
+        return self.GetAttributeContainersByIndexes(
+            container_type,
+            [identifier.sequence_number - 1 for identifier in identifiers],
+        )
+
+    def GetAttributeContainersByIndexes(
+        self, container_type, indexes, attribute_names=None
+    ):
+        """Retrieves specific attribute containers by their indexes.
+
+        Args:
+          container_type (str): attribute container type.
+          indexes (Iterable[int]): attribute container indexes.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. Note that the
+              store can return attribute containers with more attributes than
+              requested.
+
+        Returns:
+          list[AttributeContainer]: attribute containers in the order of
+              the indexes, where None represents an attribute container that
+              is not available.
+        """
+        return [
+            self.GetAttributeContainerByIndex(
+                container_type, index, attribute_names=attribute_names
+            )
+            for index in indexes
+        ]
+
+    def GetDistinctAttributeValues(
+        self, container_type, attribute_name, filter_expression=None
+    ):
+        """Retrieves the distinct values of an attribute.
+
+        Args:
+          container_type (str): attribute container type.
+          attribute_name (str): name of the attribute.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
+
+        Returns:
+          list[object]: distinct values of the attribute, in no specific order,
+              where None represents attribute containers without a value.
+        """
+        distinct_values = []
+        hashable_values = set()
+        unhashable_values = []
+        for _, (value,) in self.IterateAttributeValues(
+            container_type,
+            attribute_names=[attribute_name],
+            filter_expression=filter_expression,
+        ):
+            try:
+                if value in hashable_values:
+                    continue
+                hashable_values.add(value)
+
+            except TypeError:
+                # Values that are not hashable, such as lists, can only be equal
+                # to other values that are not hashable.
+                if value in unhashable_values:
+                    continue
+                unhashable_values.append(value)
+
+            distinct_values.append(value)
+
+        return distinct_values
+
     @abc.abstractmethod
-    def GetNumberOfAttributeContainers(self, container_type):
+    def GetNumberOfAttributeContainers(self, container_type, filter_expression=None):
         """Retrieves the number of a specific type of attribute containers.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
-          int: the number of containers of a specified type.
+          int: the number of containers of a specified type, that match the filter
+              expression if provided.
         """
 
     @abc.abstractmethod
-    def HasAttributeContainers(self, container_type):
+    def HasAttributeContainers(self, container_type, filter_expression=None):
         """Determines if a store contains a specific type of attribute container.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
           bool: True if the store contains the specified type of attribute
-              containers.
+              containers, that match the filter expression if provided.
+        """
+
+    def IterateAttributeValues(
+        self, container_type, attribute_names=None, filter_expression=None
+    ):
+        """Iterates the attribute values of a specific type of attribute containers.
+
+        This method allows to read attribute values without the overhead of
+        creating attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes of the schema
+              sorted by name.
+          filter_expression (Optional[str]): expression to filter the resulting
+              attribute containers by.
+
+        Yields:
+          tuple[int, tuple[object]]: sequence number of the attribute container
+              and the values of the attributes, in the order of the attribute
+              names, where None represents an attribute without a value.
         """
+        if attribute_names is None:
+            schema = self._GetAttributeContainerSchema(container_type)
+            attribute_names = sorted(schema.keys())
+        else:
+            attribute_names = list(attribute_names)
+
+        for container in self.GetAttributeContainers(
+            container_type,
+            filter_expression=filter_expression,
+            attribute_names=attribute_names,
+        ):
+            identifier = container.GetIdentifier()
+            yield (
+                identifier.sequence_number,
+                tuple(getattr(container, name, None) for name in attribute_names),
+            )
 
     @abc.abstractmethod
     def Open(self, **kwargs):
@@ -222,6 +531,73 @@ class AttributeContainerStore:
         self._RaiseIfNotWritable()
         self._WriteExistingAttributeContainer(container)
 
+    def UpdateAttributeContainers(self, containers):
+        """Updates existing attribute containers.
+
+        Args:
+          containers (Iterable[AttributeContainer]): attribute containers.
+
+        Raises:
+          OSError: if the store cannot be written to.
+        """
+        self._RaiseIfNotWritable()
+        self._WriteExistingAttributeContainers(list(containers))
+
+
+class AttributeContainerReadAhead:
+    """Read-ahead state of a specific type of attribute containers.
+
+    Attributes:
+      last_index (int): index of the most recently accessed attribute container.
+      number_of_hits (int): number of accesses of attribute containers that
+          were read ahead in the current window.
+      run_length (int): number of consecutive accesses with the same stride.
+      stride (int): difference between the indexes of consecutive accesses.
+      total_number_of_containers (int): number of attribute containers that
+          were read ahead, other than the attribute containers being accessed
+          when reading ahead, in all windows.
+      total_number_of_hits (int): number of accesses of attribute containers
+          that were read ahead, other than the attribute containers being
+          accessed when reading ahead, in all windows.
+      window_end (int): index after the last attribute container that was read
+          ahead in the current window.
+      window_size (int): number of attribute containers to read ahead.
+      window_start (int): index of the first attribute container that was read
+          ahead in the current window.
+    """
+
+    def __init__(self, window_size):
+        """Initializes a read-ahead state.
+
+        Args:
+          window_size (int): number of attribute containers to read ahead.
+        """
+        super().__init__()
+        self.last_index = None
+        self.number_of_hits = 0
+        self.run_length = 0
+        self.stride = None
+        self.total_number_of_containers = 0
+        self.total_number_of_hits = 0
+        self.window_end = None
+        self.window_size = window_size
+        self.window_start = None
+
+    def IsInWindow(self, index):
+        """Determines if an attribute container was read ahead in the current window.
+
+        Args:
+          index (int): attribute container index.
+
+        Returns:
+          bool: True if the attribute container was read ahead.
+        """
+        return (
+            self.window_start is not None
+            and self.window_start <= index < self.window_end
+            and (index - self.window_start) % self.stride == 0
+        )
+
 
 class AttributeContainerStoreWithReadCache(AttributeContainerStore):
     """Interface of an attribute container store with read cache.
@@ -235,10 +611,15 @@ class AttributeContainerStoreWithReadCache(AttributeContainerStore):
     # The maximum number of cached attribute containers
     _MAXIMUM_CACHED_CONTAINERS = 32 * 1024
 
+    # The minimum and maximum number of attribute containers to read ahead.
+    _MINIMUM_READ_AHEAD_WINDOW_SIZE = 16
+    _MAXIMUM_READ_AHEAD_WINDOW_SIZE = 1024
+
     def __init__(self):
         """Initializes an attribute container store with read cache."""
         super().__init__()
         self._attribute_container_cache = collections.OrderedDict()
+        self._read_ahead_states = {}
 
     def _CacheAttributeContainerByIndex(self, attribute_container, index):
         """Caches a specific attribute container.
@@ -269,3 +650,121 @@ class AttributeContainerStoreWithReadCache(AttributeContainerStore):
         if attribute_container:
             self._attribute_container_cache.move_to_end(lookup_key, last=False)
         return attribute_container
+
+    def _GetReadAheadIndexes(self, container_type, index, is_cached=False):
+        """Determines the indexes of attribute containers to read ahead.
+
+        Sequential or strided access is detected when consecutive accesses of
+        a specific type of attribute containers have the same positive stride.
+        The number of attribute containers to read ahead is doubled when all
+        attribute containers that were read ahead were accessed and halved
+        when less than half of them were accessed.
+
+        When a read-ahead window is closed the number of attribute containers
+        that were read ahead and accessed are sampled by the storage profiler
+        with the profile name "read_ahead", where the data size represents
+        the number of attribute containers that were read ahead and the
+        compressed data size the number of these that were accessed. The
+        attribute container being accessed when reading ahead is not counted.
+
+        Args:
+          container_type (str): attribute container type.
+          index (int): index of the attribute container being accessed.
+          is_cached (Optional[bool]): True if the attribute container being
+              accessed is cached, in which case the access is tracked but no
+              attribute containers are read ahead.
+
+        Returns:
+          list[int]: indexes of the attribute containers to read ahead, starting
+              with the index of the attribute container being accessed, or an
+              empty list if no attribute containers should be read ahead.
+        """
+        read_ahead_state = self._read_ahead_states.get(container_type)
+        if not read_ahead_state:
+            read_ahead_state = AttributeContainerReadAhead(
+                self._MINIMUM_READ_AHEAD_WINDOW_SIZE
+            )
+            self._read_ahead_states[container_type] = read_ahead_state
+
+        stride = None
+        if read_ahead_state.last_index is not None:
+            stride = index - read_ahead_state.last_index
+
+        read_ahead_state.last_index = index
+
+        if read_ahead_state.IsInWindow(index):
+            read_ahead_state.number_of_hits += 1
+            read_ahead_state.total_number_of_hits += 1
+            return []
+
+        window_size = read_ahead_state.window_size
+
+        if read_ahead_state.window_start is not None:
+            number_of_containers = (
+                read_ahead_state.window_end - read_ahead_state.window_start
+            ) // read_ahead_state.stride
+
+            if self._storage_profiler:
+                self._storage_profiler.Sample(
+                    "read_ahead",
+                    "read",
+                    container_type,
+                    number_of_containers - 1,
+                    read_ahead_state.number_of_hits - 1,
+                )
+
+            if read_ahead_state.number_of_hits >= number_of_containers:
+                window_size = min(window_size * 2, self._MAXIMUM_READ_AHEAD_WINDOW_SIZE)
+            elif read_ahead_state.number_of_hits * 2 < number_of_containers:
+                window_size = max(
+                    window_size // 2, self._MINIMUM_READ_AHEAD_WINDOW_SIZE
+                )
+
+            read_ahead_state.number_of_hits = 0
+            read_ahead_state.window_end = None
+            read_ahead_state.window_size = window_size
+            read_ahead_state.window_start = None
+
+        if stride is not None and stride > 0 and stride == read_ahead_state.stride:
+            read_ahead_state.run_length += 1
+        else:
+            read_ahead_state.run_length = 0
+            read_ahead_state.stride = stride
+
+        if is_cached or read_ahead_state.run_length < 1:
+            return []
+
+        last_index = min(
+            index + (read_ahead_state.stride * window_size),
+            self._attribute_container_sequence_numbers[container_type],
+        )
+        indexes = list(range(index, last_index, read_ahead_state.stride))
+        if len(indexes) <= 1:
+            return []
+
+        read_ahead_state.number_of_hits = 1
+        read_ahead_state.total_number_of_containers += len(indexes) - 1
+        read_ahead_state.window_end = index + (read_ahead_state.stride * len(indexes))
+        read_ahead_state.window_start = index
+
+        return indexes
+
+    def GetReadAheadHitRate(self, container_type):
+        """Retrieves the hit rate of reading ahead attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Returns:
+          float: fraction of the attribute containers that were read ahead and
+              accessed afterwards, or None if no attribute containers of the
+              type were read ahead.
+        """
+        read_ahead_state = self._read_ahead_states.get(container_type)
+        if not read_ahead_state or not read_ahead_state.total_number_of_containers:
+            return None
+
+        return (
+            read_ahead_state.total_number_of_hits
+            / read_ahead_state.total_number_of_containers
+        )
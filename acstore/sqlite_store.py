@@ -1,29 +1,228 @@
 """SQLite-based attribute container store."""
 
 import ast
+import collections
 import itertools
 import json
 import os
 import pathlib
+import queue
+import re
 import sqlite3
+import sys
+import threading
+import time
 
 from acstore import interface
 from acstore.containers import interface as containers_interface
+from acstore.helpers import filter_predicate
 from acstore.helpers import schema as schema_helper
 
 
 class PythonAST2SQLHelper:
-    """Converts Python AST to SQL."""
+    """Converts Python AST to SQL.
+
+    The SQL expression has the semantics of the filter expression evaluated by
+    AttributeContainer.MatchesExpression, where a filter expression that fails
+    to evaluate, such as when it refers to an attribute that is not set, does
+    not match. The SQL expression results in NULL if the filter expression
+    fails to evaluate. Filter expressions of which the SQL semantics differ,
+    such as comparisons of values of different types, are not converted.
+    """
 
     _BOOLEAN_OPERATORS = {ast.And: " AND ", ast.Or: " OR "}
 
-    _COMPARE_OPERATORS = {ast.Eq: " = ", ast.NotEq: " <> "}
+    _COMPARE_OPERATORS = {
+        ast.Eq: " = ",
+        ast.Gt: " > ",
+        ast.GtE: " >= ",
+        ast.Lt: " < ",
+        ast.LtE: " <= ",
+        ast.NotEq: " <> ",
+    }
+
+    # Regular expression of the string and number constants in a filter
+    # expression. Strings with a prefix, such as r"\d", are not matched.
+    # Number constants are only matched if they are valid Python literals,
+    # such as "1_000" but not "01" or "1__0", since a filter expression of
+    # which the shape is cached is not parsed.
+    _CONSTANT_RE = re.compile(
+        r"(?<![\w.])(?:"
+        r"\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|"
+        r"(?:[0-9](?:_?[0-9])*)?\.[0-9](?:_?[0-9])*(?:[eE][-+]?[0-9](?:_?[0-9])*)?|"
+        r"[0-9](?:_?[0-9])*\.(?:[eE][-+]?[0-9](?:_?[0-9])*)?|"
+        r"[0-9](?:_?[0-9])*[eE][-+]?[0-9](?:_?[0-9])*|"
+        r"[1-9](?:_?[0-9])*|0(?:_?0)*"
+        r")(?![\w.\"'])"
+    )
+
+    # Maximum number of cached compiled filter expressions.
+    _MAXIMUM_CACHED_EXPRESSIONS = 256
+
+    # Range of the integer values supported by SQLite.
+    _MAXIMUM_INTEGER = 2**63 - 1
+    _MINIMUM_INTEGER = -(2**63)
+
+    # JSON types of the values that can be compared with number and string
+    # values, where JSON true and false correspond to Python True and False.
+    _JSON_TYPES = {
+        "number": "'integer', 'real', 'true', 'false'",
+        "string": "'text'",
+    }
+
+    _SEQUENCE_TYPES = (ast.List, ast.Set, ast.Tuple)
+
+    _UNARY_OPERATORS = {ast.Not: "NOT ", ast.USub: "-"}
+
+    def __init__(
+        self,
+        json_attribute_names=None,
+        json_value_types=None,
+        number_attribute_names=None,
+        string_attribute_names=None,
+    ):
+        """Initializes a Python AST to SQL helper.
+
+        Attributes of which the names are not provided are not converted.
+
+        Args:
+          json_attribute_names (Optional[Iterable[str]]): names of the attributes
+              of which the values are stored as JSON.
+          json_value_types (Optional[dict[str, str]]): types of the runtime
+              values, of which the structure corresponds to the JSON values,
+              per name of an attribute of which the values are stored as JSON.
+              The type can be "dict", "list" or "object", as defined by
+              AttributeSerializer.JSON_VALUE_TYPE. Only attribute values of
+              which the type is provided are converted.
+          number_attribute_names (Optional[Iterable[str]]): names of the
+              attributes of which the values are numbers or booleans.
+          string_attribute_names (Optional[Iterable[str]]): names of the
+              attributes of which the values are strings.
+        """
+        super().__init__()
+        self._compiled_expressions = collections.OrderedDict()
+        self._has_json_values = False
+        self._json_attribute_names = frozenset(json_attribute_names or [])
+        self._json_value_types = dict(json_value_types or {})
+        self._number_attribute_names = frozenset(number_attribute_names or [])
+        self._parameters = None
+        self._string_attribute_names = frozenset(string_attribute_names or [])
+
+    def _CompileExpression(self, expression):
+        """Compiles a filter expression into a parameterized SQL expression.
+
+        Args:
+          expression (str): filter expression.
+
+        Returns:
+          tuple[str, list[object], function]: SQL expression or None, the values
+              of its parameters and the predicate of the residual expression or
+              None.
+
+        Raises:
+          SyntaxError: if the filter expression is not valid.
+        """
+        expression_ast = ast.parse(expression, mode="eval")
+
+        conjuncts = [expression_ast.body]
+        if isinstance(expression_ast.body, ast.BoolOp) and isinstance(
+            expression_ast.body.op, ast.And
+        ):
+            conjuncts = expression_ast.body.values
+
+        residual_conjuncts = []
+        sql_conjuncts = []
+
+        try:
+            for conjunct in conjuncts:
+                self._has_json_values = False
+                self._parameters = []
+                try:
+                    # A conjunct that fails to evaluate does not need to be
+                    # distinguished from one that does not hold.
+                    sql_conjunct = self._ConvertCondition(conjunct, exact=False)
+                except TypeError:
+                    residual_conjuncts.append(conjunct)
+                    continue
+
+                if isinstance(conjunct, ast.BoolOp):
+                    sql_conjunct = f"({sql_conjunct:s})"
+                sql_conjuncts.append(
+                    (self._has_json_values, sql_conjunct, self._parameters)
+                )
 
-    def _ConvertBoolOperation(self, ast_node):
+        finally:
+            self._has_json_values = False
+            self._parameters = None
+
+        # SQLite evaluates the conjuncts in order, therefore the more expensive
+        # conjuncts with JSON values are evaluated last.
+        sql_conjuncts.sort(key=lambda sql_conjunct: sql_conjunct[0])
+
+        sql_expression = (
+            " AND ".join([sql_conjunct for _, sql_conjunct, _ in sql_conjuncts]) or None
+        )
+        parameters = [
+            parameter
+            for _, _, conjunct_parameters in sql_conjuncts
+            for parameter in conjunct_parameters
+        ]
+
+        residual_expression = None
+        if residual_conjuncts:
+            if len(residual_conjuncts) == 1:
+                residual_ast = ast.Expression(body=residual_conjuncts[0])
+            else:
+                residual_ast = ast.Expression(
+                    body=ast.BoolOp(op=ast.And(), values=residual_conjuncts)
+                )
+            residual_expression = (
+                filter_predicate.FilterPredicateHelper.CompilePredicateFromAST(
+                    residual_ast
+                )
+            )
+
+        return sql_expression, parameters, residual_expression
+
+    def _CombineConditions(self, operator_type, sql_conditions):
+        """Combines conditions with a boolean operator.
+
+        Python stops evaluating a boolean operation at the first value that
+        determines its result, hence a value that fails to evaluate only causes
+        the boolean operation to fail if it is evaluated, unlike a NULL value in
+        SQL, for example "NULL OR 1" results in 1.
+
+        Args:
+          operator_type (type): type of the AST boolean operator node, either
+              ast.And or ast.Or.
+          sql_conditions (list[str]): SQL statements of the conditions.
+
+        Returns:
+          str: SQL statement.
+        """
+        sql_statement = sql_conditions[-1]
+        for sql_condition in reversed(sql_conditions[:-1]):
+            if operator_type == ast.And:
+                sql_statement = (
+                    f"CASE ({sql_condition:s}) <> 0 WHEN 1 THEN {sql_statement:s} "
+                    f"WHEN 0 THEN 0 END"
+                )
+            else:
+                sql_statement = (
+                    f"CASE ({sql_condition:s}) <> 0 WHEN 1 THEN 1 "
+                    f"WHEN 0 THEN {sql_statement:s} END"
+                )
+
+        return sql_statement
+
+    def _ConvertBoolOperation(self, ast_node, exact=True):
         """Converts an AST boolean operation node to SQL.
 
         Args:
           ast_node (ast.Node): AST node.
+          exact (Optional[bool]): True if the SQL statement should result in NULL
+              if the boolean operation fails to evaluate, False if it only should
+              result in true if the boolean operation holds.
 
         Returns:
           str: SQL statement.
@@ -31,17 +230,46 @@ class PythonAST2SQLHelper:
         Raises:
           TypeError: if the type of node is not supported.
         """
-        sql_operator = self._BOOLEAN_OPERATORS.get(type(ast_node.op))
+        operator_type = type(ast_node.op)
+        sql_operator = self._BOOLEAN_OPERATORS.get(operator_type)
         if sql_operator is None:
             raise TypeError(ast_node)
 
-        return sql_operator.join([self.ConvertNode(value) for value in ast_node.values])
-
-    def _ConvertCompare(self, ast_node):
+        # Values that fail to evaluate do not need to be distinguished from
+        # values that do not hold if they are combined with "and" or if they all
+        # fail to evaluate when the same attribute is not set.
+        if (
+            operator_type == ast.And and not exact
+        ) or self._IsSingleAttributeComparison(ast_node.values):
+            sql_conditions = []
+            for value in ast_node.values:
+                sql_condition = self._ConvertCondition(value, exact=exact)
+                if isinstance(value, ast.BoolOp):
+                    sql_condition = f"({sql_condition:s})"
+                sql_conditions.append(sql_condition)
+
+            return sql_operator.join(sql_conditions)
+
+        # Only the result of the last value is the result of the boolean
+        # operation.
+        sql_conditions = [
+            self._ConvertCondition(value) for value in ast_node.values[:-1]
+        ]
+        sql_conditions.append(self._ConvertCondition(ast_node.values[-1], exact=exact))
+
+        return self._CombineConditions(operator_type, sql_conditions)
+
+    def _ConvertCompare(self, ast_node, exact=True):
         """Converts an AST compare node to SQL.
 
+        Chained comparisons, such as "1 < a < 5", are converted into
+        comparisons that are combined with AND.
+
         Args:
           ast_node (ast.Node): AST node.
+          exact (Optional[bool]): True if the SQL statement should result in NULL
+              if the comparison fails to evaluate, False if it only should result
+              in true if the comparison holds.
 
         Returns:
           str: SQL statement.
@@ -49,32 +277,690 @@ class PythonAST2SQLHelper:
         Raises:
           TypeError: if the type of node is not supported.
         """
-        if len(ast_node.ops) != 1:
-            raise TypeError(ast_node)
+        sql_comparisons = []
+
+        left_node = ast_node.left
+        for operator_node, right_node in zip(ast_node.ops, ast_node.comparators):
+            sql_comparisons.append(
+                self._ConvertComparison(left_node, operator_node, right_node)
+            )
+            left_node = right_node
+
+        if not exact or self._IsSingleAttributeComparison([ast_node]):
+            return " AND ".join(sql_comparisons)
+
+        return self._CombineConditions(ast.And, sql_comparisons)
+
+    def _ConvertCompareJSONValue(self, left_node, operator_node, right_node):
+        """Converts a comparison of a JSON value with a constant to SQL.
 
-        sql_operator = self._COMPARE_OPERATORS.get(type(ast_node.ops[0]))
+        The JSON type of the value is compared as well, since values of
+        different types are compared differently in SQL. In Python values of
+        different types are not equal and cannot be ordered.
+
+        Args:
+          left_node (ast.Node): AST node of the left operand.
+          operator_node (ast.Node): AST node of the comparison operator.
+          right_node (ast.Node): AST node of the right operand.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        operator_type = type(operator_node)
+
+        if self._GetValueType(left_node) == "json":
+            json_node, value_node = left_node, right_node
+        else:
+            json_node, value_node = right_node, left_node
+
+        # The value is a constant, such as "1" or "-1", since the comparison
+        # of a JSON null value with a value that is not set would hold.
+        value_type = self._GetValueType(value_node)
+        if value_type not in self._JSON_TYPES or any(
+            isinstance(node, ast.Name) for node in ast.walk(value_node)
+        ):
+            raise TypeError(json_node)
+
+        column_name, json_path = self._GetJSONPath(json_node)
+        sql_json_type = f"json_type({column_name:s}, '{json_path:s}')"
+
+        sql_operands = []
+        for node in (left_node, right_node):
+            if node is json_node:
+                sql_operands.append(self._ConvertJSONValue(node))
+            else:
+                sql_operands.append(self._ConvertOperand(node))
+
+        sql_comparison = self._COMPARE_OPERATORS[operator_type].join(sql_operands)
+
+        # A JSON null value is None, which is not equal to a number or string.
+        if operator_type == ast.Eq:
+            if value_type == "string":
+                return f"({sql_comparison:s} AND {sql_json_type:s} = 'text')"
+            return f"({sql_comparison:s} AND {sql_json_type:s} <> 'null')"
+
+        if operator_type == ast.NotEq:
+            if value_type == "string":
+                return f"({sql_comparison:s} OR {sql_json_type:s} <> 'text')"
+            return f"({sql_comparison:s} OR {sql_json_type:s} = 'null')"
+
+        json_types = self._JSON_TYPES[value_type]
+        return (
+            f"CASE WHEN {sql_json_type:s} IN ({json_types:s}) "
+            f"THEN {sql_comparison:s} END"
+        )
+
+    def _ConvertCompareNone(self, left_node, operator_node, right_node):
+        """Converts a comparison with None to SQL.
+
+        Attributes that are set to None are considered not set, hence
+        the comparison fails to evaluate if the attribute is not set and
+        otherwise the value is not None.
+
+        Args:
+          left_node (ast.Node): AST node of the left operand.
+          operator_node (ast.Node): AST node of the comparison operator.
+          right_node (ast.Node): AST node of the right operand.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        operator_type = type(operator_node)
+        if operator_type not in (ast.Eq, ast.Is, ast.IsNot, ast.NotEq):
+            raise TypeError(operator_node)
+
+        value_node = right_node if self._IsNoneConstant(left_node) else left_node
+        value_type = self._GetValueType(value_node)
+        is_equal = operator_type in (ast.Eq, ast.Is)
+
+        if value_type == "json":
+            column_name, json_path = self._GetJSONPath(value_node)
+            sql_operator = " = " if is_equal else " <> "
+            return f"json_type({column_name:s}, '{json_path:s}'){sql_operator:s}'null'"
+
+        if value_type not in ("number", "string"):
+            raise TypeError(value_node)
+
+        sql_value = self._ConvertOperand(value_node)
+        sql_result = "0" if is_equal else "1"
+        return f"CASE WHEN ({sql_value:s}) IS NOT NULL THEN {sql_result:s} END"
+
+    def _ConvertComparison(self, left_node, operator_node, right_node):
+        """Converts a single comparison of a compare node to SQL.
+
+        Args:
+          left_node (ast.Node): AST node of the left operand.
+          operator_node (ast.Node): AST node of the comparison operator.
+          right_node (ast.Node): AST node of the right operand.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        operator_type = type(operator_node)
+
+        if operator_type in (ast.In, ast.NotIn):
+            return self._ConvertContains(
+                left_node, right_node, negate=operator_type == ast.NotIn
+            )
+
+        if self._IsNoneConstant(left_node) or self._IsNoneConstant(right_node):
+            return self._ConvertCompareNone(left_node, operator_node, right_node)
+
+        sql_operator = self._COMPARE_OPERATORS.get(operator_type)
         if sql_operator is None:
+            raise TypeError(operator_node)
+
+        left_type = self._GetValueType(left_node)
+        right_type = self._GetValueType(right_node)
+        if "json" in (left_type, right_type):
+            return self._ConvertCompareJSONValue(left_node, operator_node, right_node)
+
+        # Values of different types are compared differently in SQL.
+        if left_type is None or left_type != right_type:
+            raise TypeError(operator_node)
+
+        sql_left = self._ConvertOperand(left_node)
+        sql_right = self._ConvertOperand(right_node)
+        return sql_operator.join([sql_left, sql_right])
+
+    def _ConvertCondition(self, ast_node, exact=True):
+        """Converts an AST node that is evaluated as a condition to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+          exact (Optional[bool]): True if the SQL statement should result in NULL
+              if the condition fails to evaluate, False if it only should result
+              in true if the condition holds.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        if isinstance(ast_node, ast.BoolOp):
+            return self._ConvertBoolOperation(ast_node, exact=exact)
+
+        if isinstance(ast_node, ast.Compare):
+            return self._ConvertCompare(ast_node, exact=exact)
+
+        # The truth value of strings and JSON values differs in SQL.
+        if self._GetValueType(ast_node) != "number":
             raise TypeError(ast_node)
 
-        if len(ast_node.comparators) != 1:
+        return self.ConvertNode(ast_node)
+
+    def _ConvertConstant(self, ast_node):
+        """Converts an AST constant node to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        value = ast_node.value
+        if value is None:
+            return "NULL"
+
+        if isinstance(value, bool):
+            return "1" if value else "0"
+
+        if not isinstance(value, (float, int, str)):
+            raise TypeError(ast_node)
+
+        # Integers that SQLite cannot represent are evaluated by the residual
+        # expression.
+        if isinstance(value, int) and not (
+            self._MINIMUM_INTEGER <= value <= self._MAXIMUM_INTEGER
+        ):
             raise TypeError(ast_node)
 
-        sql_left = self.ConvertNode(ast_node.left)
-        sql_right = self.ConvertNode(ast_node.comparators[0])
+        if self._parameters is not None:
+            self._parameters.append(value)
+            return "?"
 
-        return sql_operator.join([sql_left, sql_right])
+        if isinstance(value, str):
+            value = value.replace("'", "''")
+            return f"'{value:s}'"
+
+        return str(value)
+
+    def _ConvertContains(self, left_node, right_node, negate=False):
+        """Converts an "in" or "not in" comparison to SQL.
+
+        A JSON value is compared with the values of a JSON array, the keys of
+        a JSON object or the substrings of a JSON string, corresponding to
+        the "in" operator of its runtime value.
+
+        Args:
+          left_node (ast.Node): AST node of the left operand.
+          right_node (ast.Node): AST node of the right operand.
+          negate (Optional[bool]): True if the comparison is "not in".
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        left_type = self._GetValueType(left_node)
+        if left_type not in ("number", "string"):
+            raise TypeError(left_node)
+
+        if isinstance(right_node, self._SEQUENCE_TYPES):
+            if not right_node.elts:
+                raise TypeError(right_node)
+
+            for value_node in right_node.elts:
+                if (
+                    not isinstance(value_node, ast.Constant)
+                    or self._GetValueType(value_node) != left_type
+                ):
+                    raise TypeError(value_node)
+
+            sql_left = self._ConvertOperand(left_node)
+            sql_values = ", ".join(
+                [self.ConvertNode(value_node) for value_node in right_node.elts]
+            )
+            sql_operator = " NOT IN " if negate else " IN "
+            return f"{sql_left:s}{sql_operator:s}({sql_values:s})"
+
+        if not isinstance(left_node, ast.Constant):
+            raise TypeError(left_node)
+
+        # An object value does not support "in".
+        if (
+            isinstance(right_node, ast.Name)
+            and self._json_value_types.get(right_node.id) == "object"
+        ):
+            raise TypeError(right_node)
+
+        column_name, json_path = self._GetJSONPath(right_node)
+        sql_json_path = f"{column_name:s}, '{json_path:s}'"
+
+        # Other JSON types, such as numbers, fail to evaluate.
+        sql_cases = [
+            (
+                f"WHEN 'array' THEN {self.ConvertNode(left_node):s} IN (SELECT value "
+                f"FROM json_each({sql_json_path:s}) "
+                f"WHERE type NOT IN ('array', 'object', 'null'))"
+            ),
+            (
+                f"WHEN 'object' THEN {self.ConvertNode(left_node):s} IN (SELECT key "
+                f"FROM json_each({sql_json_path:s}))"
+            ),
+        ]
+        if left_type == "string":
+            sql_cases.append(
+                f"WHEN 'text' THEN instr(json_extract({sql_json_path:s}), "
+                f"{self.ConvertNode(left_node):s}) > 0"
+            )
+
+        sql_cases = " ".join(sql_cases)
+        sql_statement = f"CASE json_type({sql_json_path:s}) {sql_cases:s} END"
+        if negate:
+            sql_statement = f"NOT ({sql_statement:s})"
+
+        return sql_statement
+
+    def _ConvertJSONValue(self, ast_node):
+        """Converts an AST attribute or subscript node of a JSON value to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        column_name, json_path = self._GetJSONPath(ast_node)
+        return f"json_extract({column_name:s}, '{json_path:s}')"
+
+    def _ConvertName(self, ast_node):
+        """Converts an AST name node to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        if self._GetValueType(ast_node) not in ("number", "string"):
+            raise TypeError(ast_node)
+
+        return ast_node.id
+
+    def _ConvertOperand(self, ast_node):
+        """Converts an AST node that is the operand of a comparison to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        sql_operand = self.ConvertNode(ast_node)
+
+        # SQL operators, such as NOT, have a different precedence than
+        # comparison operators.
+        if isinstance(ast_node, (ast.BoolOp, ast.Compare)) or (
+            isinstance(ast_node, ast.UnaryOp) and isinstance(ast_node.op, ast.Not)
+        ):
+            sql_operand = f"({sql_operand:s})"
+
+        return sql_operand
+
+    def _ConvertUnaryOperation(self, ast_node):
+        """Converts an AST unary operation node to SQL.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: SQL statement.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        if isinstance(ast_node.op, ast.Not):
+            sql_operand = self._ConvertCondition(ast_node.operand)
+
+        elif isinstance(ast_node.op, ast.USub):
+            if self._GetValueType(ast_node.operand) != "number":
+                raise TypeError(ast_node)
+
+            sql_operand = self.ConvertNode(ast_node.operand)
+
+        else:
+            raise TypeError(ast_node)
+
+        sql_operator = self._UNARY_OPERATORS[type(ast_node.op)]
+        return f"{sql_operator:s}({sql_operand:s})"
+
+    def _GetExpressionShape(self, expression):
+        """Determines the shape of a filter expression.
+
+        Args:
+          expression (str): filter expression.
+
+        Returns:
+          tuple[str, list[object]]: shape of the filter expression, which is
+              the expression with its string and number constants replaced by
+              "?", and the values of these constants, or None and None if
+              a constant is not valid or is an integer that SQLite cannot
+              represent.
+        """
+        shape_segments = []
+        values = []
+
+        offset = 0
+        for match in self._CONSTANT_RE.finditer(expression):
+            constant = match.group(0)
+            try:
+                if constant[0] in "\"'":
+                    if "\\" in constant:
+                        value = ast.literal_eval(constant)
+                    else:
+                        value = constant[1:-1]
+                elif "." in constant or "e" in constant or "E" in constant:
+                    value = float(constant)
+                else:
+                    value = int(constant)
+                    # Integers that SQLite cannot represent are not converted
+                    # to parameters.
+                    if not self._MINIMUM_INTEGER <= value <= self._MAXIMUM_INTEGER:
+                        return None, None
+
+            except (SyntaxError, ValueError):
+                return None, None
+
+            start_offset, end_offset = match.span()
+            shape_segments.extend([expression[offset:start_offset], "?"])
+            values.append(value)
+            offset = end_offset
+
+        shape_segments.append(expression[offset:])
+
+        return "".join(shape_segments), values
+
+    def _GetJSONPath(self, ast_node):
+        """Determines the JSON path of an AST node that refers to a JSON value.
+
+        The JSON path is only determined if it corresponds to the access of
+        the runtime value, which depends on the type of the runtime value of
+        the attribute. An attribute with a list value supports an integer
+        subscript, such as "items[0]", one with a dictionary value a string
+        subscript, such as "values['key']" and one with an object value
+        an attribute access, such as "path_spec.location". The nested values
+        correspond to their JSON values and only support string subscripts,
+        since an integer subscript of a string value is a substring.
+
+        Args:
+          ast_node (ast.Node): AST node, such as "items[0]" or "path_spec.location",
+              that refers to an attribute of which the value is stored as JSON.
+
+        Returns:
+          tuple[str, str]: name of the column and JSON path of the value.
+
+        Raises:
+          TypeError: if the type of node is not supported.
+        """
+        path_segments = []
+
+        node = ast_node
+        while isinstance(node, (ast.Attribute, ast.Subscript)):
+            if isinstance(node, ast.Attribute):
+                key = node.attr
+            elif isinstance(node.slice, ast.Constant):
+                key = node.slice.value
+            else:
+                raise TypeError(ast_node)
+
+            if isinstance(key, bool):
+                raise TypeError(ast_node)
+
+            if isinstance(node, ast.Attribute):
+                value_type = "object"
+                path_segment = f'."{key:s}"'
+            elif isinstance(key, int) and key >= 0:
+                value_type = "list"
+                path_segment = f"[{key:d}]"
+            elif isinstance(key, str):
+                value_type = "dict"
+                path_segment = f'."{key:s}"'
+            else:
+                raise TypeError(ast_node)
+
+            if isinstance(key, str) and set(key).intersection("\"'"):
+                raise TypeError(ast_node)
+
+            path_segments.append((value_type, path_segment))
+
+            node = node.value
+
+        if not isinstance(node, ast.Name) or node.id not in self._json_attribute_names:
+            raise TypeError(ast_node)
+
+        json_value_type = self._json_value_types.get(node.id)
+        if not json_value_type:
+            raise TypeError(ast_node)
+
+        path_segments.reverse()
+        if path_segments:
+            value_types = [value_type for value_type, _ in path_segments]
+            if value_types[0] != json_value_type or set(value_types[1:]) - {"dict"}:
+                raise TypeError(ast_node)
+
+        self._has_json_values = True
+
+        json_path = "".join([path_segment for _, path_segment in path_segments])
+        return node.id, f"${json_path:s}"
+
+    def _GetValueType(self, ast_node):
+        """Determines the type of the value of an AST node.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          str: "json", "number" or "string", or None if the type cannot be
+              determined or is not supported.
+        """
+        if isinstance(ast_node, ast.Constant):
+            if isinstance(ast_node.value, (bool, float)):
+                return "number"
+            if isinstance(ast_node.value, int):
+                if self._MINIMUM_INTEGER <= ast_node.value <= self._MAXIMUM_INTEGER:
+                    return "number"
+                return None
+            if isinstance(ast_node.value, str):
+                return "string"
+            return None
+
+        if isinstance(ast_node, ast.Name):
+            if ast_node.id in self._json_attribute_names:
+                return "json"
+            if ast_node.id in self._number_attribute_names:
+                return "number"
+            if ast_node.id in self._string_attribute_names:
+                return "string"
+            return None
+
+        if isinstance(ast_node, (ast.Attribute, ast.Subscript)):
+            try:
+                self._GetJSONPath(ast_node)
+            except TypeError:
+                return None
+            return "json"
+
+        if isinstance(ast_node, ast.UnaryOp):
+            if isinstance(ast_node.op, ast.Not):
+                return "number"
+            if isinstance(ast_node.op, ast.USub):
+                if self._GetValueType(ast_node.operand) == "number":
+                    return "number"
+            return None
+
+        if isinstance(ast_node, ast.Compare):
+            return "number"
+
+        return None
+
+    def _IsSingleAttributeComparison(self, ast_nodes):
+        """Determines if AST nodes are comparisons of the same attribute.
+
+        Comparisons of an attribute with constants all fail to evaluate if
+        the attribute is not set, and otherwise evaluate.
+
+        Args:
+          ast_nodes (list[ast.Node]): AST nodes.
+
+        Returns:
+          bool: True if the AST nodes are comparisons that all refer to the same
+              attribute, of which the value is not stored as JSON, and no other
+              attributes.
+        """
+        attribute_names = set()
+        for ast_node in ast_nodes:
+            if not isinstance(ast_node, ast.Compare):
+                return False
+
+            has_attribute = False
+            for node in ast.walk(ast_node):
+                if isinstance(node, (ast.Attribute, ast.Subscript)):
+                    return False
+
+                if isinstance(node, ast.Name):
+                    if self._GetValueType(node) not in ("number", "string"):
+                        return False
+
+                    attribute_names.add(node.id)
+                    has_attribute = True
+
+            if not has_attribute:
+                return False
+
+        return len(attribute_names) == 1
+
+    def _IsNoneConstant(self, ast_node):
+        """Determines if an AST node is the None constant.
+
+        Args:
+          ast_node (ast.Node): AST node.
+
+        Returns:
+          bool: True if the AST node is the None constant.
+        """
+        return isinstance(ast_node, ast.Constant) and ast_node.value is None
 
     _CONVERT_METHODS = {
+        ast.Attribute: _ConvertJSONValue,
         ast.BoolOp: _ConvertBoolOperation,
         ast.Compare: _ConvertCompare,
-        ast.Constant: lambda _, ast_node: (
-            f'"{ast_node.value:s}"'
-            if isinstance(ast_node.value, str)
-            else str(ast_node.value)
-        ),
-        ast.Name: lambda _, ast_node: ast_node.id,
+        ast.Constant: _ConvertConstant,
+        ast.Name: _ConvertName,
+        ast.Subscript: _ConvertJSONValue,
+        ast.UnaryOp: _ConvertUnaryOperation,
     }
 
+    def CompileExpression(self, expression):
+        """Compiles a filter expression into a parameterized SQL expression.
+
+        The conjuncts of the top-level "and" of the filter expression that
+        can be converted to SQL are combined into the SQL expression, the other
+        conjuncts into a residual expression, that is to be evaluated on
+        the attribute containers that match the SQL expression.
+
+        The compiled filter expressions are cached. Filter expressions that are
+        completely converted to SQL are cached by their shape, so that filter
+        expressions that only differ in the values of their string and number
+        constants are parsed and converted once, and result in the same SQL
+        statement. Since the conversion depends on the types of the constants,
+        these are part of the shape.
+
+        Args:
+          expression (str): filter expression.
+
+        Returns:
+          tuple[str, list[object], function]: SQL expression, with a "?"
+              parameter for every string and number constant, or None if no part
+              of the filter expression can be converted to SQL, the values of
+              the parameters and the predicate of the residual expression or
+              None if the filter expression is completely converted to SQL.
+
+        Raises:
+          SyntaxError: if the filter expression is not valid.
+        """
+        shape, values = self._GetExpressionShape(expression)
+        if shape is not None:
+            shape = (shape, tuple(type(value) for value in values))
+
+        lookup_key = shape
+        compiled_expression = None
+        if shape is not None:
+            compiled_expression = self._compiled_expressions.get(shape)
+
+        if compiled_expression is None:
+            lookup_key = expression
+            compiled_expression = self._compiled_expressions.get(expression)
+
+        if compiled_expression is not None:
+            self._compiled_expressions.move_to_end(lookup_key, last=False)
+
+            sql_expression, parameters, residual_expression = compiled_expression
+            if parameters is None:
+                parameters = values
+
+            return sql_expression, parameters, residual_expression
+
+        sql_expression, parameters, residual_expression = self._CompileExpression(
+            expression
+        )
+
+        # The compiled filter expression is only cached by shape if it has no
+        # residual expression and the constants of the shape are the parameters,
+        # which is not the case for constants such as "0x10".
+        if (
+            shape is not None
+            and residual_expression is None
+            and [(type(value), value) for value in values]
+            == [(type(value), value) for value in parameters]
+        ):
+            lookup_key = shape
+            compiled_expression = (sql_expression, None, None)
+        else:
+            lookup_key = expression
+            compiled_expression = (sql_expression, parameters, residual_expression)
+
+        if len(self._compiled_expressions) >= self._MAXIMUM_CACHED_EXPRESSIONS:
+            self._compiled_expressions.popitem(last=True)
+
+        self._compiled_expressions[lookup_key] = compiled_expression
+        self._compiled_expressions.move_to_end(lookup_key, last=False)
+
+        return sql_expression, parameters, residual_expression
+
     def ConvertNode(self, ast_node):
         """Converts an AST node to SQL.
 
@@ -104,6 +990,35 @@ class SQLiteSchemaHelper:
         "timestamp": "BIGINT",
     }
 
+    @staticmethod
+    def _DeserializeAttributeContainerIdentifier(value):
+        """Deserializes an attribute container identifier.
+
+        Args:
+          value (str): serialized value.
+
+        Returns:
+          AttributeContainerIdentifier: runtime value.
+        """
+        identifier = containers_interface.AttributeContainerIdentifier()
+        identifier.CopyFromString(value)
+        return identifier
+
+    @staticmethod
+    def _SerializeAttributeContainerIdentifier(value):
+        """Serializes an attribute container identifier.
+
+        Args:
+          value (AttributeContainerIdentifier|str): runtime value.
+
+        Returns:
+          str: serialized value.
+        """
+        if isinstance(value, containers_interface.AttributeContainerIdentifier):
+            value = value.CopyToString()
+
+        return value
+
     def GetStorageDataType(self, data_type):
         """Retrieves the storage data type.
 
@@ -123,71 +1038,451 @@ class SQLiteSchemaHelper:
           value (object): serialized value.
 
         Returns:
-          object: runtime value.
-
-        Raises:
-          OSError: if the schema data type is not supported.
+          object: runtime value.
+
+        Raises:
+          OSError: if the schema data type is not supported.
+        """
+        if not schema_helper.SchemaHelper.HasDataType(data_type):
+            raise OSError(f"Unsupported data type: {data_type:s}")
+
+        if value is not None:
+            if data_type == "AttributeContainerIdentifier":
+                identifier = containers_interface.AttributeContainerIdentifier()
+                identifier.CopyFromString(value)
+                value = identifier
+
+            elif data_type == "bool":
+                value = bool(value)
+
+            elif data_type not in self._MAPPINGS:
+                serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+                    data_type, "json"
+                )
+                json_dict = json.loads(value)
+                value = serializer.DeserializeValue(json_dict)
+
+        return value
+
+    def GetDeserializeFunction(self, data_type):
+        """Retrieves the function to deserialize values of a specific data type.
+
+        Args:
+          data_type (str): schema data type.
+
+        Returns:
+          function: function to deserialize a serialized value, that is not None,
+              or None if values of the data type are stored as-is.
+
+        Raises:
+          OSError: if the schema data type is not supported.
+        """
+        if not schema_helper.SchemaHelper.HasDataType(data_type):
+            raise OSError(f"Unsupported data type: {data_type:s}")
+
+        if data_type == "AttributeContainerIdentifier":
+            return self._DeserializeAttributeContainerIdentifier
+
+        if data_type == "bool":
+            return bool
+
+        if data_type in self._MAPPINGS:
+            return None
+
+        serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+            data_type, "json"
+        )
+
+        def _DeserializeJSON(value):
+            """Deserializes a value from JSON.
+
+            Args:
+              value (str): JSON serialized value.
+
+            Returns:
+              object: runtime value.
+            """
+            json_dict = json.loads(value)
+            return serializer.DeserializeValue(json_dict)
+
+        return _DeserializeJSON
+
+    def GetSerializeFunction(self, data_type):
+        """Retrieves the function to serialize values of a specific data type.
+
+        Args:
+          data_type (str): schema data type.
+
+        Returns:
+          function: function to serialize a runtime value, that is not None, or
+              None if values of the data type are stored as-is.
+
+        Raises:
+          OSError: if the schema data type is not supported.
+        """
+        if not schema_helper.SchemaHelper.HasDataType(data_type):
+            raise OSError(f"Unsupported data type: {data_type:s}")
+
+        if data_type == "AttributeContainerIdentifier":
+            return self._SerializeAttributeContainerIdentifier
+
+        if data_type == "bool":
+            return int
+
+        if data_type in self._MAPPINGS:
+            return None
+
+        serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+            data_type, "json"
+        )
+
+        def _SerializeJSON(value):
+            """Serializes a value as JSON.
+
+            Args:
+              value (object): runtime value.
+
+            Returns:
+              str: JSON serialized value.
+            """
+            # JSON will not serialize certain runtime types like set, therefore
+            # these are cast to list first.
+            if isinstance(value, set):
+                value = list(value)
+
+            json_dict = serializer.SerializeValue(value)
+            return json.dumps(json_dict)
+
+        return _SerializeJSON
+
+    def GetJSONValueType(self, data_type):
+        """Retrieves the type of the runtime values of a specific data type.
+
+        Args:
+          data_type (str): schema data type.
+
+        Returns:
+          str: type of the runtime values, if the values of the data type are
+              stored as JSON with the same structure, or None otherwise.
+        """
+        if not self.IsJSONDataType(data_type):
+            return None
+
+        serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
+            data_type, "json"
+        )
+        return getattr(serializer, "JSON_VALUE_TYPE", None)
+
+    def IsJSONDataType(self, data_type):
+        """Determines if values of a specific data type are stored as JSON.
+
+        Args:
+          data_type (str): schema data type.
+
+        Returns:
+          bool: True if values of the data type are stored as JSON.
+        """
+        return (
+            data_type
+            not in (
+                "AttributeContainerIdentifier",
+                "bool",
+            )
+            and data_type not in self._MAPPINGS
+        )
+
+    def SerializeValue(self, data_type, value):
+        """Serializes a value.
+
+        Args:
+          data_type (str): schema data type.
+          value (object): runtime value.
+
+        Returns:
+          object: serialized value.
+
+        Raises:
+          OSError: if the schema data type is not supported.
+        """
+        serialize_function = self.GetSerializeFunction(data_type)
+
+        if value is not None and serialize_function:
+            value = serialize_function(value)
+
+        return value
+
+
+class SQLiteAttributeContainerPlan:
+    """SQLite attribute container plan.
+
+    The plan contains the information to serialize and deserialize attribute
+    containers of a specific type, which is determined once per attribute
+    container type.
+
+    Attributes:
+      column_names (list[str]): names of the columns, sorted by name.
+      container_type (str): attribute container type.
+    """
+
+    def __init__(self, container_type, schema, sqlite_schema_helper):
+        """Initializes a SQLite attribute container plan.
+
+        Args:
+          container_type (str): attribute container type.
+          schema (dict[str, str]): attribute container schema.
+          sqlite_schema_helper (SQLiteSchemaHelper): SQLite schema helper.
+
+        Raises:
+          OSError: if the schema contains an unsupported data type.
+        """
+        super().__init__()
+        self._column_indexes = {}
+        self._deserialize_functions = {}
+        self._insert_queries = {}
+        self._json_column_indexes = set()
+        self._lazy_row_deserializers = {}
+        self._row_deserializers = {}
+        self._serialize_functions = {}
+        self._update_queries = {}
+
+        self.column_names = sorted(schema.keys())
+        self.container_type = container_type
+
+        json_value_types = {}
+        number_attribute_names = []
+        string_attribute_names = []
+
+        for column_index, name in enumerate(self.column_names):
+            self._column_indexes[name] = column_index
+
+            data_type = schema[name]
+            try:
+                serialize_function = sqlite_schema_helper.GetSerializeFunction(
+                    data_type
+                )
+            except OSError as exception:
+                raise OSError(
+                    f"Unsupported attribute container type: {container_type:s} "
+                    f"attribute: {name:s} data type: {data_type:s}"
+                ) from exception
+
+            if serialize_function:
+                self._serialize_functions[column_index] = serialize_function
+
+            deserialize_function = sqlite_schema_helper.GetDeserializeFunction(
+                data_type
+            )
+            if deserialize_function:
+                self._deserialize_functions[column_index] = deserialize_function
+
+            if sqlite_schema_helper.IsJSONDataType(data_type):
+                self._json_column_indexes.add(column_index)
+                json_value_types[name] = sqlite_schema_helper.GetJSONValueType(
+                    data_type
+                )
+            elif sqlite_schema_helper.GetStorageDataType(data_type) == "TEXT":
+                string_attribute_names.append(name)
+            else:
+                number_attribute_names.append(name)
+
+        self._ast_to_sql_helper = PythonAST2SQLHelper(
+            json_attribute_names=[
+                self.column_names[column_index]
+                for column_index in self._json_column_indexes
+            ],
+            json_value_types=json_value_types,
+            number_attribute_names=number_attribute_names,
+            string_attribute_names=string_attribute_names,
+        )
+
+    def CompileFilterExpression(self, filter_expression):
+        """Compiles a filter expression into a parameterized SQL expression.
+
+        Args:
+          filter_expression (str): expression to filter attribute containers by.
+
+        Returns:
+          tuple[str, list[object], function]: SQL expression or None, the values
+              of its parameters and the predicate of the residual expression or
+              None.
+
+        Raises:
+          SyntaxError: if the filter expression is not valid.
+        """
+        return self._ast_to_sql_helper.CompileExpression(filter_expression)
+
+    def GetColumnIndexes(self, column_names):
+        """Retrieves the indexes of specific columns.
+
+        Args:
+          column_names (list[str]): names of the columns.
+
+        Returns:
+          list[int]: indexes of the columns.
+        """
+        return [self._column_indexes[name] for name in column_names]
+
+    def GetInsertQuery(self, number_of_rows):
+        """Retrieves a multi-row INSERT query.
+
+        Args:
+          number_of_rows (int): number of rows to insert with the query.
+
+        Returns:
+          str: INSERT query.
+        """
+        query = self._insert_queries.get(number_of_rows)
+        if not query:
+            column_names_string = ", ".join(self.column_names)
+
+            value_statement = ",".join(["?"] * len(self.column_names))
+            value_statement = f"({value_statement:s})"
+            values_statement = ", ".join([value_statement] * number_of_rows)
+
+            query = (
+                f"INSERT INTO {self.container_type:s} ({column_names_string:s}) "
+                f"VALUES {values_statement:s}"
+            )
+            self._insert_queries[number_of_rows] = query
+
+        return query
+
+    def GetUpdateQuery(self, column_indexes):
+        """Retrieves an UPDATE query.
+
+        Args:
+          column_indexes (tuple[int]): indexes of the columns to update.
+
+        Returns:
+          str: UPDATE query with a parameter for each of the columns followed by
+              a parameter for the identifier.
+        """
+        query = self._update_queries.get(column_indexes)
+        if not query:
+            column_names_string = ", ".join(
+                [
+                    f"{self.column_names[column_index]:s} = ?"
+                    for column_index in column_indexes
+                ]
+            )
+            query = (
+                f"UPDATE {self.container_type:s} SET {column_names_string:s} "
+                f"WHERE _identifier = ?"
+            )
+            self._update_queries[column_indexes] = query
+
+        return query
+
+    def GetLazyRowDeserializers(self, column_names, first_column_index):
+        """Retrieves the deserializers of the values of a row for lazy reading.
+
+        Values of data types that are stored as JSON are deserialized when
+        the corresponding attribute is first accessed, other values are
+        deserialized when the attribute container is created.
+
+        Args:
+          column_names (list[str]): names of the columns selected.
+          first_column_index (int): index of the first column in a row.
+
+        Returns:
+          tuple[tuple[tuple[int, str, function]], tuple[tuple[int, str, function]]]:
+              deserializers of the values to deserialize when the attribute
+              container is created and deserializers of the values to
+              deserialize when first accessed.
         """
-        if not schema_helper.SchemaHelper.HasDataType(data_type):
-            raise OSError(f"Unsupported data type: {data_type:s}")
+        lookup_key = (tuple(column_names), first_column_index)
+        lazy_row_deserializers = self._lazy_row_deserializers.get(lookup_key)
+        if lazy_row_deserializers is None:
+            row_deserializers = self.GetRowDeserializers(
+                column_names, first_column_index
+            )
+            lazy_row_deserializers = (
+                tuple(
+                    row_deserializer
+                    for row_deserializer in row_deserializers
+                    if self._column_indexes[row_deserializer[1]]
+                    not in self._json_column_indexes
+                ),
+                tuple(
+                    row_deserializer
+                    for row_deserializer in row_deserializers
+                    if self._column_indexes[row_deserializer[1]]
+                    in self._json_column_indexes
+                ),
+            )
+            self._lazy_row_deserializers[lookup_key] = lazy_row_deserializers
 
-        if value is not None:
-            if data_type == "AttributeContainerIdentifier":
-                identifier = containers_interface.AttributeContainerIdentifier()
-                identifier.CopyFromString(value)
-                value = identifier
+        return lazy_row_deserializers
 
-            elif data_type == "bool":
-                value = bool(value)
+    def GetRowDeserializers(self, column_names, first_column_index):
+        """Retrieves the deserializers of the values of a row.
 
-            elif data_type not in self._MAPPINGS:
-                serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
-                    data_type, "json"
+        Args:
+          column_names (list[str]): names of the columns selected.
+          first_column_index (int): index of the first column in a row.
+
+        Returns:
+          tuple[tuple[int, str, function]]: index of the value in the row, name
+              of the attribute and the function to deserialize a serialized
+              value, that is not None, or None if the value is stored as-is.
+        """
+        lookup_key = (tuple(column_names), first_column_index)
+        row_deserializers = self._row_deserializers.get(lookup_key)
+        if row_deserializers is None:
+            row_deserializers = tuple(
+                (
+                    row_index,
+                    name,
+                    self._deserialize_functions.get(self._column_indexes[name]),
                 )
-                json_dict = json.loads(value)
-                value = serializer.DeserializeValue(json_dict)
+                for row_index, name in enumerate(column_names, start=first_column_index)
+            )
+            self._row_deserializers[lookup_key] = row_deserializers
 
-        return value
+        return row_deserializers
 
-    def SerializeValue(self, data_type, value):
-        """Serializes a value.
+    def SerializeAttributeContainer(self, container):
+        """Serializes an attribute container.
 
         Args:
-          data_type (str): schema data type.
-          value (object): runtime value.
+          container (AttributeContainer): attribute container.
 
         Returns:
-          object: serialized value.
-
-        Raises:
-          OSError: if the schema data type is not supported.
+          list[object]: serialized values for each of the columns.
         """
-        if not schema_helper.SchemaHelper.HasDataType(data_type):
-            raise OSError(f"Unsupported data type: {data_type:s}")
+        row_values = [getattr(container, name, None) for name in self.column_names]
 
-        if value is not None:
-            if data_type == "AttributeContainerIdentifier" and isinstance(
-                value, containers_interface.AttributeContainerIdentifier
-            ):
-                value = value.CopyToString()
+        for column_index, serialize_function in self._serialize_functions.items():
+            value = row_values[column_index]
+            if value is not None:
+                row_values[column_index] = serialize_function(value)
 
-            elif data_type == "bool":
-                value = int(value)
+        return row_values
 
-            elif data_type not in self._MAPPINGS:
-                serializer = schema_helper.SchemaHelper.GetAttributeSerializer(
-                    data_type, "json"
-                )
+    def SerializeAttributeValues(self, container, attribute_names):
+        """Serializes specific attribute values of an attribute container.
+
+        Args:
+          container (AttributeContainer): attribute container.
+          attribute_names (Iterable[str]): names of the attributes to serialize,
+              where attributes that are not defined by the schema are ignored.
 
-                # JSON will not serialize certain runtime types like set, therefore
-                # these are cast to list first.
-                if isinstance(value, set):
-                    value = list(value)
+        Returns:
+          dict[int, object]: serialized values per column index.
+        """
+        values = {}
+        for name in attribute_names:
+            column_index = self._column_indexes.get(name)
+            if column_index is not None:
+                value = getattr(container, name, None)
+                if value is not None:
+                    serialize_function = self._serialize_functions.get(column_index)
+                    if serialize_function:
+                        value = serialize_function(value)
 
-                json_dict = serializer.SerializeValue(value)
-                return json.dumps(json_dict)
+                values[column_index] = value
 
-        return value
+        return values
 
 
 class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCache):
@@ -214,44 +1509,167 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
 
     _CREATE_METADATA_TABLE_QUERY = "CREATE TABLE metadata (key TEXT, value TEXT);"
 
-    _HAS_TABLE_QUERY = (
-        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = '{0:s}'"
-    )
+    _GET_TABLE_NAMES_QUERY = "SELECT name FROM sqlite_master WHERE type = 'table'"
 
     _INSERT_METADATA_VALUE_QUERY = "INSERT INTO metadata (key, value) VALUES (?, ?)"
 
-    _MAXIMUM_WRITE_CACHE_SIZE = 50
+    # The maximum number of host parameters in a single query, which is the
+    # default SQLITE_MAX_VARIABLE_NUMBER of SQLite versions before 3.32.0. This
+    # value is used if the limit of the database connection cannot be determined.
+    _MAXIMUM_NUMBER_OF_VARIABLES = 999
+
+    # The maximum number of rows in a single multi-row INSERT query, which must
+    # be a power of 2.
+    _MAXIMUM_ROWS_PER_INSERT_QUERY = 128
+
+    # The maximum number of flushed write caches in the write queue, before
+    # flushing blocks until the writer thread has written the queued rows.
+    _MAXIMUM_WRITE_QUEUE_SIZE = 8
+
+    # The number of rows used to estimate the size of the rows in the write cache.
+    _NUMBER_OF_ROW_SIZE_SAMPLES = 16
+
+    # The number of rows to fetch at a time when reading attribute containers.
+    _NUMBER_OF_ROWS_PER_FETCH = 1024
+
+    # The maximum number of updated attribute containers cached per attribute
+    # container type.
+    _MAXIMUM_UPDATE_CACHE_SIZE = 16 * 1024
+
+    # The maximum estimated size, in bytes, of the values in the write cache.
+    _MAXIMUM_WRITE_CACHE_SIZE = 64 * 1024 * 1024
+
+    # The maximum estimated size, in bytes, of the values in the write cache per
+    # attribute container type.
+    _MAXIMUM_WRITE_CACHE_TYPE_SIZE = 4 * 1024 * 1024
 
     def __init__(self):
         """Initializes a SQLite attribute container store."""
         super().__init__()
         self._ast_to_sql_helper = PythonAST2SQLHelper()
+        self._attribute_container_plans = {}
+        self._attribute_container_plans_revision = None
+        self._commit_interval = None
+        self._commit_number_of_rows = None
+        self._commit_size = None
         self._connection = None
         self._cursor = None
         self._is_open = False
         self._read_only = True
+        self._last_commit_time = None
+        self._lazy_deserialization = False
+        self._maximum_number_of_variables = self._MAXIMUM_NUMBER_OF_VARIABLES
         self._schema_helper = SQLiteSchemaHelper()
+        self._table_names = set()
+        self._uncommitted_number_of_rows = 0
+        self._uncommitted_size = 0
+        self._update_cache = {}
+        self._update_cache_plans = {}
         self._write_cache = {}
+        self._write_cache_plans = {}
+        self._write_cache_row_sizes = {}
+        self._write_cache_size = 0
+        self._write_cache_sizes = {}
+        self._write_queue = None
+        self._write_queue_exception = None
+        self._writer_thread = None
 
         self.format_version = self._FORMAT_VERSION
         self.serialization_format = "json"
 
-    def _CacheAttributeContainerForWrite(self, container_type, column_names, values):
-        """Caches an attribute container for writing.
+    def _CacheAttributeContainersForUpdate(self, plan, values_per_sequence_number):
+        """Caches attribute containers for updating.
+
+        Multiple updates of the same attribute container are coalesced into one.
+        Attribute containers that are still cached for writing are updated in
+        the write cache instead.
 
         Args:
-          container_type (str): attribute container type.
-          column_names (list[str]): names of the columns.
-          values (list[str]): values for each of the columns.
+          plan (SQLiteAttributeContainerPlan): attribute container plan.
+          values_per_sequence_number (dict[int, dict[int, object]]): serialized
+              values per column index per attribute container sequence number.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
         """
-        write_cache = self._write_cache.get(container_type, [column_names])
-        write_cache.append(values)
+        container_type = plan.container_type
+
+        update_cache = self._update_cache.get(container_type)
+        if update_cache is None:
+            update_cache = {}
+            self._update_cache[container_type] = update_cache
+            self._update_cache_plans[container_type] = plan
+
+        first_cached_sequence_number, write_cache = self._GetWriteCache(container_type)
+        last_cached_sequence_number = first_cached_sequence_number + len(write_cache)
+
+        for sequence_number, values in values_per_sequence_number.items():
+            if (
+                first_cached_sequence_number
+                <= sequence_number
+                < (last_cached_sequence_number)
+            ):
+                row_values = write_cache[sequence_number - first_cached_sequence_number]
+                for column_index, value in values.items():
+                    row_values[column_index] = value
 
-        if len(write_cache) >= self._MAXIMUM_WRITE_CACHE_SIZE:
-            self._FlushWriteCache(container_type, write_cache)
-            write_cache = [column_names]
+            else:
+                cached_values = update_cache.get(sequence_number)
+                if cached_values is None:
+                    update_cache[sequence_number] = values
+                else:
+                    cached_values.update(values)
+
+        if len(update_cache) >= self._MAXIMUM_UPDATE_CACHE_SIZE:
+            self._FlushUpdateCacheByType(container_type)
+
+    def _CacheAttributeContainersForWrite(self, plan, rows):
+        """Caches attribute containers for writing.
+
+        The write cache is flushed when the estimated size of the cached values
+        of the attribute container type exceeds the maximum per type, or when
+        the estimated size of all cached values exceeds the maximum of the write
+        cache. In the latter case the attribute container types with the largest
+        cached values are flushed first.
+
+        Args:
+          plan (SQLiteAttributeContainerPlan): attribute container plan.
+          rows (list[list[object]]): values for each of the columns per attribute
+              container.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        container_type = plan.container_type
+
+        write_cache = self._write_cache.get(container_type)
+        if write_cache is None:
+            write_cache = []
+            self._write_cache[container_type] = write_cache
+            self._write_cache_plans[container_type] = plan
+            self._write_cache_row_sizes[container_type] = self._EstimateRowSize(
+                rows[: self._NUMBER_OF_ROW_SIZE_SAMPLES]
+            )
+            self._write_cache_sizes[container_type] = 0
+
+        write_cache.extend(rows)
+
+        size = len(rows) * self._write_cache_row_sizes[container_type]
+        self._write_cache_size += size
 
-        self._write_cache[container_type] = write_cache
+        type_size = self._write_cache_sizes[container_type] + size
+        self._write_cache_sizes[container_type] = type_size
+
+        if type_size >= self._MAXIMUM_WRITE_CACHE_TYPE_SIZE:
+            self._FlushWriteCacheByType(container_type)
+
+        if self._write_cache_size >= self._MAXIMUM_WRITE_CACHE_SIZE:
+            for cached_container_type, _ in sorted(
+                self._write_cache_sizes.items(), key=lambda item: item[1], reverse=True
+            ):
+                self._FlushWriteCacheByType(cached_container_type)
+                if self._write_cache_size < self._MAXIMUM_WRITE_CACHE_SIZE // 2:
+                    break
 
     def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
         """Checks the storage metadata.
@@ -305,16 +1723,74 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         # Ensure format_version is an integer.
         metadata_values["format_version"] = format_version
 
+    def _CommitTransaction(self):
+        """Commits the current transaction.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        if self._storage_profiler:
+            self._storage_profiler.StartTiming("commit")
+
+        try:
+            self._connection.commit()
+        except sqlite3.Error as exception:
+            raise OSError("Unable to commit attribute container store") from exception
+
+        finally:
+            if self._storage_profiler:
+                self._storage_profiler.StopTiming("commit")
+
+    def _CommitTransactionIfRequired(self):
+        """Commits the current transaction if required by the commit policy.
+
+        The commit policy is checked when the write cache is flushed. When a
+        writer thread is used the commit is queued after the flushed values, so
+        that the writer thread commits once these have been written.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        commit = bool(
+            (
+                self._commit_number_of_rows
+                and self._uncommitted_number_of_rows >= self._commit_number_of_rows
+            )
+            or (self._commit_size and self._uncommitted_size >= self._commit_size)
+            or (
+                self._commit_interval
+                and time.monotonic() - self._last_commit_time >= self._commit_interval
+            )
+        )
+        if commit:
+            if not self._write_queue:
+                self._CommitTransaction()
+            else:
+                self._write_queue.put((None, None))
+
+            self._last_commit_time = time.monotonic()
+            self._uncommitted_number_of_rows = 0
+            self._uncommitted_size = 0
+
     def _CommitWriteCache(self, container_type):
         """Commits the write cache for a specific type of attribute container.
 
+        Both the values cached for writing and for updating are written. When
+        a writer thread is used this waits until the writer thread has written
+        all queued rows, so that the attribute containers can be read back from
+        the database.
+
         Args:
           container_type (str): attribute container type.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
         """
-        write_cache = self._write_cache.get(container_type, [])
-        if len(write_cache) > 1:
-            self._FlushWriteCache(container_type, write_cache)
-            del self._write_cache[container_type]
+        self._FlushWriteCacheByType(container_type)
+        self._FlushUpdateCacheByType(container_type)
+
+        if self._write_queue:
+            self._JoinWriteQueue()
 
     def _CreateAttributeContainerTable(self, container_type):
         """Creates a table for a specific attribute container type.
@@ -330,241 +1806,859 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         if not schema:
             raise OSError(f"Unsupported attribute container type: {container_type:s}")
 
-        column_definitions = ["_identifier INTEGER PRIMARY KEY AUTOINCREMENT"]
+        column_definitions = ["_identifier INTEGER PRIMARY KEY AUTOINCREMENT"]
+
+        for name, data_type in sorted(schema.items()):
+            data_type = self._schema_helper.GetStorageDataType(data_type)
+            column_definitions.append(f"{name:s} {data_type:s}")
+
+        column_definitions = ", ".join(column_definitions)
+        query = f"CREATE TABLE {container_type:s} ({column_definitions:s});"
+
+        # The writer thread could be using the connection.
+        if self._write_queue:
+            self._JoinWriteQueue()
+
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError("Unable to query attribute container store") from exception
+
+        self._table_names.add(container_type)
+
+    def _CreateAttributeContainerFromRow(
+        self, container_type, row_deserializers, row, lazy_row_deserializers=None
+    ):
+        """Creates an attribute container of a row in the database.
+
+        Args:
+          container_type (str): attribute container type.
+          row_deserializers (tuple[tuple[int, str, function]]): deserializers
+              of the values of the row.
+          row (sqlite.Row): row as a result from a SELECT query.
+          lazy_row_deserializers (Optional[tuple[tuple[int, str, function]]]):
+              deserializers of the values of the row that are deserialized when
+              the corresponding attribute is first accessed.
+
+        Returns:
+          AttributeContainer: attribute container.
+        """
+        container = self._containers_manager.CreateAttributeContainer(container_type)
+
+        # The attribute values are set directly to bypass __setattr__.
+        attribute_values = container.__dict__
+        for row_index, name, deserialize_function in row_deserializers:
+            value = row[row_index]
+            if value is not None:
+                if deserialize_function:
+                    value = deserialize_function(value)
+                attribute_values[name] = value
+
+        if lazy_row_deserializers:
+            serialized_attribute_values = {}
+            for row_index, name, deserialize_function in lazy_row_deserializers:
+                value = row[row_index]
+                if value is not None:
+                    serialized_attribute_values[name] = (deserialize_function, value)
+
+            if serialized_attribute_values:
+                container.SetSerializedAttributeValues(serialized_attribute_values)
+
+        if isinstance(container, containers_interface.TrackedAttributeContainer):
+            container.ClearChangedAttributeNames()
+
+        return container
+
+    def _DeserializeQueryResults(self, container_type, column_names, rows):
+        """Deserializes the values of query results.
+
+        Args:
+          container_type (str): attribute container type.
+          column_names (list[str]): names of the columns of the values to
+              deserialize, which are the first values in a row.
+          rows (list[Sequence[object]]): rows of the query results.
+
+        Returns:
+          list[tuple[object]]: rows with deserialized values.
+        """
+        plan = self._GetAttributeContainerPlan(container_type)
+        row_deserializers = [
+            (row_index, deserialize_function)
+            for row_index, _, deserialize_function in plan.GetRowDeserializers(
+                column_names, 0
+            )
+            if deserialize_function
+        ]
+        if not row_deserializers:
+            return [tuple(row) for row in rows]
+
+        deserialized_rows = []
+        for row in rows:
+            values = list(row)
+            for row_index, deserialize_function in row_deserializers:
+                value = values[row_index]
+                if value is not None:
+                    values[row_index] = deserialize_function(value)
+
+            deserialized_rows.append(tuple(values))
+
+        return deserialized_rows
+
+    def _EstimateRowSize(self, rows):
+        """Estimates the average size of rows.
+
+        The size of a row is estimated as the memory used by the row, including
+        a reference per value, and by its values. None and boolean values are
+        shared by all rows and are not counted.
+
+        Args:
+          rows (list[list[object]]): values for each of the columns per row.
+
+        Returns:
+          int: estimated average size of a row in bytes.
+        """
+        size = 0
+        for row_values in rows:
+            size += sys.getsizeof(row_values)
+            for value in row_values:
+                if value is not None and value is not True and value is not False:
+                    size += sys.getsizeof(value)
+
+        return max(1, size // max(1, len(rows)))
+
+    def _Flush(self):
+        """Ensures cached data is written to file.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        for container_type, write_cache in self._write_cache.items():
+            if write_cache:
+                self._FlushWriteCache(container_type, write_cache)
+
+        self._write_cache = {}
+        self._write_cache_row_sizes = {}
+        self._write_cache_size = 0
+        self._write_cache_sizes = {}
+
+        for container_type in list(self._update_cache.keys()):
+            self._FlushUpdateCacheByType(container_type)
+
+        if self._write_queue:
+            self._JoinWriteQueue()
+
+        # We need to run commit or not all data is stored in the database.
+        self._CommitTransaction()
+
+        self._last_commit_time = time.monotonic()
+        self._uncommitted_number_of_rows = 0
+        self._uncommitted_size = 0
+
+    def _FlushUpdateCacheByType(self, container_type):
+        """Flushes the update cache for a specific type of attribute container.
+
+        When a writer thread is used this waits until the writer thread has
+        written all queued rows, since these could be updated. The current
+        transaction is committed afterwards if required by the commit policy.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        update_cache = self._update_cache.pop(container_type, None)
+        if update_cache:
+            if self._write_queue:
+                self._JoinWriteQueue()
+
+            plan = self._update_cache_plans[container_type]
+            self._UpdateRows(self._cursor, plan, update_cache)
+
+            self._uncommitted_number_of_rows += len(update_cache)
+
+            self._CommitTransactionIfRequired()
+
+    def _FlushWriteCache(self, container_type, write_cache):
+        """Flushes attribute container values cached for writing.
+
+        When a writer thread is used the values are added to the write queue,
+        which blocks when the write queue is full. Otherwise the values are
+        written directly.
+
+        Args:
+          container_type (str): attribute container type.
+          write_cache (list[list[object]]): cached attribute container values.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        plan = self._write_cache_plans[container_type]
+
+        if not self._write_queue:
+            self._InsertRows(self._cursor, plan, write_cache)
+
+        else:
+            if self._write_queue_exception:
+                self._JoinWriteQueue()
+
+            self._write_queue.put((plan, write_cache))
+
+    def _FlushWriteCacheByType(self, container_type):
+        """Flushes the write cache for a specific type of attribute container.
+
+        The current transaction is committed afterwards if required by the commit
+        policy.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        write_cache = self._write_cache.pop(container_type, None)
+        if write_cache:
+            self._FlushWriteCache(container_type, write_cache)
+
+        type_size = self._write_cache_sizes.pop(container_type, 0)
+        self._write_cache_size -= type_size
+        self._write_cache_row_sizes.pop(container_type, None)
+
+        if write_cache:
+            self._uncommitted_number_of_rows += len(write_cache)
+            self._uncommitted_size += type_size
+
+            self._CommitTransactionIfRequired()
+
+    def _GetAttributeContainerPlan(self, container_type):
+        """Retrieves the plan of a specific attribute container type.
+
+        The plans are rebuilt when the registered attribute containers change.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Returns:
+          SQLiteAttributeContainerPlan: attribute container plan.
+
+        Raises:
+          OSError: if an unsupported attribute container type is provided.
+        """
+        revision = self._containers_manager.GetRevision()
+        if revision != self._attribute_container_plans_revision:
+            self._attribute_container_plans = {}
+            self._attribute_container_plans_revision = revision
+
+        plan = self._attribute_container_plans.get(container_type)
+        if not plan:
+            schema = self._GetAttributeContainerSchema(container_type)
+            if not schema:
+                raise OSError(
+                    f"Unsupported attribute container type: {container_type:s}"
+                )
+
+            plan = SQLiteAttributeContainerPlan(
+                container_type, schema, self._schema_helper
+            )
+            self._attribute_container_plans[container_type] = plan
+
+        return plan
+
+    def _GetAttributeContainersWithFilter(
+        self,
+        container_type,
+        column_names=None,
+        filter_expression=None,
+        filter_parameters=None,
+        residual_expression=None,
+        order_by=None,
+        start_sequence_number=None,
+        end_sequence_number=None,
+        limit=None,
+        after_key=None,
+    ):
+        """Retrieves a specific type of stored attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          column_names (Optional[list[str]]): names of the columns to retrieve.
+          filter_expression (Optional[str]): SQL expression to filter results by.
+          filter_parameters (Optional[list[object]]): values of the parameters
+              of the SQL expression to filter results by.
+          residual_expression (Optional[function]): predicate to filter
+              the attribute containers, that match the SQL expression, by.
+          order_by (Optional[str]): name of a column to order the results by.
+          start_sequence_number (Optional[int]): sequence number of the first
+              attribute container to retrieve.
+          end_sequence_number (Optional[int]): sequence number of the last
+              attribute container to retrieve.
+          limit (Optional[int]): maximum number of attribute containers to
+              retrieve.
+          after_key (Optional[tuple[object, int]]): serialized value of the
+              column to order by and sequence number of the attribute container
+              after which to retrieve attribute containers.
+
+        Yields:
+          AttributeContainer: attribute container.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        create_attribute_container = self._CreateAttributeContainerFromRow
+        identifier_class = containers_interface.AttributeContainerIdentifier
+        lazy_row_deserializers = None
+        row_deserializers = None
+
+        number_of_containers = 0
+        rows_limit = limit
+        if residual_expression:
+            if limit is not None and limit <= 0:
+                return
+
+            # The limit applies to the attribute containers that match
+            # the residual expression.
+            rows_limit = None
+
+        for rows in self._GetRowsWithFilter(
+            container_type,
+            column_names,
+            filter_expression=filter_expression,
+            filter_parameters=filter_parameters,
+            order_by=order_by,
+            start_sequence_number=start_sequence_number,
+            end_sequence_number=end_sequence_number,
+            limit=rows_limit,
+            after_key=after_key,
+        ):
+            if row_deserializers is None:
+                plan = self._GetAttributeContainerPlan(container_type)
+                row_deserializers, lazy_row_deserializers = self._GetRowDeserializers(
+                    plan, column_names
+                )
+
+            for row in rows:
+                container = create_attribute_container(
+                    container_type, row_deserializers, row, lazy_row_deserializers
+                )
+                container.SetIdentifier(
+                    identifier_class(name=container_type, sequence_number=row[0])
+                )
 
-        for name, data_type in sorted(schema.items()):
-            data_type = self._schema_helper.GetStorageDataType(data_type)
-            column_definitions.append(f"{name:s} {data_type:s}")
+                if residual_expression:
+                    if not residual_expression(container):
+                        continue
 
-        column_definitions = ", ".join(column_definitions)
-        query = f"CREATE TABLE {container_type:s} ({column_definitions:s});"
+                    number_of_containers += 1
 
-        try:
-            self._cursor.execute(query)
-        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-            raise OSError("Unable to query attribute container store") from exception
+                yield container
 
-    def _CreateAttributeContainerFromRow(
-        self, container_type, column_names, row, first_column_index
-    ):
-        """Creates an attribute container of a row in the database.
+                if rows_limit is None and number_of_containers == limit:
+                    return
+
+    def _GetNumberOfAttributeContainerRows(self, container_type):
+        """Retrieves the number of attribute container rows.
 
         Args:
           container_type (str): attribute container type.
-          column_names (list[str]): names of the columns selected.
-          row (sqlite.Row): row as a result from a SELECT query.
-          first_column_index (int): index of the first column in row.
 
         Returns:
-          AttributeContainer: attribute container.
+          int: the number of rows of a specified attribute container type.
 
         Raises:
-          OSError: when there is an error querying the attribute container store
-              or if an unsupported attribute container is provided.
+          OSError: when there is an error querying the attribute container store.
         """
-        schema = self._GetAttributeContainerSchema(container_type)
-        if not schema:
-            raise OSError(f"Unsupported attribute container type: {container_type:s}")
+        if self._write_queue:
+            self._JoinWriteQueue()
 
-        container = self._containers_manager.CreateAttributeContainer(container_type)
+        if not self._HasTable(container_type):
+            return 0
 
-        for column_index, name in enumerate(column_names):
-            row_value = row[first_column_index + column_index]
-            if row_value is not None:
-                data_type = schema[name]
-                try:
-                    attribute_value = self._schema_helper.DeserializeValue(
-                        data_type, row_value
-                    )
-                except OSError as exception:
-                    raise OSError(
-                        f"Unsupported attribute container type: {container_type:s} "
-                        f"attribute: {name:s} data type: {data_type:s}"
-                    ) from exception
+        write_cache = self._write_cache.get(container_type) or []
 
-                setattr(container, name, attribute_value)
+        # Note that this is SQLite specific, and will give inaccurate results if
+        # there are DELETE commands run on the table. acstore does not run any
+        # DELETE commands.
+        query = f"SELECT MAX(_ROWID_) FROM {container_type:s} LIMIT 1"
 
-        return container
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError("Unable to query attribute container store") from exception
 
-    def _Flush(self):
-        """Ensures cached data is written to file.
+        row = self._cursor.fetchone()
+        if not row:
+            return len(write_cache)
 
-        Raises:
-          OSError: when there is an error querying the attribute container store.
+        return (row[0] or 0) + len(write_cache)
+
+    def _GetRowDeserializers(self, plan, column_names):
+        """Retrieves the deserializers of the values of a row.
+
+        Args:
+          plan (SQLiteAttributeContainerPlan): attribute container plan.
+          column_names (list[str]): names of the columns selected, which follow
+              the identifier column in a row.
+
+        Returns:
+          tuple[tuple[tuple[int, str, function]], tuple[tuple[int, str, function]]]:
+              deserializers of the values to deserialize when the attribute
+              container is created and deserializers of the values to
+              deserialize when first accessed or None if lazy deserialization
+              is not used.
         """
-        for container_type, write_cache in self._write_cache.items():
-            if len(write_cache) > 1:
-                self._FlushWriteCache(container_type, write_cache)
+        if self._lazy_deserialization:
+            return plan.GetLazyRowDeserializers(column_names, 1)
 
-        self._write_cache = {}
+        return plan.GetRowDeserializers(column_names, 1), None
 
-        # We need to run commit or not all data is stored in the database.
-        self._connection.commit()
+    def _GetRowsByRowNumbers(self, container_type, column_names, row_numbers):
+        """Retrieves the rows of specific stored attribute containers.
 
-    def _FlushWriteCache(self, container_type, write_cache):
-        """Flushes attribute container values cached for writing.
+        Rows with consecutive row numbers are read with a single range query,
+        otherwise the rows are read with IN queries.
 
         Args:
           container_type (str): attribute container type.
-          write_cache (list[tuple[str]]): cached attribute container values.
+          column_names (list[str]): names of the columns to retrieve.
+          row_numbers (list[int]): row numbers of the attribute containers,
+              sorted in ascending order and without duplicates.
+
+        Returns:
+          list[Sequence[object]]: rows, where a row contains the sequence number
+              of the attribute container followed by the serialized values of
+              the columns.
 
         Raises:
           OSError: when there is an error querying the attribute container store.
         """
-        column_names = write_cache.pop(0)
-
-        value_statement = ",".join(["?"] * len(column_names))
-        value_statement = f"({value_statement:s})"
-        values_statement = ", ".join([value_statement] * len(write_cache))
-
-        column_names_string = ", ".join(column_names)
-
-        query = (
-            f"INSERT INTO {container_type:s} ({column_names_string:s}) "
-            f"VALUES {values_statement:s}"
-        )
+        if self._write_queue:
+            self._JoinWriteQueue()
+
+        column_names_string = ", ".join(["_identifier", *column_names])
+        query = f"SELECT {column_names_string:s} FROM {container_type:s} WHERE"
+
+        if row_numbers[-1] - row_numbers[0] + 1 == len(row_numbers):
+            queries = [
+                (
+                    f"{query:s} rowid BETWEEN {row_numbers[0]:d} AND "
+                    f"{row_numbers[-1]:d}",
+                    [],
+                )
+            ]
+        else:
+            queries = []
+            for row_index in range(
+                0, len(row_numbers), self._maximum_number_of_variables
+            ):
+                parameters = row_numbers[
+                    row_index : row_index + self._maximum_number_of_variables
+                ]
+                values_string = ", ".join(["?"] * len(parameters))
+                queries.append((f"{query:s} rowid IN ({values_string:s})", parameters))
 
         if self._storage_profiler:
-            self._storage_profiler.StartTiming("write_new")
+            self._storage_profiler.StartTiming("get_containers_by_index")
 
+        rows = []
         try:
-            values = list(itertools.chain(*write_cache))
-            self._cursor.execute(query, values)
+            for query, parameters in queries:
+                self._cursor.execute(query, parameters)
+                rows.extend(self._cursor.fetchall())
 
         except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-            raise OSError("Unable to query attribute container store") from exception
+            raise OSError(
+                f"Unable to query attribute container store for container: "
+                f"{container_type:s}"
+            ) from exception
 
         finally:
             if self._storage_profiler:
-                self._storage_profiler.StopTiming("write_new")
-
-    def _GetAttributeContainersWithFilter(
-        self, container_type, column_names=None, filter_expression=None, order_by=None
+                self._storage_profiler.StopTiming("get_containers_by_index")
+
+        update_cache = self._update_cache.get(container_type)
+        if update_cache:
+            plan = self._update_cache_plans[container_type]
+            column_indexes = plan.GetColumnIndexes(column_names)
+
+            for index, row in enumerate(rows):
+                values = update_cache.get(row[0])
+                if values:
+                    row = list(row)
+                    for row_index, column_index in enumerate(column_indexes, start=1):
+                        if column_index in values:
+                            row[row_index] = values[column_index]
+
+                    rows[index] = row
+
+        return rows
+
+    def _GetRowsWithFilter(
+        self,
+        container_type,
+        column_names,
+        filter_expression=None,
+        filter_parameters=None,
+        order_by=None,
+        start_sequence_number=None,
+        end_sequence_number=None,
+        limit=None,
+        after_key=None,
     ):
-        """Retrieves a specific type of stored attribute containers.
+        """Retrieves the rows of a specific type of stored attribute containers.
 
         Args:
           container_type (str): attribute container type.
-          column_names (Optional[list[str]]): names of the columns to retrieve.
+          column_names (list[str]): names of the columns to retrieve.
           filter_expression (Optional[str]): SQL expression to filter results by.
+          filter_parameters (Optional[list[object]]): values of the parameters
+              of the SQL expression to filter results by.
           order_by (Optional[str]): name of a column to order the results by.
+          start_sequence_number (Optional[int]): sequence number of the first
+              attribute container to retrieve.
+          end_sequence_number (Optional[int]): sequence number of the last
+              attribute container to retrieve.
+          limit (Optional[int]): maximum number of rows to retrieve.
+          after_key (Optional[tuple[object, int]]): serialized value of the
+              column to order by and sequence number of the row after which to
+              retrieve rows.
 
         Yields:
-          AttributeContainer: attribute container.
+          list[Sequence[object]]: rows in batches, where a row contains the
+              sequence number of the attribute container followed by
+              the serialized values of the columns.
 
         Raises:
           OSError: when there is an error querying the attribute container store.
         """
-        self._CommitWriteCache(container_type)
+        if filter_expression or order_by or after_key is not None:
+            self._CommitWriteCache(container_type)
 
-        if self._attribute_container_sequence_numbers[container_type]:
-            column_names_string = ", ".join(column_names)
+            first_cached_sequence_number = None
+            update_cache = {}
+            update_column_indexes = []
+            write_cache = []
 
-            query = (
-                f"SELECT _identifier, {column_names_string:s} "
-                f"FROM {container_type:s}"
+        else:
+            # Attribute containers that are cached for writing or updating are
+            # not flushed, instead these are read from the write cache after the
+            # rows that have been written and from the update cache instead of
+            # the rows that have been written.
+            first_cached_sequence_number, write_cache = self._GetWriteCache(
+                container_type
+            )
+            write_cache = list(write_cache)
+
+            update_cache = dict(self._update_cache.get(container_type) or {})
+            update_column_indexes = []
+            if update_cache:
+                plan = self._update_cache_plans[container_type]
+                update_column_indexes = plan.GetColumnIndexes(column_names)
+
+            if self._write_queue:
+                self._JoinWriteQueue()
+
+        conditions = []
+        parameters = list(filter_parameters or [])
+        if filter_expression:
+            conditions.append(f"({filter_expression:s})")
+
+        if after_key is not None:
+            after_value, after_sequence_number = after_key
+            if after_value is None:
+                # Rows without a value are ordered first.
+                conditions.append(
+                    f"(({order_by:s} IS NULL AND _identifier > ?) OR "
+                    f"{order_by:s} IS NOT NULL)"
+                )
+                parameters.append(after_sequence_number)
+            else:
+                conditions.append(f"({order_by:s}, _identifier) > (?, ?)")
+                parameters.extend([after_value, after_sequence_number])
+
+        if first_cached_sequence_number is not None:
+            conditions.append(f"_identifier < {first_cached_sequence_number:d}")
+
+        if start_sequence_number is not None and end_sequence_number is not None:
+            conditions.append(
+                f"_identifier BETWEEN {start_sequence_number:d} AND "
+                f"{end_sequence_number:d}"
             )
-            if filter_expression:
-                query = " WHERE ".join([query, filter_expression])
+        elif start_sequence_number is not None:
+            conditions.append(f"_identifier >= {start_sequence_number:d}")
+        elif end_sequence_number is not None:
+            conditions.append(f"_identifier <= {end_sequence_number:d}")
+
+        number_of_rows = 0
+
+        if (
+            self._attribute_container_sequence_numbers[container_type]
+            and (limit is None or limit > 0)
+            and (
+                first_cached_sequence_number is None
+                or (
+                    first_cached_sequence_number > 1
+                    and (
+                        start_sequence_number is None
+                        or start_sequence_number < first_cached_sequence_number
+                    )
+                )
+            )
+        ):
+            column_names_string = ", ".join(["_identifier", *column_names])
+
+            query = f"SELECT {column_names_string:s} FROM {container_type:s}"
+            if conditions:
+                query = " WHERE ".join([query, " AND ".join(conditions)])
             if order_by:
-                query = " ORDER BY ".join([query, order_by])
+                # The identifier makes the order deterministic for pagination.
+                query = f"{query:s} ORDER BY {order_by:s}, _identifier"
+            if limit is not None:
+                query = f"{query:s} LIMIT {limit:d}"
 
             # Use a local cursor to prevent another query interrupting the generator.
             cursor = self._connection.cursor()
 
             try:
-                cursor.execute(query)
+                cursor.execute(query, parameters)
             except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
                 raise OSError(
                     f"Unable to query attribute container store for container: "
                     f"{container_type:s}"
                 ) from exception
 
-            if self._storage_profiler:
-                self._storage_profiler.StartTiming("get_containers")
+            while True:
+                if self._storage_profiler:
+                    self._storage_profiler.StartTiming("get_containers")
 
-            try:
-                row = cursor.fetchone()
+                try:
+                    rows = cursor.fetchmany(self._NUMBER_OF_ROWS_PER_FETCH)
 
-            finally:
-                if self._storage_profiler:
-                    self._storage_profiler.StopTiming("get_containers")
+                except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                    raise OSError(
+                        f"Unable to query attribute container store for container: "
+                        f"{container_type:s}"
+                    ) from exception
+
+                finally:
+                    if self._storage_profiler:
+                        self._storage_profiler.StopTiming("get_containers")
+
+                if not rows:
+                    break
+
+                if update_cache:
+                    for index, row in enumerate(rows):
+                        values = update_cache.get(row[0])
+                        if values:
+                            row = list(row)
+                            for row_index, column_index in enumerate(
+                                update_column_indexes, start=1
+                            ):
+                                if column_index in values:
+                                    row[row_index] = values[column_index]
+
+                            rows[index] = row
 
-            while row:
-                container = self._CreateAttributeContainerFromRow(
-                    container_type, column_names, row, 1
+                number_of_rows += len(rows)
+
+                yield rows
+
+        if write_cache:
+            first_index = 0
+            if start_sequence_number is not None:
+                first_index = max(
+                    start_sequence_number - first_cached_sequence_number, 0
                 )
 
-                identifier = containers_interface.AttributeContainerIdentifier(
-                    name=container_type, sequence_number=row[0]
+            last_index = len(write_cache)
+            if end_sequence_number is not None:
+                last_index = min(
+                    end_sequence_number - first_cached_sequence_number + 1, last_index
                 )
-                container.SetIdentifier(identifier)
+            if limit is not None:
+                last_index = min(first_index + limit - number_of_rows, last_index)
+
+            if first_index < last_index:
+                plan = self._write_cache_plans[container_type]
+                column_indexes = plan.GetColumnIndexes(column_names)
+
+                yield [
+                    [sequence_number, *[row[index] for index in column_indexes]]
+                    for sequence_number, row in enumerate(
+                        write_cache[first_index:last_index],
+                        start=first_cached_sequence_number + first_index,
+                    )
+                ]
 
-                yield container
+    def _GetSQLFilterExpression(self, container_type, filter_expression):
+        """Converts a filter expression into a parameterized SQL filter expression.
 
-                if self._storage_profiler:
-                    self._storage_profiler.StartTiming("get_containers")
+        Args:
+          container_type (str): attribute container type.
+          filter_expression (str): expression to filter attribute containers by.
 
-                try:
-                    row = cursor.fetchone()
+        Returns:
+          tuple[str, list[object], function]: SQL expression to filter results
+              by or None, the values of its parameters and the predicate of
+              the residual expression to filter the resulting attribute
+              containers by or None.
+        """
+        if not filter_expression:
+            return None, None, None
 
-                finally:
-                    if self._storage_profiler:
-                        self._storage_profiler.StopTiming("get_containers")
+        # The plan of the attribute container type is used to convert attributes
+        # based on their data types. Without a schema the attributes are not
+        # converted and the filter expression is evaluated on the attribute
+        # containers.
+        if self._GetAttributeContainerSchema(container_type):
+            plan = self._GetAttributeContainerPlan(container_type)
+            return plan.CompileFilterExpression(filter_expression)
 
-    def _GetNumberOfAttributeContainerRows(self, container_type):
-        """Retrieves the number of attribute container rows.
+        return self._ast_to_sql_helper.CompileExpression(filter_expression)
+
+    def _GetWriteCache(self, container_type):
+        """Retrieves the values cached for writing of a specific type.
+
+        The cached values are those of the most recently added attribute
+        containers of the type, since the write cache is flushed as a whole.
 
         Args:
           container_type (str): attribute container type.
 
         Returns:
-          int: the number of rows of a specified attribute container type.
+          tuple[int, list[list[object]]]: sequence number of the first cached
+              attribute container and the cached values.
+        """
+        write_cache = self._write_cache.get(container_type) or []
+
+        next_sequence_number = self._attribute_container_sequence_numbers[
+            container_type
+        ]
+        return next_sequence_number - len(write_cache) + 1, write_cache
+
+    def _HasTable(self, table_name):
+        """Determines if a specific table exists.
+
+        The names of the tables are read when the store is opened and kept
+        current when a table is created.
+
+        Args:
+          table_name (str): name of the table.
+
+        Returns:
+          bool: True if the table exists, false otherwise.
+        """
+        return table_name in self._table_names
+
+    def _InsertRows(self, cursor, plan, rows):
+        """Inserts attribute container values.
+
+        The values are written with multi-row INSERT queries of which the number
+        of rows is a power of 2. This limits the number of distinct queries per
+        attribute container type, so that the prepared statements can be reused.
+
+        Args:
+          cursor (sqlite3.Cursor): cursor to run the INSERT queries with.
+          plan (SQLiteAttributeContainerPlan): attribute container plan.
+          rows (list[list[object]]): values for each of the columns per attribute
+              container.
 
         Raises:
           OSError: when there is an error querying the attribute container store.
         """
-        self._CommitWriteCache(container_type)
+        # At least 1 row is inserted per query, even if the number of columns
+        # exceeds the maximum number of variables.
+        maximum_rows_per_query = self._MAXIMUM_ROWS_PER_INSERT_QUERY
+        while maximum_rows_per_query > 1 and (
+            maximum_rows_per_query * len(plan.column_names)
+            > self._maximum_number_of_variables
+        ):
+            maximum_rows_per_query //= 2
 
-        if not self._HasTable(container_type):
-            return 0
+        number_of_rows = len(rows)
+        number_of_batches, remaining_rows = divmod(
+            number_of_rows, maximum_rows_per_query
+        )
 
-        # Note that this is SQLite specific, and will give inaccurate results if
-        # there are DELETE commands run on the table. acstore does not run any
-        # DELETE commands.
-        query = f"SELECT MAX(_ROWID_) FROM {container_type:s} LIMIT 1"
+        if self._storage_profiler:
+            self._storage_profiler.StartTiming("write_new")
 
         try:
-            self._cursor.execute(query)
-        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            row_index = number_of_batches * maximum_rows_per_query
+            if number_of_batches:
+                query = plan.GetInsertQuery(maximum_rows_per_query)
+                batches = [
+                    list(itertools.chain(*rows[index : index + maximum_rows_per_query]))
+                    for index in range(0, row_index, maximum_rows_per_query)
+                ]
+                cursor.executemany(query, batches)
+
+            while remaining_rows:
+                number_of_rows = 1 << (remaining_rows.bit_length() - 1)
+                query = plan.GetInsertQuery(number_of_rows)
+                values = list(
+                    itertools.chain(*rows[row_index : row_index + number_of_rows])
+                )
+                cursor.execute(query, values)
+
+                row_index += number_of_rows
+                remaining_rows -= number_of_rows
+
+        except sqlite3.Error as exception:
             raise OSError("Unable to query attribute container store") from exception
 
-        row = self._cursor.fetchone()
-        if not row:
-            return 0
+        finally:
+            if self._storage_profiler:
+                self._storage_profiler.StopTiming("write_new")
 
-        return row[0] or 0
+    def _JoinWriteQueue(self):
+        """Waits until the writer thread has written all queued rows.
 
-    def _HasTable(self, table_name):
-        """Determines if a specific table exists.
+        Raises:
+          OSError: if the writer thread failed to write queued rows.
+        """
+        self._write_queue.join()
+
+        exception = self._write_queue_exception
+        if exception:
+            self._write_queue_exception = None
+            raise OSError("Unable to write queued attribute containers") from exception
+
+    def _QueryAttributeContainers(self, container_type, query, parameters=None):
+        """Queries a specific type of stored attribute containers.
+
+        The attribute containers cached for writing and updating are written
+        first, so that the query includes these.
 
         Args:
-          table_name (str): name of the table.
+          container_type (str): attribute container type.
+          query (str): SQL query of the attribute containers.
+          parameters (Optional[list[object]]): values of the parameters of
+              the SQL query.
 
         Returns:
-          bool: True if the table exists, false otherwise.
+          list[tuple[object]]: rows of the query results.
 
         Raises:
           OSError: when there is an error querying the attribute container store.
         """
-        query = self._HAS_TABLE_QUERY.format(table_name)
+        if not self._attribute_container_sequence_numbers[container_type]:
+            return []
+
+        self._CommitWriteCache(container_type)
+
+        if not self._HasTable(container_type):
+            return []
 
         try:
-            self._cursor.execute(query)
-        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-            raise OSError("Unable to query attribute container store") from exception
+            self._cursor.execute(query, parameters or ())
+            return self._cursor.fetchall()
 
-        return bool(self._cursor.fetchone())
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(
+                f"Unable to query attribute container store for container: "
+                f"{container_type:s}"
+            ) from exception
 
     def _RaiseIfNotReadable(self):
         """Raises if the attribute container store is not readable.
@@ -625,6 +2719,56 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
 
         return {row[0]: row[1] for row in self._cursor.fetchall()}
 
+    def _ReadTableNames(self):
+        """Reads the names of the tables.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        try:
+            self._cursor.execute(self._GET_TABLE_NAMES_QUERY)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError("Unable to query attribute container store") from exception
+
+        self._table_names = {row[0] for row in self._cursor.fetchall()}
+
+    def _UpdateRows(self, cursor, plan, values_per_sequence_number):
+        """Updates rows of attribute container values.
+
+        The rows are updated with one UPDATE query per combination of columns.
+
+        Args:
+          cursor (sqlite3.Cursor): cursor to run the UPDATE queries with.
+          plan (SQLiteAttributeContainerPlan): attribute container plan.
+          values_per_sequence_number (dict[int, dict[int, object]]): serialized
+              values per column index per attribute container sequence number.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        rows_per_column_indexes = {}
+        for sequence_number, values in sorted(values_per_sequence_number.items()):
+            column_indexes = tuple(sorted(values.keys()))
+            row_values = [values[column_index] for column_index in column_indexes]
+            row_values.append(sequence_number)
+
+            rows_per_column_indexes.setdefault(column_indexes, []).append(row_values)
+
+        if self._storage_profiler:
+            self._storage_profiler.StartTiming("write_existing")
+
+        try:
+            for column_indexes, rows in rows_per_column_indexes.items():
+                query = plan.GetUpdateQuery(column_indexes)
+                cursor.executemany(query, rows)
+
+        except sqlite3.Error as exception:
+            raise OSError("Unable to query attribute container store") from exception
+
+        finally:
+            if self._storage_profiler:
+                self._storage_profiler.StopTiming("write_existing")
+
     def _UpdateStorageMetadataFormatVersion(self):
         """Updates the storage metadata format version.
 
@@ -656,52 +2800,53 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
           OSError: when there is an error querying the attribute container store
               or if an unsupported attribute container is provided.
         """
-        self._CommitWriteCache(container.CONTAINER_TYPE)
+        self._WriteExistingAttributeContainers([container])
 
-        identifier = container.GetIdentifier()
-
-        schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
-        if not schema:
-            raise OSError(
-                f"Unsupported attribute container type: {container.CONTAINER_TYPE:s}"
-            )
+    def _WriteExistingAttributeContainers(self, containers):
+        """Writes existing attribute containers to the store.
 
-        column_names = []
-        row_values = []
-        for name, data_type in sorted(schema.items()):
-            attribute_value = getattr(container, name, None)
-            try:
-                row_value = self._schema_helper.SerializeValue(
-                    data_type, attribute_value
-                )
-            except OSError as exception:
-                raise OSError(
-                    f"Unsupported attribute container type: "
-                    f"{container.CONTAINER_TYPE:s} attribute: {name:s} data type: "
-                    f"{data_type:s}"
-                ) from exception
+        The updated values are cached and written in batches. Of attribute
+        containers that track changed attributes only the changed attributes
+        are written.
 
-            column_names.append(f"{name:s} = ?")
-            row_values.append(row_value)
+        Args:
+          containers (list[AttributeContainer]): attribute containers.
 
-        column_names_string = ", ".join(column_names)
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
+        """
+        containers_per_type = {}
+        for container in containers:
+            containers_per_type.setdefault(container.CONTAINER_TYPE, []).append(
+                container
+            )
 
-        query = (
-            f"UPDATE {container.CONTAINER_TYPE:s} SET {column_names_string:s} "
-            f"WHERE _identifier = {identifier.sequence_number:d}"
-        )
+        for container_type, containers_of_type in containers_per_type.items():
+            plan = self._GetAttributeContainerPlan(container_type)
 
-        if self._storage_profiler:
-            self._storage_profiler.StartTiming("write_existing")
+            values_per_sequence_number = {}
+            for container in containers_of_type:
+                if not isinstance(
+                    container, containers_interface.TrackedAttributeContainer
+                ):
+                    values = dict(
+                        enumerate(plan.SerializeAttributeContainer(container))
+                    )
+                else:
+                    values = plan.SerializeAttributeValues(
+                        container, container.GetChangedAttributeNames()
+                    )
+                    container.ClearChangedAttributeNames()
 
-        try:
-            self._cursor.execute(query, row_values)
-        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-            raise OSError("Unable to query attribute container store") from exception
+                if values:
+                    sequence_number = container.GetIdentifier().sequence_number
+                    values_per_sequence_number[sequence_number] = values
 
-        finally:
-            if self._storage_profiler:
-                self._storage_profiler.StopTiming("write_existing")
+            if values_per_sequence_number:
+                self._CacheAttributeContainersForUpdate(
+                    plan, values_per_sequence_number
+                )
 
     def _WriteMetadata(self):
         """Writes metadata.
@@ -714,6 +2859,8 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
             raise OSError("Unable to query attribute container store") from exception
 
+        self._table_names.add("metadata")
+
         self._WriteMetadataValue("format_version", f"{self._FORMAT_VERSION:d}")
         self._WriteMetadataValue("serialization_format", self.serialization_format)
 
@@ -744,6 +2891,13 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
           OSError: when there is an error querying the attribute container store
               or if an unsupported attribute container is provided.
         """
+        plan = self._GetAttributeContainerPlan(container.CONTAINER_TYPE)
+
+        row_values = plan.SerializeAttributeContainer(container)
+
+        if isinstance(container, containers_interface.TrackedAttributeContainer):
+            container.ClearChangedAttributeNames()
+
         next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
             container.CONTAINER_TYPE
         )
@@ -756,35 +2910,95 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         )
         container.SetIdentifier(identifier)
 
-        schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
-        if not schema:
-            raise OSError(
-                f"Unsupported attribute container type: {container.CONTAINER_TYPE:s}"
+        self._CacheAttributeContainersForWrite(plan, [row_values])
+
+        self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
+
+    def _WriteNewAttributeContainers(self, containers):
+        """Writes new attribute containers to the store.
+
+        The attribute containers are serialized before any of them is assigned
+        an identifier, so that an unsupported attribute container does not leave
+        the store with partially written containers.
+
+        Args:
+          containers (list[AttributeContainer]): attribute containers.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
+        """
+        containers_per_type = {}
+        for container in containers:
+            containers_per_type.setdefault(container.CONTAINER_TYPE, []).append(
+                container
             )
 
-        column_names = []
-        row_values = []
-        for name, data_type in sorted(schema.items()):
-            attribute_value = getattr(container, name, None)
-            try:
-                row_value = self._schema_helper.SerializeValue(
-                    data_type, attribute_value
+        rows_per_type = {}
+        for container_type, containers_of_type in containers_per_type.items():
+            plan = self._GetAttributeContainerPlan(container_type)
+            rows_per_type[container_type] = (
+                plan,
+                [
+                    plan.SerializeAttributeContainer(container)
+                    for container in containers_of_type
+                ],
+            )
+
+        for container_type, (plan, rows) in rows_per_type.items():
+            containers_of_type = containers_per_type[container_type]
+
+            sequence_numbers = self._GetAttributeContainerNextSequenceNumbers(
+                container_type, len(rows)
+            )
+            if sequence_numbers[0] == 1 and not self._HasTable(container_type):
+                self._CreateAttributeContainerTable(container_type)
+
+            for sequence_number, container in zip(sequence_numbers, containers_of_type):
+                identifier = containers_interface.AttributeContainerIdentifier(
+                    name=container_type, sequence_number=sequence_number
                 )
-            except OSError as exception:
-                raise OSError(
-                    f"Unsupported attribute container type: "
-                    f"{container.CONTAINER_TYPE:s} attribute: {name:s} data type: "
-                    f"{data_type:s}"
-                ) from exception
+                container.SetIdentifier(identifier)
 
-            column_names.append(name)
-            row_values.append(row_value)
+                if isinstance(
+                    container, containers_interface.TrackedAttributeContainer
+                ):
+                    container.ClearChangedAttributeNames()
 
-        self._CacheAttributeContainerForWrite(
-            container.CONTAINER_TYPE, column_names, row_values
-        )
+                self._CacheAttributeContainerByIndex(container, sequence_number - 1)
 
-        self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
+            self._CacheAttributeContainersForWrite(plan, rows)
+
+    def _WriteQueuedRows(self):
+        """Writes queued attribute container values, runs in the writer thread.
+
+        A queued item without values indicates that the current transaction
+        should be committed. After a failure the remaining queued values are
+        discarded until the failure has been reported by _JoinWriteQueue, which
+        is called when the write cache is flushed and when the store is closed.
+        """
+        cursor = self._connection.cursor()
+
+        while True:
+            queue_item = self._write_queue.get()
+            try:
+                if queue_item is None:
+                    break
+
+                if not self._write_queue_exception:
+                    plan, rows = queue_item
+                    try:
+                        if plan is None:
+                            self._CommitTransaction()
+                        else:
+                            self._InsertRows(cursor, plan, rows)
+                    # Any exception is stored, since the writer thread should
+                    # not stop before the queue has been drained.
+                    except Exception as exception:  # pylint: disable=broad-except
+                        self._write_queue_exception = exception
+
+            finally:
+                self._write_queue.task_done()
 
     @classmethod
     def CheckSupportedFormat(cls, path):
@@ -840,15 +3054,137 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
             raise OSError("Attribute container store already closed.")
 
         if self._connection:
-            self._Flush()
+            try:
+                self._Flush()
+
+            finally:
+                if self._writer_thread:
+                    self._write_queue.put(None)
+                    self._writer_thread.join()
+
+                    self._write_queue = None
+                    self._write_queue_exception = None
+                    self._writer_thread = None
 
             self._connection.close()
 
             self._connection = None
             self._cursor = None
+            self._table_names = set()
 
         self._is_open = False
 
+    def GetAggregatedAttributeValues(
+        self,
+        container_type,
+        function_name,
+        attribute_name=None,
+        group_by=None,
+        filter_expression=None,
+    ):
+        """Aggregates the attribute values of a specific type of attribute containers.
+
+        The values are aggregated by SQLite, without reading the attribute
+        containers. Attribute values that are None are ignored by the aggregate
+        functions, except for "count" without an attribute name, which counts
+        the attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          function_name (str): name of the aggregate function, which can be
+              "count", "max", "min" or "sum".
+          attribute_name (Optional[str]): name of the attribute to aggregate,
+              where None is only supported by "count".
+          group_by (Optional[str]): name of the attribute to group the attribute
+              containers by, where None represents all attribute containers.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
+
+        Returns:
+          object: aggregated value or a dictionary of the aggregated value per
+              value of the group by attribute, if provided. The aggregated value
+              of "count" is 0 and that of the other functions None if there are
+              no attribute values to aggregate.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
+          ValueError: if the aggregate function is not supported, the attribute
+              name is missing, an attribute is not defined by the schema or
+              the values of an attribute to group by or to aggregate, other
+              than count, are stored as JSON.
+        """
+        if function_name not in self._AGGREGATE_FUNCTION_NAMES:
+            raise ValueError(f"Unsupported aggregate function: {function_name!s}")
+
+        if not attribute_name and function_name != "count":
+            raise ValueError(
+                f"Missing attribute name for aggregate function: {function_name:s}"
+            )
+
+        schema = self._GetAttributeContainerSchema(container_type)
+        if not schema:
+            raise OSError(f"Unsupported attribute container type: {container_type:s}")
+
+        for name in (attribute_name, group_by):
+            if name and name not in schema:
+                raise ValueError(f"Unsupported attribute to aggregate: {name:s}")
+
+        # Values stored as JSON are compared and summed as strings by SQLite
+        # and their runtime values, such as lists, cannot be used to group by.
+        scalar_attribute_names = [group_by]
+        if function_name != "count":
+            scalar_attribute_names.append(attribute_name)
+
+        for name in scalar_attribute_names:
+            if name and self._schema_helper.IsJSONDataType(schema[name]):
+                raise ValueError(f"Unsupported attribute to aggregate: {name:s}")
+
+        expression = f"{function_name.upper():s}({attribute_name or '*':s})"
+
+        # Only the minimum and maximum are values of the attribute that need to
+        # be deserialized.
+        column_names = []
+        if group_by:
+            expression = f"{group_by:s}, {expression:s}"
+            column_names.append(group_by)
+        if function_name in ("max", "min"):
+            column_names.append(attribute_name)
+
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        # The residual expression is evaluated on attribute containers.
+        if residual_expression:
+            return super().GetAggregatedAttributeValues(
+                container_type,
+                function_name,
+                attribute_name=attribute_name,
+                group_by=group_by,
+                filter_expression=filter_expression,
+            )
+
+        query = f"SELECT {expression:s} FROM {container_type:s}"
+        if sql_filter_expression:
+            query = f"{query:s} WHERE {sql_filter_expression:s}"
+
+        if group_by:
+            query = f"{query:s} GROUP BY {group_by:s}"
+
+        rows = self._QueryAttributeContainers(
+            container_type, query, parameters=filter_parameters
+        )
+        rows = self._DeserializeQueryResults(container_type, column_names, rows)
+
+        if group_by:
+            return dict(rows)
+
+        if rows:
+            return rows[0][0]
+
+        return 0 if function_name == "count" else None
+
     def GetAttributeContainerByIdentifier(self, container_type, identifier):
         """Retrieves a specific type of container with a specific identifier.
 
@@ -867,12 +3203,16 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
             container_type, identifier.sequence_number - 1
         )
 
-    def GetAttributeContainerByIndex(self, container_type, index):
+    def GetAttributeContainerByIndex(self, container_type, index, attribute_names=None):
         """Retrieves a specific attribute container.
 
         Args:
           container_type (str): attribute container type.
           index (int): attribute container index.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. Note that the
+              store can return an attribute container with more attributes
+              than requested.
 
         Returns:
           AttributeContainer: attribute container or None if not available.
@@ -882,48 +3222,91 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
               or if an unsupported attribute container is provided.
         """
         container = self._GetCachedAttributeContainer(container_type, index)
+
+        if attribute_names is None:
+            # Attribute containers accessed sequentially or strided are read
+            # ahead into the read cache, unless already cached.
+            read_ahead_indexes = self._GetReadAheadIndexes(
+                container_type, index, is_cached=container is not None
+            )
+            if read_ahead_indexes:
+                containers = self.GetAttributeContainersByIndexes(
+                    container_type, read_ahead_indexes
+                )
+                return containers[0]
+
         if container:
             return container
 
-        self._CommitWriteCache(container_type)
-
         if not self._attribute_container_sequence_numbers[container_type]:
             return None
 
-        schema = self._GetAttributeContainerSchema(container_type)
-        if not schema:
-            raise OSError(f"Unsupported attribute container type: {container_type:s}")
+        plan = self._GetAttributeContainerPlan(container_type)
 
-        column_names = sorted(schema.keys())
+        column_names = plan.column_names
+        if attribute_names is not None:
+            column_names = [name for name in column_names if name in attribute_names]
 
-        column_names_string = ", ".join(column_names)
+        column_indexes = plan.GetColumnIndexes(column_names)
         row_number = index + 1
 
-        query = (
-            f"SELECT {column_names_string:s} FROM {container_type:s} WHERE "
-            f"rowid = {row_number:d}"
-        )
+        first_cached_sequence_number, write_cache = self._GetWriteCache(container_type)
+        if (
+            first_cached_sequence_number
+            <= row_number
+            < (first_cached_sequence_number + len(write_cache))
+        ):
+            # The attribute container has not been flushed yet, therefore read
+            # it from the write cache.
+            row_values = write_cache[row_number - first_cached_sequence_number]
+            row = [row_number]
+            row.extend([row_values[column_index] for column_index in column_indexes])
 
-        try:
-            self._cursor.execute(query)
-        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
-            raise OSError("Unable to query attribute container store") from exception
+        else:
+            if self._write_queue:
+                self._JoinWriteQueue()
 
-        if self._storage_profiler:
-            self._storage_profiler.StartTiming("get_container_by_index")
+            column_names_string = ", ".join(["_identifier", *column_names])
 
-        try:
-            row = self._cursor.fetchone()
+            query = (
+                f"SELECT {column_names_string:s} FROM {container_type:s} WHERE "
+                f"rowid = {row_number:d}"
+            )
+
+            try:
+                self._cursor.execute(query)
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(
+                    "Unable to query attribute container store"
+                ) from exception
 
-        finally:
             if self._storage_profiler:
-                self._storage_profiler.StopTiming("get_container_by_index")
+                self._storage_profiler.StartTiming("get_container_by_index")
 
-        if not row:
-            return None
+            try:
+                row = self._cursor.fetchone()
 
+            finally:
+                if self._storage_profiler:
+                    self._storage_profiler.StopTiming("get_container_by_index")
+
+            if not row:
+                return None
+
+            values = self._update_cache.get(container_type, {}).get(row_number)
+            if values:
+                # The attribute container has updates that have not been flushed
+                # yet, therefore apply these from the update cache.
+                row = list(row)
+                for row_index, column_index in enumerate(column_indexes, start=1):
+                    if column_index in values:
+                        row[row_index] = values[column_index]
+
+        row_deserializers, lazy_row_deserializers = self._GetRowDeserializers(
+            plan, column_names
+        )
         container = self._CreateAttributeContainerFromRow(
-            container_type, column_names, row, 0
+            container_type, row_deserializers, row, lazy_row_deserializers
         )
 
         identifier = containers_interface.AttributeContainerIdentifier(
@@ -931,16 +3314,56 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         )
         container.SetIdentifier(identifier)
 
-        self._CacheAttributeContainerByIndex(container, index)
+        # Partially populated attribute containers are not cached.
+        if attribute_names is None:
+            self._CacheAttributeContainerByIndex(container, index)
+
         return container
 
-    def GetAttributeContainers(self, container_type, filter_expression=None):
+    def GetAttributeContainers(
+        self,
+        container_type,
+        filter_expression=None,
+        attribute_names=None,
+        order_by=None,
+        start_index=None,
+        end_index=None,
+        limit=None,
+        after_key=None,
+    ):
         """Retrieves a specific type of stored attribute containers.
 
+        To page through the attribute containers in order of index, retrieve
+        the next page with start_index set to the index after that of the last
+        attribute container of the previous page. To page through the attribute
+        containers in order of an attribute, retrieve the next page with
+        after_key set to the value of the attribute and the index of the last
+        attribute container of the previous page.
+
         Args:
           container_type (str): attribute container type.
           filter_expression (Optional[str]): expression to filter the resulting
               attribute containers by.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. The attribute
+              containers are partially populated when only specific attributes
+              are retrieved, and should not be used to update the store,
+              unless these track changed attributes.
+          order_by (Optional[str]): name of the attribute to order the attribute
+              containers by, where attribute containers with the same value are
+              ordered by index. By default the attribute containers are ordered
+              by index.
+          start_index (Optional[int]): index of the first attribute container
+              to retrieve, where a negative index represents the first
+              attribute container.
+          end_index (Optional[int]): index after the last attribute container to
+              retrieve, where None represents all remaining attribute containers.
+          limit (Optional[int]): maximum number of attribute containers to
+              retrieve, where a limit of 0 or less retrieves no attribute
+              containers.
+          after_key (Optional[tuple[object, int]]): value of the attribute to
+              order by and index of the attribute container after which to
+              retrieve attribute containers in order.
 
         Returns:
           generator(AttributeContainer): attribute container generator.
@@ -948,61 +3371,423 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         Raises:
           OSError: when there is an error querying the attribute container store
               or if an unsupported attribute container is provided.
+          ValueError: if the attribute to order by is not defined by the schema
+              or its values are stored as JSON, or if an after key is provided
+              without an attribute to order by.
         """
         schema = self._GetAttributeContainerSchema(container_type)
         if not schema:
             raise OSError(f"Unsupported attribute container type: {container_type:s}")
 
-        column_names = sorted(schema.keys())
+        # Values stored as JSON are ordered as strings by SQLite, which differs
+        # from the order of their runtime values.
+        if order_by and (
+            order_by not in schema
+            or self._schema_helper.IsJSONDataType(schema[order_by])
+        ):
+            raise ValueError(f"Unsupported attribute to order by: {order_by:s}")
 
-        sql_filter_expression = None
-        if filter_expression:
-            expression_ast = ast.parse(filter_expression, mode="eval")
-            sql_filter_expression = self._ast_to_sql_helper.ConvertNode(
-                expression_ast.body
+        sql_after_key = None
+        if after_key is not None:
+            if not order_by:
+                raise ValueError("Unsupported after key without attribute to order by")
+
+            after_value, after_index = after_key
+            after_value = self._schema_helper.SerializeValue(
+                schema[order_by], after_value
             )
+            sql_after_key = (after_value, after_index + 1)
+
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        column_names = sorted(schema.keys())
+        if attribute_names is not None:
+            # The attributes referenced by the residual expression are retrieved
+            # as well to evaluate it on the attribute containers.
+            if residual_expression:
+                attribute_names = residual_expression.attribute_names.union(
+                    attribute_names
+                )
+            column_names = [name for name in column_names if name in attribute_names]
+
+        start_sequence_number = None
+        if start_index is not None:
+            start_sequence_number = start_index + 1
 
         return self._GetAttributeContainersWithFilter(
             container_type,
             column_names=column_names,
             filter_expression=sql_filter_expression,
+            filter_parameters=filter_parameters,
+            residual_expression=residual_expression,
+            order_by=order_by,
+            start_sequence_number=start_sequence_number,
+            end_sequence_number=end_index,
+            limit=limit,
+            after_key=sql_after_key,
+        )
+
+    def GetAttributeContainersByIndexes(
+        self, container_type, indexes, attribute_names=None
+    ):
+        """Retrieves specific attribute containers by their indexes.
+
+        Attribute containers that are cached are retrieved from the cache,
+        the others are read with as few queries as possible.
+
+        Args:
+          container_type (str): attribute container type.
+          indexes (Iterable[int]): attribute container indexes.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes. Note that the
+              store can return attribute containers with more attributes than
+              requested.
+
+        Returns:
+          list[AttributeContainer]: attribute containers in the order of
+              the indexes, where None represents an attribute container that
+              is not available.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
+        """
+        indexes = list(indexes)
+        containers = [None] * len(indexes)
+
+        # Positions in the result per row number of the attribute containers
+        # that are not cached.
+        positions_per_row_number = {}
+        for position, index in enumerate(indexes):
+            container = self._GetCachedAttributeContainer(container_type, index)
+            if container:
+                containers[position] = container
+            else:
+                positions_per_row_number.setdefault(index + 1, []).append(position)
+
+        if (
+            not positions_per_row_number
+            or not self._attribute_container_sequence_numbers[container_type]
+        ):
+            return containers
+
+        plan = self._GetAttributeContainerPlan(container_type)
+
+        column_names = plan.column_names
+        if attribute_names is not None:
+            column_names = [name for name in column_names if name in attribute_names]
+
+        column_indexes = plan.GetColumnIndexes(column_names)
+
+        first_cached_sequence_number, write_cache = self._GetWriteCache(container_type)
+
+        rows = []
+        row_numbers = []
+        for row_number in sorted(positions_per_row_number.keys()):
+            if (
+                first_cached_sequence_number
+                <= row_number
+                < (first_cached_sequence_number + len(write_cache))
+            ):
+                # The attribute container has not been flushed yet, therefore read
+                # it from the write cache.
+                row_values = write_cache[row_number - first_cached_sequence_number]
+                row = [row_number]
+                row.extend(
+                    [row_values[column_index] for column_index in column_indexes]
+                )
+                rows.append(row)
+
+            elif 1 <= row_number < first_cached_sequence_number:
+                row_numbers.append(row_number)
+
+        if row_numbers:
+            rows.extend(
+                self._GetRowsByRowNumbers(container_type, column_names, row_numbers)
+            )
+
+        row_deserializers, lazy_row_deserializers = self._GetRowDeserializers(
+            plan, column_names
+        )
+
+        for row in rows:
+            row_number = row[0]
+
+            container = self._CreateAttributeContainerFromRow(
+                container_type, row_deserializers, row, lazy_row_deserializers
+            )
+
+            identifier = containers_interface.AttributeContainerIdentifier(
+                name=container_type, sequence_number=row_number
+            )
+            container.SetIdentifier(identifier)
+
+            # Partially populated attribute containers are not cached.
+            if attribute_names is None:
+                self._CacheAttributeContainerByIndex(container, row_number - 1)
+
+            for position in positions_per_row_number[row_number]:
+                containers[position] = container
+
+        return containers
+
+    def GetDistinctAttributeValues(
+        self, container_type, attribute_name, filter_expression=None
+    ):
+        """Retrieves the distinct values of an attribute.
+
+        The distinct values are determined by SQLite, without reading
+        the attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          attribute_name (str): name of the attribute.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
+
+        Returns:
+          list[object]: distinct values of the attribute, in no specific order,
+              where None represents attribute containers without a value.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
+          ValueError: if the attribute is not defined by the schema.
+        """
+        schema = self._GetAttributeContainerSchema(container_type)
+        if not schema:
+            raise OSError(f"Unsupported attribute container type: {container_type:s}")
+
+        if attribute_name not in schema:
+            raise ValueError(f"Unsupported attribute: {attribute_name!s}")
+
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        # The residual expression is evaluated on attribute containers.
+        if residual_expression:
+            return super().GetDistinctAttributeValues(
+                container_type, attribute_name, filter_expression=filter_expression
+            )
+
+        query = f"SELECT DISTINCT {attribute_name:s} FROM {container_type:s}"
+        if sql_filter_expression:
+            query = f"{query:s} WHERE {sql_filter_expression:s}"
+
+        rows = self._QueryAttributeContainers(
+            container_type, query, parameters=filter_parameters
         )
+        rows = self._DeserializeQueryResults(container_type, [attribute_name], rows)
+        return [values[0] for values in rows]
 
-    def GetNumberOfAttributeContainers(self, container_type):
+    def GetNumberOfAttributeContainers(self, container_type, filter_expression=None):
         """Retrieves the number of a specific type of attribute containers.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
-          int: the number of containers of a specified type.
+          int: the number of containers of a specified type, that match the filter
+              expression if provided.
         """
-        return self._attribute_container_sequence_numbers[container_type]
+        number_of_containers = self._attribute_container_sequence_numbers[
+            container_type
+        ]
+        if not filter_expression or not number_of_containers:
+            return number_of_containers
+
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        # The residual expression is evaluated on attribute containers.
+        if residual_expression:
+            containers = self.GetAttributeContainers(
+                container_type, filter_expression=filter_expression, attribute_names=[]
+            )
+            return sum(1 for _ in containers)
+
+        query = (
+            f"SELECT COUNT(*) FROM {container_type:s} WHERE "
+            f"{sql_filter_expression:s}"
+        )
+        rows = self._QueryAttributeContainers(
+            container_type, query, parameters=filter_parameters
+        )
+        return rows[0][0] if rows else 0
 
-    def HasAttributeContainers(self, container_type):
+    def HasAttributeContainers(self, container_type, filter_expression=None):
         """Determines if store contains a specific type of attribute containers.
 
         Args:
           container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the attribute
+              containers by.
 
         Returns:
           bool: True if the store contains the specified type of attribute
-              containers.
+              containers, that match the filter expression if provided.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store.
+        """
+        has_containers = self._attribute_container_sequence_numbers[container_type] > 0
+        if not filter_expression or not has_containers:
+            return has_containers
+
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        # The residual expression is evaluated on attribute containers.
+        if residual_expression:
+            containers = self.GetAttributeContainers(
+                container_type,
+                filter_expression=filter_expression,
+                attribute_names=[],
+                limit=1,
+            )
+            return any(True for _ in containers)
+
+        query = (
+            f"SELECT 1 FROM {container_type:s} WHERE {sql_filter_expression:s} "
+            f"LIMIT 1"
+        )
+        rows = self._QueryAttributeContainers(
+            container_type, query, parameters=filter_parameters
+        )
+        return bool(rows)
+
+    def IterateAttributeValues(
+        self, container_type, attribute_names=None, filter_expression=None
+    ):
+        """Iterates the attribute values of a specific type of attribute containers.
+
+        This method allows to read attribute values without the overhead of
+        creating attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          attribute_names (Optional[list[str]]): names of the attributes to
+              retrieve, where None represents all attributes of the schema
+              sorted by name.
+          filter_expression (Optional[str]): expression to filter the resulting
+              attribute containers by.
+
+        Yields:
+          tuple[int, tuple[object]]: sequence number of the attribute container
+              and the values of the attributes, in the order of the attribute
+              names, where None represents an attribute without a value.
+
+        Raises:
+          OSError: when there is an error querying the attribute container store
+              or if an unsupported attribute container is provided.
         """
-        return self._attribute_container_sequence_numbers[container_type] > 0
+        sql_filter_expression, filter_parameters, residual_expression = (
+            self._GetSQLFilterExpression(container_type, filter_expression)
+        )
+
+        # The residual expression is evaluated on attribute containers.
+        if residual_expression:
+            yield from super().IterateAttributeValues(
+                container_type,
+                attribute_names=attribute_names,
+                filter_expression=filter_expression,
+            )
+            return
+
+        plan = self._GetAttributeContainerPlan(container_type)
+
+        if attribute_names is None:
+            attribute_names = plan.column_names
+
+        column_names = [name for name in attribute_names if name in plan.column_names]
+
+        # Attributes that are not defined by the schema have no value.
+        value_indexes = None
+        if len(column_names) != len(attribute_names):
+            column_indexes = {name: index for index, name in enumerate(column_names)}
+            value_indexes = [column_indexes.get(name) for name in attribute_names]
+
+        deserialize_functions = [
+            (row_index, deserialize_function)
+            for row_index, _, deserialize_function in plan.GetRowDeserializers(
+                column_names, 1
+            )
+            if deserialize_function
+        ]
+
+        for rows in self._GetRowsWithFilter(
+            container_type,
+            column_names,
+            filter_expression=sql_filter_expression,
+            filter_parameters=filter_parameters,
+        ):
+            for row in rows:
+                if deserialize_functions:
+                    row = list(row)
+                    for row_index, deserialize_function in deserialize_functions:
+                        value = row[row_index]
+                        if value is not None:
+                            row[row_index] = deserialize_function(value)
+
+                values = tuple(row[1:])
+                if value_indexes is not None:
+                    values = tuple(
+                        None if value_index is None else values[value_index]
+                        for value_index in value_indexes
+                    )
 
-    def Open(self, path=None, read_only=True, **unused_kwargs):
+                yield row[0], values
+
+    def Open(
+        self,
+        path=None,
+        read_only=True,
+        use_writer_thread=False,
+        commit_interval=None,
+        commit_number_of_rows=None,
+        commit_size=None,
+        lazy_deserialization=False,
+        **unused_kwargs,
+    ):
         """Opens the store.
 
+        By default new attribute containers are committed when the store is
+        closed. A commit policy can be defined to commit periodically instead,
+        which bounds the size of the journal when writing large stores. The
+        commit policy is checked when the write cache is flushed.
+
         Args:
           path (Optional[str]): path to the attribute container store.
           read_only (Optional[bool]): True if the file should be opened in
               read-only mode.
+          use_writer_thread (Optional[bool]): True if new attribute containers
+              should be written by a separate writer thread, which allows
+              attribute containers to be serialized while previously flushed
+              ones are being written. This requires the sqlite3 module to be
+              thread-safe in serialized mode, since the connection is shared
+              with the writer thread.
+          commit_interval (Optional[float]): number of seconds after which
+              written attribute containers should be committed.
+          commit_number_of_rows (Optional[int]): number of written attribute
+              containers after which these should be committed.
+          commit_size (Optional[int]): estimated size, in bytes, of written
+              attribute containers after which these should be committed.
+          lazy_deserialization (Optional[bool]): True if attribute values that
+              are stored as JSON should be deserialized when the attribute is
+              first accessed, instead of when the attribute container is read.
 
         Raises:
           OSError: if the attribute container store is already opened or if
               the database cannot be connected.
-          ValueError: if path is missing.
+          ValueError: if path is missing or if a writer thread is requested
+              and the sqlite3 module is not thread-safe in serialized mode.
         """
         if self._is_open:
             raise OSError("Attribute container store already opened.")
@@ -1010,6 +3795,12 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         if not path:
             raise ValueError("Missing path.")
 
+        use_writer_thread = bool(use_writer_thread and not read_only)
+        if use_writer_thread and sqlite3.threadsafety != 3:
+            raise ValueError(
+                "Writer thread not supported, sqlite3 module is not thread-safe."
+            )
+
         path = os.path.abspath(path)
 
         try:
@@ -1022,16 +3813,23 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
 
         detect_types = sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
 
+        # The writer thread writes by means of the connection of the store.
+        check_same_thread = not use_writer_thread
+
         if path_uri:
             connection = sqlite3.connect(
                 path_uri,
+                check_same_thread=check_same_thread,
                 detect_types=detect_types,
                 isolation_level="DEFERRED",
                 uri=True,
             )
         else:
             connection = sqlite3.connect(
-                path, detect_types=detect_types, isolation_level="DEFERRED"
+                path,
+                check_same_thread=check_same_thread,
+                detect_types=detect_types,
+                isolation_level="DEFERRED",
             )
 
         try:
@@ -1050,10 +3848,27 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
         if not cursor:
             return
 
+        try:
+            self._maximum_number_of_variables = connection.getlimit(
+                sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER
+            )
+        except AttributeError:
+            # Connection.getlimit() was added in Python 3.11.
+            self._maximum_number_of_variables = self._MAXIMUM_NUMBER_OF_VARIABLES
+
+        self._commit_interval = commit_interval
+        self._commit_number_of_rows = commit_number_of_rows
+        self._commit_size = commit_size
         self._connection = connection
         self._cursor = cursor
         self._is_open = True
+        self._last_commit_time = time.monotonic()
+        self._lazy_deserialization = bool(lazy_deserialization)
         self._read_only = read_only
+        self._uncommitted_number_of_rows = 0
+        self._uncommitted_size = 0
+
+        self._ReadTableNames()
 
         if read_only:
             self._ReadAndCheckStorageMetadata(check_readable_only=True)
@@ -1078,3 +3893,10 @@ class SQLiteAttributeContainerStore(interface.AttributeContainerStoreWithReadCac
             self._SetAttributeContainerNextSequenceNumber(
                 container_type, next_sequence_number
             )
+
+        if use_writer_thread:
+            self._write_queue = queue.Queue(maxsize=self._MAXIMUM_WRITE_QUEUE_SIZE)
+            self._writer_thread = threading.Thread(
+                target=self._WriteQueuedRows, name="acstore_writer", daemon=True
+            )
+            self._writer_thread.start()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for the attribute container interface."""
 
+import copy
+import pickle
 import unittest
 
 from acstore.containers import interface
@@ -183,6 +185,113 @@ class AttributeContainerTest(test_lib.BaseTestCase):
 
         attribute_container.SetIdentifier(None)
 
+    def testSetSerializedAttributeValues(self):
+        """Tests the SetSerializedAttributeValues function."""
+        attribute_container = interface.AttributeContainer()
+        attribute_container.name = None
+        attribute_container.SetSerializedAttributeValues(
+            {"name": (str.upper, "value"), "other": (str.upper, "other")}
+        )
+
+        self.assertEqual(
+            sorted(attribute_container.GetAttributeNames()), ["name", "other"]
+        )
+        self.assertNotIn("name", attribute_container.__dict__)
+        self.assertIs(type(attribute_container), interface.AttributeContainer)
+
+        self.assertEqual(attribute_container.name, "VALUE")
+        self.assertEqual(attribute_container.__dict__["name"], "VALUE")
+        self.assertIs(type(attribute_container), interface.AttributeContainer)
+
+        with self.assertRaises(AttributeError):
+            _ = attribute_container.bogus  # pylint: disable=no-member
+
+        attribute_container.other = "changed"
+        self.assertEqual(
+            attribute_container.CopyToDict(), {"name": "VALUE", "other": "changed"}
+        )
+        self.assertNotIn("_serialized_attribute_values", attribute_container.__dict__)
+        self.assertIs(type(attribute_container), interface.AttributeContainer)
+
+        attribute_container = interface.AttributeContainer()
+        attribute_container.SetSerializedAttributeValues({"name": (str.upper, "value")})
+
+        result = attribute_container.MatchesExpression('name == "VALUE"')
+        self.assertTrue(result)
+        self.assertIs(type(attribute_container), interface.AttributeContainer)
+
+        # Test that attribute containers without serialized attribute values
+        # raise on lookups of missing attributes.
+        attribute_container = interface.AttributeContainer()
+        with self.assertRaises(AttributeError):
+            _ = attribute_container.name  # pylint: disable=no-member
+
+        attribute_container = interface.AttributeContainer()
+        attribute_container.SetSerializedAttributeValues({"name": (str.upper, "value")})
+
+        copied_attribute_container = copy.deepcopy(attribute_container)
+        self.assertIs(type(copied_attribute_container), interface.AttributeContainer)
+        self.assertEqual(copied_attribute_container.name, "VALUE")
+
+        attribute_container = interface.AttributeContainer()
+        attribute_container.SetSerializedAttributeValues({"name": (str.upper, "value")})
+
+        pickled_attribute_container = pickle.loads(pickle.dumps(attribute_container))
+        self.assertIs(type(pickled_attribute_container), interface.AttributeContainer)
+        self.assertEqual(pickled_attribute_container.name, "VALUE")
+
+        # Test that subclasses keep their type.
+        attribute_container = interface.TrackedAttributeContainer()
+        attribute_container.SetSerializedAttributeValues({"name": (str.upper, "value")})
+        self.assertIs(type(attribute_container), interface.TrackedAttributeContainer)
+
+        self.assertEqual(attribute_container.name, "VALUE")
+        self.assertIs(type(attribute_container), interface.TrackedAttributeContainer)
+        self.assertEqual(attribute_container.GetChangedAttributeNames(), set())
+
+
+class TrackedAttributeContainerTest(test_lib.BaseTestCase):
+    """Tests for the attribute container interface with change tracking."""
+
+    # pylint: disable=protected-access
+
+    def testClearChangedAttributeNames(self):
+        """Tests the ClearChangedAttributeNames function."""
+        attribute_container = interface.TrackedAttributeContainer()
+        attribute_container.attribute_name = "MyName"
+
+        attribute_container.ClearChangedAttributeNames()
+
+        changed_attribute_names = attribute_container.GetChangedAttributeNames()
+        self.assertEqual(changed_attribute_names, set())
+
+    def testCopyFromDict(self):
+        """Tests the CopyFromDict function."""
+        attribute_container = interface.TrackedAttributeContainer()
+
+        attribute_container.CopyFromDict(
+            {"_protected_attribute": "protected", "attribute_name": "MyName"}
+        )
+
+        changed_attribute_names = attribute_container.GetChangedAttributeNames()
+        self.assertEqual(changed_attribute_names, {"attribute_name"})
+
+    def testGetChangedAttributeNames(self):
+        """Tests the GetChangedAttributeNames function."""
+        attribute_container = interface.TrackedAttributeContainer()
+
+        changed_attribute_names = attribute_container.GetChangedAttributeNames()
+        self.assertEqual(changed_attribute_names, set())
+
+        attribute_container._protected_attribute = "protected"
+        attribute_container.attribute_name = "MyName"
+        attribute_container.attribute_value = "MyValue"
+
+        changed_attribute_names = attribute_container.GetChangedAttributeNames()
+        self.assertEqual(changed_attribute_names, {"attribute_name", "attribute_value"})
+
+        self.assertEqual(attribute_container.attribute_name, "MyName")
+
 
 if __name__ == "__main__":
     unittest.main()
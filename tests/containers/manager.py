@@ -50,6 +50,24 @@ class AttributeContainersManagerTest(shared_test_lib.BaseTestCase):
                 shared_test_lib.TestAttributeContainer
             )
 
+    def testGetRevision(self):
+        """Tests the GetRevision function."""
+        revision = self._TEST_MANAGER.GetRevision()
+
+        self._TEST_MANAGER.RegisterAttributeContainer(
+            shared_test_lib.TestAttributeContainer
+        )
+
+        try:
+            self.assertEqual(self._TEST_MANAGER.GetRevision(), revision + 1)
+
+        finally:
+            self._TEST_MANAGER.DeregisterAttributeContainer(
+                shared_test_lib.TestAttributeContainer
+            )
+
+        self.assertEqual(self._TEST_MANAGER.GetRevision(), revision + 2)
+
     def testGetSchema(self):
         """Tests the GetSchema function."""
         self._TEST_MANAGER.RegisterAttributeContainer(
@@ -103,6 +103,81 @@ class FakeAttributeContainerStoreTest(test_lib.BaseTestCase):
         with self.assertRaises(OSError):
             test_store.AddAttributeContainer(attribute_container)
 
+    def testAddAttributeContainers(self):
+        """Tests the AddAttributeContainers function."""
+        attribute_containers = [test_lib.TestAttributeContainer() for _ in range(3)]
+
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        test_store.AddAttributeContainers(attribute_containers)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            "test_container"
+        )
+        self.assertEqual(number_of_containers, 3)
+
+        identifier = attribute_containers[2].GetIdentifier()
+        self.assertEqual(identifier.sequence_number, 3)
+
+        test_store.Close()
+
+        with self.assertRaises(OSError):
+            test_store.AddAttributeContainers(attribute_containers)
+
+    def testGetAggregatedAttributeValues(self):
+        """Tests the GetAggregatedAttributeValues function."""
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        value = test_store.GetAggregatedAttributeValues("test_container", "count")
+        self.assertEqual(value, 0)
+
+        value = test_store.GetAggregatedAttributeValues(
+            "test_container", "max", attribute_name="attribute"
+        )
+        self.assertIsNone(value)
+
+        for attribute in ("value2", "value1", "value2", None):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = attribute
+            test_store.AddAttributeContainer(attribute_container)
+
+        value = test_store.GetAggregatedAttributeValues("test_container", "count")
+        self.assertEqual(value, 4)
+
+        value = test_store.GetAggregatedAttributeValues(
+            "test_container", "count", attribute_name="attribute"
+        )
+        self.assertEqual(value, 3)
+
+        value = test_store.GetAggregatedAttributeValues(
+            "test_container", "min", attribute_name="attribute"
+        )
+        self.assertEqual(value, "value1")
+
+        values = test_store.GetAggregatedAttributeValues(
+            "test_container", "count", group_by="attribute"
+        )
+        self.assertEqual(values, {None: 1, "value1": 1, "value2": 2})
+
+        value = test_store.GetAggregatedAttributeValues(
+            "test_container",
+            "count",
+            filter_expression='attribute == "value2"',
+        )
+        self.assertEqual(value, 2)
+
+        with self.assertRaises(ValueError):
+            test_store.GetAggregatedAttributeValues(
+                "test_container", "avg", attribute_name="attribute"
+            )
+
+        with self.assertRaises(ValueError):
+            test_store.GetAggregatedAttributeValues("test_container", "sum")
+
+        test_store.Close()
+
     def testGetAttributeContainerByIdentifier(self):
         """Tests the GetAttributeContainerByIdentifier function."""
         attribute_container = test_lib.TestAttributeContainer()
@@ -186,9 +261,155 @@ class FakeAttributeContainerStoreTest(test_lib.BaseTestCase):
 
         test_store.Close()
 
+    def testGetAttributeContainersByIndexes(self):
+        """Tests the GetAttributeContainersByIndexes function."""
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        for index in range(3):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{index:d}"
+            test_store.AddAttributeContainer(attribute_container)
+
+        containers = test_store.GetAttributeContainersByIndexes(
+            "test_container", [2, 0, 5]
+        )
+        self.assertEqual(len(containers), 3)
+        self.assertEqual(containers[0].attribute, "value2")
+        self.assertEqual(containers[1].attribute, "value0")
+        self.assertIsNone(containers[2])
+
+        test_store.Close()
+
+    def testGetAttributeContainersWithAttributeNames(self):
+        """Tests the GetAttributeContainers function with attribute names."""
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "value"
+
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        test_store.AddAttributeContainer(attribute_container)
+
+        containers = list(
+            test_store.GetAttributeContainers("test_container", attribute_names=[])
+        )
+        self.assertEqual(len(containers), 1)
+        self.assertIsNone(containers[0].attribute)
+        self.assertEqual(
+            containers[0].GetIdentifier().CopyToString(),
+            attribute_container.GetIdentifier().CopyToString(),
+        )
+
+        containers = list(
+            test_store.GetAttributeContainers(
+                "test_container", attribute_names=["attribute"]
+            )
+        )
+        self.assertEqual(len(containers), 1)
+        self.assertEqual(containers[0].attribute, "value")
+
+        container = test_store.GetAttributeContainerByIndex(
+            "test_container", 0, attribute_names=[]
+        )
+        self.assertIsNone(container.attribute)
+
+        test_store.Close()
+
+    def testGetAttributeContainersWithOrderAndRange(self):
+        """Tests the GetAttributeContainers function with order and range."""
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        for index in range(4):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{3 - index:d}"
+            test_store.AddAttributeContainer(attribute_container)
+
+        containers = list(
+            test_store.GetAttributeContainers("test_container", start_index=1, limit=2)
+        )
+        self.assertEqual(
+            [container.attribute for container in containers], ["value2", "value1"]
+        )
+
+        containers = list(
+            test_store.GetAttributeContainers(
+                "test_container", order_by="attribute", end_index=3
+            )
+        )
+        self.assertEqual(
+            [container.attribute for container in containers],
+            ["value1", "value2", "value3"],
+        )
+
+        containers = list(
+            test_store.GetAttributeContainers(
+                "test_container", order_by="attribute", after_key=("value1", 2)
+            )
+        )
+        self.assertEqual(
+            [container.attribute for container in containers], ["value2", "value3"]
+        )
+
+        with self.assertRaises(ValueError):
+            list(
+                test_store.GetAttributeContainers(
+                    "test_container", after_key=("value1", 2)
+                )
+            )
+
+        # Negative indexes are not relative to the end.
+        containers = list(
+            test_store.GetAttributeContainers("test_container", start_index=-1)
+        )
+        self.assertEqual(len(containers), 4)
+
+        containers = list(
+            test_store.GetAttributeContainers("test_container", end_index=-1)
+        )
+        self.assertEqual(containers, [])
+
+        containers = list(test_store.GetAttributeContainers("test_container", limit=-1))
+        self.assertEqual(containers, [])
+
+        test_store.Close()
+
+    def testGetDistinctAttributeValues(self):
+        """Tests the GetDistinctAttributeValues function."""
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        values = test_store.GetDistinctAttributeValues("test_container", "attribute")
+        self.assertEqual(values, [])
+
+        for attribute in ("value2", "value1", "value2"):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = attribute
+            test_store.AddAttributeContainer(attribute_container)
+
+        values = test_store.GetDistinctAttributeValues("test_container", "attribute")
+        self.assertEqual(sorted(values), ["value1", "value2"])
+
+        values = test_store.GetDistinctAttributeValues(
+            "test_container", "attribute", filter_expression='attribute == "value1"'
+        )
+        self.assertEqual(values, ["value1"])
+
+        for attribute in (["value1"], ["value1"], None, "value1"):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = attribute
+            test_store.AddAttributeContainer(attribute_container)
+
+        values = test_store.GetDistinctAttributeValues("test_container", "attribute")
+        self.assertEqual(values, ["value2", "value1", ["value1"], None])
+
+        test_store.Close()
+
     def testGetNumberOfAttributeContainers(self):
         """Tests the GetNumberOfAttributeContainers function."""
         attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "value"
 
         test_store = fake_store.FakeAttributeContainerStore()
         test_store.Open()
@@ -205,6 +426,16 @@ class FakeAttributeContainerStoreTest(test_lib.BaseTestCase):
         )
         self.assertEqual(number_of_containers, 1)
 
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            attribute_container.CONTAINER_TYPE, filter_expression='attribute == "value"'
+        )
+        self.assertEqual(number_of_containers, 1)
+
+        number_of_containers = test_store.GetNumberOfAttributeContainers(
+            attribute_container.CONTAINER_TYPE, filter_expression='attribute == "x"'
+        )
+        self.assertEqual(number_of_containers, 0)
+
         test_store.Close()
 
     def testHasAttributeContainers(self):
@@ -222,6 +453,45 @@ class FakeAttributeContainerStoreTest(test_lib.BaseTestCase):
         result = test_store.HasAttributeContainers(attribute_container.CONTAINER_TYPE)
         self.assertTrue(result)
 
+        result = test_store.HasAttributeContainers(
+            attribute_container.CONTAINER_TYPE, filter_expression='attribute == "x"'
+        )
+        self.assertFalse(result)
+
+        test_store.Close()
+
+    def testIterateAttributeValues(self):
+        """Tests the IterateAttributeValues function."""
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "8f0bf95a7959baad9666b21a7feed79d"
+
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        test_store.AddAttributeContainer(attribute_container)
+        test_store.AddAttributeContainer(test_lib.TestAttributeContainer())
+
+        values = list(
+            test_store.IterateAttributeValues(
+                attribute_container.CONTAINER_TYPE,
+                attribute_names=["attribute", "bogus"],
+            )
+        )
+        self.assertEqual(
+            values,
+            [(1, ("8f0bf95a7959baad9666b21a7feed79d", None)), (2, (None, None))],
+        )
+
+        filter_expression = 'attribute == "8f0bf95a7959baad9666b21a7feed79d"'
+        values = list(
+            test_store.IterateAttributeValues(
+                attribute_container.CONTAINER_TYPE,
+                attribute_names=["attribute"],
+                filter_expression=filter_expression,
+            )
+        )
+        self.assertEqual(values, [(1, ("8f0bf95a7959baad9666b21a7feed79d",))])
+
         test_store.Close()
 
     def testOpenClose(self):
@@ -278,6 +548,29 @@ class FakeAttributeContainerStoreTest(test_lib.BaseTestCase):
 
         test_store.Close()
 
+    def testUpdateAttributeContainers(self):
+        """Tests the UpdateAttributeContainers function."""
+        attribute_containers = [test_lib.TestAttributeContainer() for _ in range(3)]
+
+        test_store = fake_store.FakeAttributeContainerStore()
+        test_store.Open()
+
+        with self.assertRaises(OSError):
+            test_store.UpdateAttributeContainers(attribute_containers)
+
+        test_store.AddAttributeContainers(attribute_containers)
+
+        attribute_containers[1].attribute = "updated"
+        test_store.UpdateAttributeContainers(attribute_containers)
+
+        container = test_store.GetAttributeContainerByIndex("test_container", 1)
+        self.assertEqual(container.attribute, "updated")
+
+        test_store.Close()
+
+        with self.assertRaises(OSError):
+            test_store.UpdateAttributeContainers(attribute_containers)
+
 
 if __name__ == "__main__":
     unittest.main()
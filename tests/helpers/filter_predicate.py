@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Tests for the filter predicate helper."""
+
+import ast
+import unittest
+
+from acstore.containers import interface as containers_interface
+from acstore.helpers import filter_predicate
+
+from tests import test_lib as shared_test_lib
+
+
+class FilterPredicateHelperTest(shared_test_lib.BaseTestCase):
+    """Tests for the filter predicate helper."""
+
+    # pylint: disable=protected-access
+
+    _FILTER_EXPRESSIONS = [
+        'name == "value"',
+        'name != "value"',
+        "size > 1 and size <= 8",
+        "1 < size < 8",
+        "size in (1, 2, 4)",
+        "size not in [1, 2]",
+        "size is None",
+        "not visible",
+        "-size < -2",
+        "~size == -5",
+        "size * 2 + 1 == 9",
+        "size % 3 == 1 or size // 3 == 2",
+        "name or size",
+        'name.startswith("val")',
+        'name.upper()[0] == "V"',
+        "items[1] == 2",
+        "items[0:2] == [1, 2]",
+        "size in items",
+        "len(items) == 3",
+        "parent == 'event.1'",
+        "_private == 1",
+        "bogus == 1",
+        "CONTAINER_TYPE == 'test'",
+        "any(item > 2 for item in items)",
+        "(lambda: True)()",
+    ]
+
+    def _CreateTestAttributeContainers(self):
+        """Creates attribute containers for testing.
+
+        Returns:
+          list[AttributeContainer]: attribute containers.
+        """
+        attribute_container1 = containers_interface.AttributeContainer()
+        attribute_container1.items = [1, 2, 3]
+        attribute_container1.name = "value"
+        attribute_container1.parent = containers_interface.AttributeContainerIdentifier(
+            name="event", sequence_number=1
+        )
+        attribute_container1.size = 4
+        attribute_container1.visible = True
+        attribute_container1._private = 1
+
+        attribute_container2 = containers_interface.AttributeContainer()
+        attribute_container2.name = None
+        attribute_container2.size = 2
+        attribute_container2.visible = False
+
+        attribute_container3 = containers_interface.AttributeContainer()
+        attribute_container3.size = None
+        attribute_container3.SetSerializedAttributeValues(
+            {"name": (str.lower, "VALUE"), "size": (int, "8")}
+        )
+
+        return [attribute_container1, attribute_container2, attribute_container3]
+
+    def testCompilePredicate(self):
+        """Tests the CompilePredicate function."""
+        attribute_containers = self._CreateTestAttributeContainers()
+
+        for filter_expression in self._FILTER_EXPRESSIONS:
+            predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+                filter_expression
+            )
+            for attribute_container in attribute_containers:
+                expected_result = bool(
+                    attribute_container.MatchesExpression(filter_expression)
+                )
+                result = bool(predicate(attribute_container))
+                self.assertEqual(result, expected_result, filter_expression)
+
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+            'parent == "event.1" and size == 4'
+        )
+        self.assertTrue(predicate(attribute_containers[0]))
+        self.assertFalse(predicate(attribute_containers[1]))
+
+        # Test that the attribute values are deserialized on access.
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+            'name == "value"'
+        )
+        attribute_container = containers_interface.AttributeContainer()
+        attribute_container.SetSerializedAttributeValues(
+            {"name": (str.lower, "VALUE"), "size": (int, "8")}
+        )
+        self.assertTrue(predicate(attribute_container))
+        self.assertEqual(
+            list(attribute_container.__dict__["_serialized_attribute_values"].keys()),
+            ["size"],
+        )
+
+        with self.assertRaises(SyntaxError):
+            filter_predicate.FilterPredicateHelper.CompilePredicate("size ==")
+
+    def testCompilePredicateWithCache(self):
+        """Tests the CompilePredicate function with cached predicates."""
+        filter_predicate.FilterPredicateHelper._predicates.clear()
+
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicate("size == 1")
+        cached_predicate = filter_predicate.FilterPredicateHelper.CompilePredicate(
+            "size == 1"
+        )
+        self.assertIs(cached_predicate, predicate)
+
+        maximum_cached_predicates = (
+            filter_predicate.FilterPredicateHelper._MAXIMUM_CACHED_PREDICATES
+        )
+        for size in range(maximum_cached_predicates):
+            filter_predicate.FilterPredicateHelper.CompilePredicate(f"size > {size:d}")
+
+        self.assertEqual(
+            len(filter_predicate.FilterPredicateHelper._predicates),
+            maximum_cached_predicates,
+        )
+        self.assertNotIn(
+            "size == 1", filter_predicate.FilterPredicateHelper._predicates
+        )
+
+    def testCompilePredicateFromAST(self):
+        """Tests the CompilePredicateFromAST function."""
+        attribute_container = containers_interface.AttributeContainer()
+        attribute_container.items = [1, 2, 3]
+        attribute_container.size = 4
+
+        expression_ast = ast.parse("size > 2", mode="eval")
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicateFromAST(
+            expression_ast
+        )
+        self.assertTrue(predicate(attribute_container))
+        self.assertEqual(predicate.attribute_names, {"size"})
+
+        # Test an expression that is evaluated with MatchesExpression.
+        expression_ast = ast.parse("[item for item in items if item > 2]", mode="eval")
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicateFromAST(
+            expression_ast
+        )
+        self.assertTrue(predicate(attribute_container))
+
+        attribute_container.items = [1, 2]
+        self.assertFalse(predicate(attribute_container))
+
+        self.assertEqual(predicate.attribute_names, {"item", "items"})
+
+        # Test an expression without locations, such as a constructed one.
+        expression_ast = ast.Expression(
+            body=ast.BoolOp(
+                op=ast.And(),
+                values=[
+                    ast.parse("size > 2", mode="eval").body,
+                    ast.parse("[item for item in items]", mode="eval").body,
+                ],
+            )
+        )
+        predicate = filter_predicate.FilterPredicateHelper.CompilePredicateFromAST(
+            expression_ast
+        )
+        self.assertTrue(predicate(attribute_container))
+
+    def testIsSupported(self):
+        """Tests the _IsSupported function."""
+        expression_ast = ast.parse('size + 1 > 2 and name[0:2] == "va"', mode="eval")
+        result = filter_predicate.FilterPredicateHelper._IsSupported(expression_ast)
+        self.assertTrue(result)
+
+        expression_ast = ast.parse("[item for item in items]", mode="eval")
+        result = filter_predicate.FilterPredicateHelper._IsSupported(expression_ast)
+        self.assertFalse(result)
+
+        expression_ast = ast.parse("name.split(sep=' ')", mode="eval")
+        result = filter_predicate.FilterPredicateHelper._IsSupported(expression_ast)
+        self.assertFalse(result)
+
+        expression_ast = ast.parse("name.split(*items)", mode="eval")
+        result = filter_predicate.FilterPredicateHelper._IsSupported(expression_ast)
+        self.assertFalse(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
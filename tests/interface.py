@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Tests for the attribute container store interface."""
 
+import gzip
+import os
 import unittest
 
 from acstore import interface
+from acstore import profilers
 from acstore.containers import manager
 
 from tests import test_lib
@@ -30,6 +33,22 @@ class AttributeContainerStoreTest(test_lib.BaseTestCase):
         )
         self.assertEqual(sequence_number, 2)
 
+    def testGetAttributeContainerNextSequenceNumbers(self):
+        """Tests the _GetAttributeContainerNextSequenceNumbers function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        test_store = interface.AttributeContainerStore()
+
+        sequence_numbers = test_store._GetAttributeContainerNextSequenceNumbers(
+            attribute_container.CONTAINER_TYPE, 3
+        )
+        self.assertEqual(list(sequence_numbers), [1, 2, 3])
+
+        sequence_number = test_store._GetAttributeContainerNextSequenceNumber(
+            attribute_container.CONTAINER_TYPE
+        )
+        self.assertEqual(sequence_number, 4)
+
     def testGetAttributeContainerSchema(self):
         """Tests the _GetAttributeContainerSchema function."""
         attribute_container = test_lib.TestAttributeContainer()
@@ -64,6 +83,25 @@ class AttributeContainerStoreTest(test_lib.BaseTestCase):
         test_store.SetStorageProfiler(None)
 
 
+class AttributeContainerReadAheadTest(test_lib.BaseTestCase):
+    """Tests for the read-ahead state of attribute containers."""
+
+    def testIsInWindow(self):
+        """Tests the IsInWindow function."""
+        read_ahead_state = interface.AttributeContainerReadAhead(16)
+        self.assertFalse(read_ahead_state.IsInWindow(0))
+
+        read_ahead_state.stride = 2
+        read_ahead_state.window_end = 10
+        read_ahead_state.window_start = 4
+
+        self.assertFalse(read_ahead_state.IsInWindow(2))
+        self.assertTrue(read_ahead_state.IsInWindow(4))
+        self.assertFalse(read_ahead_state.IsInWindow(5))
+        self.assertTrue(read_ahead_state.IsInWindow(8))
+        self.assertFalse(read_ahead_state.IsInWindow(10))
+
+
 class AttributeContainerStoreWithReadCacheTest(test_lib.BaseTestCase):
     """Tests for the attribute container store with read cache."""
 
@@ -100,6 +138,104 @@ class AttributeContainerStoreWithReadCacheTest(test_lib.BaseTestCase):
             )
             self.assertIsNotNone(cached_container)
 
+    def testGetReadAheadHitRate(self):
+        """Tests the GetReadAheadHitRate function."""
+        test_store = interface.AttributeContainerStoreWithReadCache()
+        test_store._attribute_container_sequence_numbers["test_container"] = 100
+
+        hit_rate = test_store.GetReadAheadHitRate("test_container")
+        self.assertIsNone(hit_rate)
+
+        for index in range(3):
+            test_store._GetReadAheadIndexes("test_container", index)
+
+        for index in range(3, 9):
+            test_store._GetReadAheadIndexes("test_container", index)
+
+        # 6 of the 15 attribute containers read ahead were accessed.
+        hit_rate = test_store.GetReadAheadHitRate("test_container")
+        self.assertEqual(hit_rate, 0.4)
+
+    def testGetReadAheadIndexes(self):
+        """Tests the _GetReadAheadIndexes function."""
+        test_store = interface.AttributeContainerStoreWithReadCache()
+        test_store._attribute_container_sequence_numbers["test_container"] = 100
+
+        # Sequential access.
+        indexes = test_store._GetReadAheadIndexes("test_container", 0)
+        self.assertEqual(indexes, [])
+        indexes = test_store._GetReadAheadIndexes("test_container", 1)
+        self.assertEqual(indexes, [])
+        indexes = test_store._GetReadAheadIndexes("test_container", 2)
+        self.assertEqual(indexes, list(range(2, 18)))
+
+        for index in range(3, 18):
+            indexes = test_store._GetReadAheadIndexes("test_container", index)
+            self.assertEqual(indexes, [])
+
+        read_ahead_state = test_store._read_ahead_states["test_container"]
+        self.assertEqual(read_ahead_state.total_number_of_containers, 15)
+        self.assertEqual(read_ahead_state.total_number_of_hits, 15)
+
+        # All attribute containers read ahead were accessed, therefore
+        # the window size is doubled.
+        indexes = test_store._GetReadAheadIndexes("test_container", 18)
+        self.assertEqual(indexes, list(range(18, 50)))
+
+        # Random access.
+        indexes = test_store._GetReadAheadIndexes("test_container", 80)
+        self.assertEqual(indexes, [])
+
+        self.assertEqual(read_ahead_state.window_size, 16)
+
+        # Strided access.
+        indexes = test_store._GetReadAheadIndexes("test_container", 83)
+        self.assertEqual(indexes, [])
+        indexes = test_store._GetReadAheadIndexes("test_container", 86)
+        self.assertEqual(indexes, [86, 89, 92, 95, 98])
+
+        # Access of cached attribute containers.
+        test_store._read_ahead_states = {}
+
+        for index in range(3):
+            indexes = test_store._GetReadAheadIndexes(
+                "test_container", index, is_cached=True
+            )
+            self.assertEqual(indexes, [])
+
+        # The access pattern of cached attribute containers is tracked.
+        indexes = test_store._GetReadAheadIndexes("test_container", 3)
+        self.assertEqual(indexes, list(range(3, 19)))
+
+    def testGetReadAheadIndexesWithStorageProfiler(self):
+        """Tests the _GetReadAheadIndexes function with a storage profiler."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_profiler = profilers.StorageProfiler("test", temp_directory)
+            test_profiler.Start()
+
+            test_store = interface.AttributeContainerStoreWithReadCache()
+            test_store._attribute_container_sequence_numbers["test_container"] = 100
+            test_store.SetStorageProfiler(test_profiler)
+
+            for index in range(9):
+                test_store._GetReadAheadIndexes("test_container", index)
+
+            # Random access closes the read-ahead window.
+            test_store._GetReadAheadIndexes("test_container", 80)
+
+            test_profiler.Stop()
+
+            path = os.path.join(temp_directory, "storage-test.csv.gz")
+            with gzip.open(path, "rt", encoding="utf-8") as file_object:
+                lines = file_object.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+
+        # 6 of the 15 attribute containers read ahead were accessed.
+        sample_values = lines[1].split("\t")
+        self.assertEqual(sample_values[1:4], ["read_ahead", "read", "test_container"])
+        self.assertEqual(sample_values[5:], ["15", "6"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """Tests for the SQLite-based attribute container store."""
 
+import ast
+import copy
 import os
+import sys
+import tracemalloc
+import types
 import unittest
 
+from acstore import fake_store
+from acstore import interface
 from acstore import sqlite_store
+from acstore.containers import interface as containers_interface
 from acstore.containers import manager as containers_manager
+from acstore.helpers import schema
 
 from tests import test_lib
 
@@ -32,7 +41,639 @@ class _TestSQLiteAttributeContainerStoreV20221023(
     _READ_COMPATIBLE_FORMAT_VERSION = 20211121
 
 
-# TODO add tests for PythonAST2SQL.
+class _TestSQLiteAttributeContainerStoreWithSmallWriteCache(
+    sqlite_store.SQLiteAttributeContainerStore
+):
+    """Test class for testing the write cache limits."""
+
+    _MAXIMUM_WRITE_CACHE_SIZE = 4096
+    _MAXIMUM_WRITE_CACHE_TYPE_SIZE = 1024
+
+
+class _TestTrackedAttributeContainer(containers_interface.TrackedAttributeContainer):
+    """Attribute container with changed attribute tracking for testing.
+
+    Attributes:
+      attribute (str): attribute for testing purposes.
+      other (str): other attribute for testing purposes.
+    """
+
+    CONTAINER_TYPE = "tracked_container"
+
+    SCHEMA = {"attribute": "str", "other": "str"}
+
+    def __init__(self):
+        """Initializes an attribute container."""
+        super().__init__()
+        self.attribute = None
+        self.other = None
+
+
+class _TestSQLiteAttributeContainerStoreWithSmallFetches(
+    sqlite_store.SQLiteAttributeContainerStore
+):
+    """Test class for testing reading rows in batches."""
+
+    _NUMBER_OF_ROWS_PER_FETCH = 2
+
+
+class _TestNamespaceSerializer(interface.AttributeSerializer):
+    """Namespace attribute serializer for testing."""
+
+    JSON_VALUE_TYPE = "object"
+
+    def DeserializeValue(self, value):
+        """Deserializes a value.
+
+        Args:
+          value (dict[str, object]): serialized value.
+
+        Returns:
+          types.SimpleNamespace: runtime value.
+        """
+        return types.SimpleNamespace(**value)
+
+    def SerializeValue(self, value):
+        """Serializes a value.
+
+        Args:
+          value (types.SimpleNamespace): runtime value.
+
+        Returns:
+          dict[str, object]: serialized value.
+        """
+        return dict(vars(value))
+
+
+class _TestDictSerializer(interface.AttributeSerializer):
+    """Dictionary attribute serializer for testing."""
+
+    JSON_VALUE_TYPE = "dict"
+
+    def DeserializeValue(self, value):
+        """Deserializes a value.
+
+        Args:
+          value (dict[str, object]): serialized value.
+
+        Returns:
+          dict[str, object]: runtime value.
+        """
+        return dict(value)
+
+    def SerializeValue(self, value):
+        """Serializes a value.
+
+        Args:
+          value (dict[str, object]): runtime value.
+
+        Returns:
+          dict[str, object]: serialized value.
+        """
+        return dict(value)
+
+
+class _TestListSerializer(interface.AttributeSerializer):
+    """List attribute serializer for testing."""
+
+    JSON_VALUE_TYPE = "list"
+
+    def DeserializeValue(self, value):
+        """Deserializes a value.
+
+        Args:
+          value (list[str]): serialized value.
+
+        Returns:
+          list[str]: runtime value.
+        """
+        return list(value)
+
+    def SerializeValue(self, value):
+        """Serializes a value.
+
+        Args:
+          value (list[str]): runtime value.
+
+        Returns:
+          list[str]: serialized value.
+        """
+        return list(value)
+
+
+class _TestListAttributeContainer(containers_interface.AttributeContainer):
+    """Attribute container with a JSON serialized attribute for testing.
+
+    Attributes:
+      name (str): name for testing purposes.
+      items (list[str]): items for testing purposes.
+    """
+
+    CONTAINER_TYPE = "list_container"
+
+    SCHEMA = {"name": "str", "items": "List[str]"}
+
+    def __init__(self):
+        """Initializes an attribute container."""
+        super().__init__()
+        self.name = None
+        self.items = None
+
+
+class _TestSizedAttributeContainer(containers_interface.AttributeContainer):
+    """Attribute container with attributes to aggregate for testing.
+
+    Attributes:
+      name (str): name for testing purposes.
+      size (int): size for testing purposes.
+      visible (bool): visibility for testing purposes.
+    """
+
+    CONTAINER_TYPE = "sized_container"
+
+    SCHEMA = {"name": "str", "size": "int", "visible": "bool"}
+
+    def __init__(self):
+        """Initializes an attribute container."""
+        super().__init__()
+        self.name = None
+        self.size = None
+        self.visible = None
+
+
+class _TestReferenceAttributeContainer(containers_interface.AttributeContainer):
+    """Attribute container with JSON serialized and identifier attributes.
+
+    Attributes:
+      items (list[str]): items for testing purposes.
+      mapping (dict[str, object]): mapping for testing purposes.
+      parent (AttributeContainerIdentifier): identifier of the parent attribute
+          container for testing purposes.
+      properties (types.SimpleNamespace): properties for testing purposes.
+    """
+
+    CONTAINER_TYPE = "reference_container"
+
+    SCHEMA = {
+        "items": "List[str]",
+        "mapping": "Dict[str, object]",
+        "parent": "AttributeContainerIdentifier",
+        "properties": "SimpleNamespace",
+    }
+
+    def __init__(self):
+        """Initializes an attribute container."""
+        super().__init__()
+        self.items = None
+        self.mapping = None
+        self.parent = None
+        self.properties = None
+
+
+class _BogusAttributeContainer(containers_interface.AttributeContainer):
+    """Unsupported attribute container for testing."""
+
+    CONTAINER_TYPE = "bogus"
+
+
+class PythonAST2SQLHelperTest(test_lib.BaseTestCase):
+    """Tests for the Python AST to SQL helper."""
+
+    # pylint: disable=protected-access
+
+    def _CreateHelper(self):
+        """Creates a Python AST to SQL helper for testing.
+
+        Returns:
+          PythonAST2SQLHelper: Python AST to SQL helper.
+        """
+        return sqlite_store.PythonAST2SQLHelper(
+            json_attribute_names=["items", "mapping", "properties"],
+            json_value_types={
+                "items": "list",
+                "mapping": "dict",
+                "properties": "object",
+            },
+            number_attribute_names=["flag", "other", "size"],
+            string_attribute_names=["name", "parent"],
+        )
+
+    def _ConvertExpression(self, expression):
+        """Converts a Python expression to SQL.
+
+        Args:
+          expression (str): Python expression.
+
+        Returns:
+          str: SQL statement.
+        """
+        ast_to_sql_helper = self._CreateHelper()
+        expression_ast = ast.parse(expression, mode="eval")
+        return ast_to_sql_helper.ConvertNode(expression_ast.body)
+
+    def _CompileExpression(self, expression):
+        """Compiles a filter expression.
+
+        Args:
+          expression (str): filter expression.
+
+        Returns:
+          tuple[str, list[object], code]: SQL expression, the values of its
+              parameters and the compiled residual expression.
+        """
+        ast_to_sql_helper = self._CreateHelper()
+        return ast_to_sql_helper._CompileExpression(expression)
+
+    def testCompileExpression(self):
+        """Tests the _CompileExpression function."""
+        sql_expression, parameters, residual_expression = self._CompileExpression(
+            'name == "value" and size < 5 < other and flag == True'
+        )
+        self.assertEqual(
+            sql_expression, "name = ? AND size < ? AND ? < other AND flag = 1"
+        )
+        self.assertEqual(parameters, ["value", 5, 5])
+        self.assertIsNone(residual_expression)
+
+        sql_expression, parameters, residual_expression = self._CompileExpression(
+            'name.startswith("x") and (size == 1 or size == 2) and items.count(4)'
+        )
+        self.assertEqual(sql_expression, "(size = ? OR size = ?)")
+        self.assertEqual(parameters, [1, 2])
+        self.assertIsNotNone(residual_expression)
+
+        container = types.SimpleNamespace(items=[1, 2, 3, 4], name="xy")
+        self.assertTrue(residual_expression(container))
+
+        container = types.SimpleNamespace(items=[1, 2, 3], name="xy")
+        self.assertFalse(residual_expression(container))
+
+        sql_expression, parameters, residual_expression = self._CompileExpression(
+            'name.startswith("x") or size == 1'
+        )
+        self.assertIsNone(sql_expression)
+        self.assertEqual(parameters, [])
+        self.assertIsNotNone(residual_expression)
+
+        # Attributes without a known data type are not converted.
+        ast_to_sql_helper = sqlite_store.PythonAST2SQLHelper()
+        sql_expression, parameters, residual_expression = (
+            ast_to_sql_helper._CompileExpression("size == 1")
+        )
+        self.assertIsNone(sql_expression)
+        self.assertIsNotNone(residual_expression)
+
+        with self.assertRaises(SyntaxError):
+            self._CompileExpression("size ==")
+
+    def testCompileExpressionWithCache(self):
+        """Tests the CompileExpression function."""
+        ast_to_sql_helper = self._CreateHelper()
+
+        sql_expression, parameters, residual_expression = (
+            ast_to_sql_helper.CompileExpression('name == "value" and size < 5')
+        )
+        self.assertEqual(sql_expression, "name = ? AND size < ?")
+        self.assertEqual(parameters, ["value", 5])
+        self.assertIsNone(residual_expression)
+        self.assertEqual(
+            list(ast_to_sql_helper._compiled_expressions.keys()),
+            [("name == ? and size < ?", (str, int))],
+        )
+
+        # Filter expressions with the same shape use the same SQL expression.
+        sql_expression, parameters, residual_expression = (
+            ast_to_sql_helper.CompileExpression("name == 'other' and size < 7")
+        )
+        self.assertEqual(sql_expression, "name = ? AND size < ?")
+        self.assertEqual(parameters, ["other", 7])
+        self.assertIsNone(residual_expression)
+        self.assertEqual(len(ast_to_sql_helper._compiled_expressions), 1)
+
+        # Filter expressions of which the constants have different types are
+        # converted separately, since comparisons of values of different types
+        # are not converted.
+        sql_expression, parameters, residual_expression = (
+            ast_to_sql_helper.CompileExpression('name == 5 and size < "x"')
+        )
+        self.assertIsNone(sql_expression)
+        self.assertIsNotNone(residual_expression)
+
+        # Filter expressions of which the constants of the shape are not the
+        # parameters are cached by expression.
+        for _ in range(2):
+            sql_expression, parameters, residual_expression = (
+                ast_to_sql_helper.CompileExpression("size == 0x10")
+            )
+            self.assertEqual(sql_expression, "size = ?")
+            self.assertEqual(parameters, [16])
+            self.assertIsNone(residual_expression)
+
+        sql_expression, parameters, residual_expression = (
+            ast_to_sql_helper.CompileExpression('size == 1 and name.startswith("x")')
+        )
+        self.assertEqual(sql_expression, "size = ?")
+        self.assertEqual(parameters, [1])
+        self.assertIsNotNone(residual_expression)
+
+        self.assertEqual(
+            list(ast_to_sql_helper._compiled_expressions.keys()),
+            [
+                'size == 1 and name.startswith("x")',
+                "size == 0x10",
+                'name == 5 and size < "x"',
+                ("name == ? and size < ?", (str, int)),
+            ],
+        )
+        self.assertIsNone(ast_to_sql_helper._parameters)
+
+        # Filter expressions that are not valid are not compiled, even if
+        # a filter expression of the same shape was cached.
+        ast_to_sql_helper.CompileExpression("size == 1")
+        for expression in ("size == 01", "size == 1__0"):
+            with self.assertRaises(SyntaxError):
+                ast_to_sql_helper.CompileExpression(expression)
+
+    def testConvertBoolOperation(self):
+        """Tests the _ConvertBoolOperation function."""
+        sql_statement = self._ConvertExpression("size == 1 or size == 2")
+        self.assertEqual(sql_statement, "size = 1 OR size = 2")
+
+        # Values that fail to evaluate stop the evaluation.
+        sql_statement = self._ConvertExpression("size == 1 or other == 2")
+        self.assertEqual(
+            sql_statement,
+            "CASE (size = 1) <> 0 WHEN 1 THEN 1 WHEN 0 THEN other = 2 END",
+        )
+
+        sql_statement = self._ConvertExpression("size == 1 and (other == 2 or flag)")
+        self.assertEqual(
+            sql_statement,
+            "CASE (size = 1) <> 0 WHEN 1 THEN CASE (other = 2) <> 0 WHEN 1 THEN 1 "
+            "WHEN 0 THEN flag END WHEN 0 THEN 0 END",
+        )
+
+        with self.assertRaises(TypeError):
+            self._ConvertExpression("size == 1 or name")
+
+    def testConvertCompare(self):
+        """Tests the _ConvertCompare function."""
+        sql_statement = self._ConvertExpression("size != 1")
+        self.assertEqual(sql_statement, "size <> 1")
+
+        sql_statement = self._ConvertExpression("1 <= size < 5")
+        self.assertEqual(sql_statement, "1 <= size AND size < 5")
+
+        sql_statement = self._ConvertExpression("size < other < 5")
+        self.assertEqual(
+            sql_statement,
+            "CASE (size < other) <> 0 WHEN 1 THEN other < 5 WHEN 0 THEN 0 END",
+        )
+
+        sql_statement = self._ConvertExpression("(size < 5) == flag")
+        self.assertEqual(sql_statement, "(size < 5) = flag")
+
+        sql_statement = self._ConvertExpression("size in (1, 2)")
+        self.assertEqual(sql_statement, "size IN (1, 2)")
+
+        sql_statement = self._ConvertExpression('name not in ["x", "y"]')
+        self.assertEqual(sql_statement, "name NOT IN ('x', 'y')")
+
+        # Attributes that are set to None are not set.
+        sql_statement = self._ConvertExpression("size is None")
+        self.assertEqual(sql_statement, "CASE WHEN (size) IS NOT NULL THEN 0 END")
+
+        sql_statement = self._ConvertExpression("name != None")
+        self.assertEqual(sql_statement, "CASE WHEN (name) IS NOT NULL THEN 1 END")
+
+        for expression in (
+            "size < None",
+            "size is 1",
+            'size == "1"',
+            "name > 5",
+            'size in (1, "2")',
+            "size in ()",
+            "size in other",
+            "bogus == 1",
+        ):
+            with self.assertRaises(TypeError):
+                self._ConvertExpression(expression)
+
+    def testConvertConstant(self):
+        """Tests the _ConvertConstant function."""
+        sql_statement = self._ConvertExpression('name == "it\'s"')
+        self.assertEqual(sql_statement, "name = 'it''s'")
+
+        sql_statement = self._ConvertExpression("True")
+        self.assertEqual(sql_statement, "1")
+
+        sql_statement = self._ConvertExpression("1.5")
+        self.assertEqual(sql_statement, "1.5")
+
+        with self.assertRaises(TypeError):
+            self._ConvertExpression("b'bytes'")
+
+        # Integers that SQLite cannot represent are not supported.
+        sql_statement = self._ConvertExpression("size == 9223372036854775807")
+        self.assertEqual(sql_statement, "size = 9223372036854775807")
+
+        with self.assertRaises(TypeError):
+            self._ConvertExpression("size == 9223372036854775808")
+
+    def testConvertContains(self):
+        """Tests the _ConvertContains function."""
+        sql_statement = self._ConvertExpression('"x" in items')
+        self.assertEqual(
+            sql_statement,
+            "CASE json_type(items, '$') "
+            "WHEN 'array' THEN 'x' IN (SELECT value FROM json_each(items, '$') "
+            "WHERE type NOT IN ('array', 'object', 'null')) "
+            "WHEN 'object' THEN 'x' IN (SELECT key FROM json_each(items, '$')) "
+            "WHEN 'text' THEN instr(json_extract(items, '$'), 'x') > 0 END",
+        )
+
+        sql_statement = self._ConvertExpression('1 not in mapping["names"]')
+        self.assertEqual(
+            sql_statement,
+            "NOT (CASE json_type(mapping, '$.\"names\"') "
+            "WHEN 'array' THEN 1 IN (SELECT value "
+            "FROM json_each(mapping, '$.\"names\"') "
+            "WHERE type NOT IN ('array', 'object', 'null')) "
+            "WHEN 'object' THEN 1 IN (SELECT key "
+            "FROM json_each(mapping, '$.\"names\"')) END)",
+        )
+
+        # An object value does not support "in" and its attributes are only
+        # accessed as attributes.
+        for expression in (
+            "name in items",
+            '"x" in name',
+            "None in items",
+            '"x" in properties',
+            '"x" in properties["names"]',
+        ):
+            with self.assertRaises(TypeError):
+                self._ConvertExpression(expression)
+
+    def testGetJSONPath(self):
+        """Tests the _GetJSONPath function."""
+        ast_to_sql_helper = self._CreateHelper()
+
+        for expression, expected_column_name, expected_json_path in (
+            ("properties", "properties", "$"),
+            ("items[1]", "items", "$[1]"),
+            ('mapping["names"]["x"]', "mapping", '$."names"."x"'),
+            ("properties.path_spec", "properties", '$."path_spec"'),
+            (
+                'properties.path_spec["location"]',
+                "properties",
+                '$."path_spec"."location"',
+            ),
+        ):
+            expression_ast = ast.parse(expression, mode="eval")
+            column_name, json_path = ast_to_sql_helper._GetJSONPath(expression_ast.body)
+            self.assertEqual(column_name, expected_column_name)
+            self.assertEqual(json_path, expected_json_path)
+
+        # The access must correspond to the type of the runtime value.
+        for expression in (
+            "other[0]",
+            "items[-1]",
+            "items[True]",
+            "items[index]",
+            'items["x"]',
+            "items[0][0]",
+            'mapping["it\'s"]',
+            "mapping.names",
+            "mapping[0]",
+            'properties["names"]',
+            "properties.path_spec.location",
+        ):
+            expression_ast = ast.parse(expression, mode="eval")
+            with self.assertRaises(TypeError):
+                ast_to_sql_helper._GetJSONPath(expression_ast.body)
+
+    def testGetExpressionShape(self):
+        """Tests the _GetExpressionShape function."""
+        ast_to_sql_helper = sqlite_store.PythonAST2SQLHelper()
+
+        shape, values = ast_to_sql_helper._GetExpressionShape(
+            'name == "it\\"s" and size > -1.5e3 and value1 in (2, \'x\')'
+        )
+        self.assertEqual(shape, "name == ? and size > -? and value1 in (?, ?)")
+        self.assertEqual(values, ['it"s', 1500.0, 2, "x"])
+
+        shape, values = ast_to_sql_helper._GetExpressionShape('name == r"x" or 0x10')
+        self.assertEqual(shape, 'name == r"x" or 0x10')
+        self.assertEqual(values, [])
+
+        shape, values = ast_to_sql_helper._GetExpressionShape(
+            "size == 1_000 or size == 1. or size == .5e-1_0"
+        )
+        self.assertEqual(shape, "size == ? or size == ? or size == ?")
+        self.assertEqual(values, [1000, 1.0, 0.5e-10])
+
+        # Number constants that are not valid Python literals are not replaced.
+        for expression in ("size == 01", "size == 0_1", "size == 1__0", "size == 1_"):
+            shape, values = ast_to_sql_helper._GetExpressionShape(expression)
+            self.assertEqual(shape, expression)
+            self.assertEqual(values, [])
+
+        # Integers that SQLite cannot represent are not replaced.
+        shape, values = ast_to_sql_helper._GetExpressionShape(
+            "size == 10000000000000000000000"
+        )
+        self.assertIsNone(shape)
+        self.assertIsNone(values)
+
+    def testGetValueType(self):
+        """Tests the _GetValueType function."""
+        ast_to_sql_helper = self._CreateHelper()
+
+        for expression, expected_value_type in (
+            ("1.5", "number"),
+            ("True", "number"),
+            ("10000000000000000000000", None),
+            ('"x"', "string"),
+            ("None", None),
+            ("size", "number"),
+            ("name", "string"),
+            ("items", "json"),
+            ("properties.size", "json"),
+            ("bogus", None),
+            ("-size", "number"),
+            ("-name", None),
+            ("not name", "number"),
+            ("name == 1", "number"),
+            ("size or flag", None),
+        ):
+            expression_ast = ast.parse(expression, mode="eval")
+            value_type = ast_to_sql_helper._GetValueType(expression_ast.body)
+            self.assertEqual(value_type, expected_value_type, expression)
+
+    def testConvertJSONValue(self):
+        """Tests the _ConvertJSONValue function."""
+        sql_statement = self._ConvertExpression('items[0] == "x"')
+        self.assertEqual(
+            sql_statement,
+            "(json_extract(items, '$[0]') = 'x' AND json_type(items, '$[0]') = 'text')",
+        )
+
+        sql_statement = self._ConvertExpression("properties.size != -1")
+        self.assertEqual(
+            sql_statement,
+            "(json_extract(properties, '$.\"size\"') <> -(1) OR "
+            "json_type(properties, '$.\"size\"') = 'null')",
+        )
+
+        sql_statement = self._ConvertExpression("5 < properties.size")
+        self.assertEqual(
+            sql_statement,
+            "CASE WHEN json_type(properties, '$.\"size\"') "
+            "IN ('integer', 'real', 'true', 'false') "
+            "THEN 5 < json_extract(properties, '$.\"size\"') END",
+        )
+
+        sql_statement = self._ConvertExpression("properties.size is None")
+        self.assertEqual(sql_statement, "json_type(properties, '$.\"size\"') = 'null'")
+
+        for expression in (
+            "properties.size == size",
+            "properties.size == items[0]",
+            "not properties.size",
+            "other[0] == 1",
+            'properties["size"] == 1',
+            "mapping.size == 1",
+        ):
+            with self.assertRaises(TypeError):
+                self._ConvertExpression(expression)
+
+    def testConvertUnaryOperation(self):
+        """Tests the _ConvertUnaryOperation function."""
+        sql_statement = self._ConvertExpression("not (size == 1 or size == 2)")
+        self.assertEqual(sql_statement, "NOT (size = 1 OR size = 2)")
+
+        sql_statement = self._ConvertExpression("not flag")
+        self.assertEqual(sql_statement, "NOT (flag)")
+
+        sql_statement = self._ConvertExpression("(not flag) == size")
+        self.assertEqual(sql_statement, "(NOT (flag)) = size")
+
+        sql_statement = self._ConvertExpression("size > -1")
+        self.assertEqual(sql_statement, "size > -(1)")
+
+        # The truth value of strings differs in SQL.
+        for expression in ("~size", "not name", "-name"):
+            with self.assertRaises(TypeError):
+                self._ConvertExpression(expression)
+
+    def testConvertNode(self):
+        """Tests the ConvertNode function."""
+        sql_statement = self._ConvertExpression('name == "value"')
+        self.assertEqual(sql_statement, "name = 'value'")
+
+        with self.assertRaises(TypeError):
+            self._ConvertExpression("len(name) == 1")
 
 
 class SQLiteSchemaHelperTest(test_lib.BaseTestCase):
@@ -80,6 +721,15 @@ class SQLiteSchemaHelperTest(test_lib.BaseTestCase):
 
         # TODO: add test for AttributeContainerIdentifier
 
+    def testIsJSONDataType(self):
+        """Tests the IsJSONDataType function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        self.assertFalse(schema_helper.IsJSONDataType("str"))
+        self.assertFalse(schema_helper.IsJSONDataType("bool"))
+        self.assertFalse(schema_helper.IsJSONDataType("AttributeContainerIdentifier"))
+        self.assertTrue(schema_helper.IsJSONDataType("List[str]"))
+
     def testSerializeValue(self):
         """Tests the SerializeValue function."""
         schema_helper = sqlite_store.SQLiteSchemaHelper()
@@ -101,6 +751,217 @@ class SQLiteSchemaHelperTest(test_lib.BaseTestCase):
 
         # TODO: add test for AttributeContainerIdentifier
 
+    def testGetDeserializeFunction(self):
+        """Tests the GetDeserializeFunction function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        deserialize_function = schema_helper.GetDeserializeFunction("str")
+        self.assertIsNone(deserialize_function)
+
+        deserialize_function = schema_helper.GetDeserializeFunction("bool")
+        self.assertIsNotNone(deserialize_function)
+        self.assertTrue(deserialize_function(1))
+
+        deserialize_function = schema_helper.GetDeserializeFunction(
+            "AttributeContainerIdentifier"
+        )
+        self.assertIsNotNone(deserialize_function)
+        identifier = deserialize_function("test_container.1")
+        self.assertEqual(identifier.name, "test_container")
+        self.assertEqual(identifier.sequence_number, 1)
+
+        with self.assertRaises(OSError):
+            schema_helper.GetDeserializeFunction("bogus")
+
+    def testGetSerializeFunction(self):
+        """Tests the GetSerializeFunction function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        serialize_function = schema_helper.GetSerializeFunction("str")
+        self.assertIsNone(serialize_function)
+
+        serialize_function = schema_helper.GetSerializeFunction("bool")
+        self.assertIsNotNone(serialize_function)
+        self.assertEqual(serialize_function(True), 1)
+
+        with self.assertRaises(OSError):
+            schema_helper.GetSerializeFunction("bogus")
+
+
+class SQLiteAttributeContainerPlanTest(test_lib.BaseTestCase):
+    """Tests for the SQLite attribute container plan."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"other": "bool", "attribute": "str"}, schema_helper
+        )
+        self.assertEqual(plan.column_names, ["attribute", "other"])
+
+        with self.assertRaises(OSError):
+            sqlite_store.SQLiteAttributeContainerPlan(
+                "test_container", {"attribute": "bogus"}, schema_helper
+            )
+
+    def testCompileFilterExpression(self):
+        """Tests the CompileFilterExpression function."""
+        schema.SchemaHelper.RegisterDataType(
+            "List[str]", {"json": _TestListSerializer()}
+        )
+
+        try:
+            plan = sqlite_store.SQLiteAttributeContainerPlan(
+                "list_container",
+                {"name": "str", "items": "List[str]", "size": "int"},
+                sqlite_store.SQLiteSchemaHelper(),
+            )
+
+            sql_expression, parameters, residual_expression = (
+                plan.CompileFilterExpression('name == "x" and items[0] == "y"')
+            )
+            self.assertEqual(
+                sql_expression,
+                "name = ? AND (json_extract(items, '$[0]') = ? AND "
+                "json_type(items, '$[0]') = 'text')",
+            )
+            self.assertEqual(parameters, ["x", "y"])
+            self.assertIsNone(residual_expression)
+
+            # Conjuncts with JSON values are evaluated last.
+            sql_expression, parameters, residual_expression = (
+                plan.CompileFilterExpression('items[1] == "y" and size == 1')
+            )
+            self.assertEqual(
+                sql_expression,
+                "size = ? AND (json_extract(items, '$[1]') = ? AND "
+                "json_type(items, '$[1]') = 'text')",
+            )
+            self.assertEqual(parameters, [1, "y"])
+
+            # Attributes that are not stored as JSON are evaluated in Python.
+            sql_expression, parameters, residual_expression = (
+                plan.CompileFilterExpression('name[0] == "x"')
+            )
+            self.assertIsNone(sql_expression)
+            self.assertIsNotNone(residual_expression)
+
+        finally:
+            schema.SchemaHelper.DeregisterDataType("List[str]")
+
+    def testGetInsertQuery(self):
+        """Tests the GetInsertQuery function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"attribute": "str"}, schema_helper
+        )
+        query = plan.GetInsertQuery(1)
+        self.assertEqual(query, "INSERT INTO test_container (attribute) VALUES (?)")
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"attribute": "str", "other": "int"}, schema_helper
+        )
+        query = plan.GetInsertQuery(2)
+        self.assertEqual(
+            query,
+            "INSERT INTO test_container (attribute, other) VALUES (?,?), (?,?)",
+        )
+
+    def testGetLazyRowDeserializers(self):
+        """Tests the GetLazyRowDeserializers function."""
+        schema.SchemaHelper.RegisterDataType(
+            "List[str]", {"json": _TestListSerializer()}
+        )
+
+        try:
+            plan = sqlite_store.SQLiteAttributeContainerPlan(
+                "list_container",
+                {"name": "str", "items": "List[str]"},
+                sqlite_store.SQLiteSchemaHelper(),
+            )
+
+            row_deserializers, lazy_row_deserializers = plan.GetLazyRowDeserializers(
+                ["name", "items"], 1
+            )
+            self.assertEqual(row_deserializers, ((1, "name", None),))
+            self.assertEqual(len(lazy_row_deserializers), 1)
+            self.assertEqual(lazy_row_deserializers[0][:2], (2, "items"))
+
+        finally:
+            schema.SchemaHelper.DeregisterDataType("List[str]")
+
+    def testGetRowDeserializers(self):
+        """Tests the GetRowDeserializers function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"other": "bool", "attribute": "str"}, schema_helper
+        )
+
+        row_deserializers = plan.GetRowDeserializers(["other", "attribute"], 1)
+        self.assertEqual(
+            row_deserializers, ((1, "other", bool), (2, "attribute", None))
+        )
+
+        self.assertIs(
+            plan.GetRowDeserializers(["other", "attribute"], 1), row_deserializers
+        )
+
+    def testGetUpdateQuery(self):
+        """Tests the GetUpdateQuery function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"attribute": "str", "other": "int"}, schema_helper
+        )
+        query = plan.GetUpdateQuery((0, 1))
+        self.assertEqual(
+            query,
+            "UPDATE test_container SET attribute = ?, other = ? WHERE _identifier = ?",
+        )
+
+        query = plan.GetUpdateQuery((1,))
+        self.assertEqual(
+            query, "UPDATE test_container SET other = ? WHERE _identifier = ?"
+        )
+
+    def testSerializeAttributeContainer(self):
+        """Tests the SerializeAttributeContainer function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"attribute": "str", "other": "bool"}, schema_helper
+        )
+
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "value"
+        attribute_container.other = True
+
+        row_values = plan.SerializeAttributeContainer(attribute_container)
+        self.assertEqual(row_values, ["value", 1])
+
+        attribute_container = test_lib.TestAttributeContainer()
+
+        row_values = plan.SerializeAttributeContainer(attribute_container)
+        self.assertEqual(row_values, [None, None])
+
+    def testSerializeAttributeValues(self):
+        """Tests the SerializeAttributeValues function."""
+        schema_helper = sqlite_store.SQLiteSchemaHelper()
+
+        plan = sqlite_store.SQLiteAttributeContainerPlan(
+            "test_container", {"attribute": "str", "other": "bool"}, schema_helper
+        )
+
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "value"
+        attribute_container.other = True
+
+        values = plan.SerializeAttributeValues(attribute_container, ["bogus", "other"])
+        self.assertEqual(values, {1: 1})
+
 
 class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
     """Tests for the SQLite-based storage file object."""
@@ -119,6 +980,79 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             test_lib.TestAttributeContainer
         )
 
+    def testCacheAttributeContainersForUpdate(self):
+        """Tests the _CacheAttributeContainersForUpdate function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(4):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    test_store.AddAttributeContainer(attribute_container)
+
+                    if index == 1:
+                        test_store._FlushWriteCacheByType("test_container")
+
+                plan = test_store._GetAttributeContainerPlan("test_container")
+
+                test_store._CacheAttributeContainersForUpdate(
+                    plan, {1: {0: "first"}, 4: {0: "fourth"}}
+                )
+                test_store._CacheAttributeContainersForUpdate(plan, {1: {0: "updated"}})
+
+                self.assertEqual(
+                    test_store._update_cache["test_container"], {1: {0: "updated"}}
+                )
+                self.assertEqual(
+                    test_store._write_cache["test_container"], [[None], ["fourth"]]
+                )
+
+            finally:
+                test_store.Close()
+
+    def testCacheAttributeContainersForWrite(self):
+        """Tests the _CacheAttributeContainersForWrite function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._CreateAttributeContainerTable(
+                    attribute_container.CONTAINER_TYPE
+                )
+                plan = test_store._GetAttributeContainerPlan(
+                    attribute_container.CONTAINER_TYPE
+                )
+
+                # The estimated size of a row includes the memory used by
+                # the row and the string object, which is more than 64 bytes.
+                rows = [["x" * 64] for _ in range(4)]
+                row_size = test_store._EstimateRowSize(rows)
+                self.assertGreater(row_size, 128)
+
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._write_cache_size, 4 * row_size)
+                self.assertEqual(len(test_store._write_cache["test_container"]), 4)
+
+                # The write cache of the attribute container type is flushed
+                # when its estimated size exceeds the maximum per type.
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._write_cache_size, 0)
+                self.assertNotIn("test_container", test_store._write_cache)
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 8)
+
+            finally:
+                test_store.Close()
+
     def testCheckStorageMetadata(self):
         """Tests the _CheckStorageMetadata function."""
         with test_lib.TempDirectory():
@@ -145,46 +1079,279 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
 
             metadata_values["serialization_format"] = "json"
 
-    def testCreateAttributeContainerTable(self):
-        """Tests the _CreateAttributeContainerTable function."""
+    def testCommitTransactionIfRequired(self):
+        """Tests the _CommitTransactionIfRequired function."""
         attribute_container = test_lib.TestAttributeContainer()
 
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
-            test_store = sqlite_store.SQLiteAttributeContainerStore()
-            test_store.Open(path=test_path, read_only=False)
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(path=test_path, read_only=False, commit_number_of_rows=32)
 
             try:
                 test_store._CreateAttributeContainerTable(
                     attribute_container.CONTAINER_TYPE
                 )
+                plan = test_store._GetAttributeContainerPlan(
+                    attribute_container.CONTAINER_TYPE
+                )
 
-                with self.assertRaises(OSError):
-                    test_store._CreateAttributeContainerTable(
-                        attribute_container.CONTAINER_TYPE
-                    )
+                rows = [["x" * 64] for _ in range(16)]
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._uncommitted_number_of_rows, 16)
+                self.assertTrue(test_store._connection.in_transaction)
+
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._uncommitted_number_of_rows, 0)
+                self.assertFalse(test_store._connection.in_transaction)
 
             finally:
                 test_store.Close()
 
-    # TODO: add tests for _CreateAttributeContainerFromRow
-    # TODO: add tests for _Flush
-    # TODO: add tests for _FlushWriteCache
-
-    def testGetAttributeContainersWithFilter(self):
-        """Tests the _GetAttributeContainersWithFilter function."""
-        attribute_container = test_lib.TestAttributeContainer()
-        attribute_container.attribute = "8f0bf95a7959baad9666b21a7feed79d"
-
-        column_names = ["attribute"]
-
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
-            test_store = sqlite_store.SQLiteAttributeContainerStore()
-            test_store.Open(path=test_path, read_only=False)
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(path=test_path, read_only=False, commit_size=2048)
 
             try:
-                containers = list(
+                test_store._CreateAttributeContainerTable(
+                    attribute_container.CONTAINER_TYPE
+                )
+                plan = test_store._GetAttributeContainerPlan(
+                    attribute_container.CONTAINER_TYPE
+                )
+
+                # The estimated size of the rows exceeds the maximum size of
+                # the write cache per type, but not the commit size.
+                rows = [["x" * 64] for _ in range(6)]
+                row_size = test_store._EstimateRowSize(rows)
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._uncommitted_size, 6 * row_size)
+                self.assertTrue(test_store._connection.in_transaction)
+
+                test_store._CacheAttributeContainersForWrite(plan, rows)
+                self.assertEqual(test_store._uncommitted_size, 0)
+                self.assertFalse(test_store._connection.in_transaction)
+
+            finally:
+                test_store.Close()
+
+    def testCreateAttributeContainerTable(self):
+        """Tests the _CreateAttributeContainerTable function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._CreateAttributeContainerTable(
+                    attribute_container.CONTAINER_TYPE
+                )
+
+                with self.assertRaises(OSError):
+                    test_store._CreateAttributeContainerTable(
+                        attribute_container.CONTAINER_TYPE
+                    )
+
+            finally:
+                test_store.Close()
+
+    def testCreateAttributeContainerFromRow(self):
+        """Tests the _CreateAttributeContainerFromRow function."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+            plan = test_store._GetAttributeContainerPlan("tracked_container")
+            row_deserializers = plan.GetRowDeserializers(["attribute", "other"], 1)
+
+            container = test_store._CreateAttributeContainerFromRow(
+                "tracked_container", row_deserializers, [1, "value", None]
+            )
+            self.assertIsNotNone(container)
+            self.assertEqual(container.attribute, "value")
+            self.assertIsNone(container.other)
+            self.assertEqual(container.GetChangedAttributeNames(), set())
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testDeserializeQueryResults(self):
+        """Tests the _DeserializeQueryResults function."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestSizedAttributeContainer
+        )
+
+        try:
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+            rows = test_store._DeserializeQueryResults(
+                "sized_container", ["visible"], [(1, 3), (0, 5), (None, 1)]
+            )
+            self.assertEqual(rows, [(True, 3), (False, 5), (None, 1)])
+
+            rows = test_store._DeserializeQueryResults(
+                "sized_container", ["name"], [("name1", 3)]
+            )
+            self.assertEqual(rows, [("name1", 3)])
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestSizedAttributeContainer
+            )
+
+    # TODO: add tests for _Flush
+
+    def testEstimateRowSize(self):
+        """Tests the _EstimateRowSize function."""
+        test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+        rows = [["value", 1], ["other value", None]]
+        row_size = test_store._EstimateRowSize(rows)
+        expected_row_size = (
+            sys.getsizeof(rows[0])
+            + sys.getsizeof("value")
+            + sys.getsizeof(1)
+            + sys.getsizeof(rows[1])
+            + sys.getsizeof("other value")
+        ) // 2
+        self.assertEqual(row_size, expected_row_size)
+
+        row_size = test_store._EstimateRowSize([])
+        self.assertEqual(row_size, 1)
+
+        # Test that the estimated size is close to the memory used by the rows.
+        tracemalloc.start()
+        try:
+            memory_size, _ = tracemalloc.get_traced_memory()
+            rows = [
+                [f"/path/file{index:d}.txt", index * 1024, None, True]
+                for index in range(1024)
+            ]
+            memory_size = tracemalloc.get_traced_memory()[0] - memory_size
+
+        finally:
+            tracemalloc.stop()
+
+        row_size = test_store._EstimateRowSize(rows[:16])
+        self.assertGreater(row_size * 1024, memory_size * 0.8)
+        self.assertLess(row_size * 1024, memory_size * 1.2)
+
+    def testFlushUpdateCacheByType(self):
+        """Tests the _FlushUpdateCacheByType function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for _ in range(3):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    test_store.AddAttributeContainer(attribute_container)
+
+                test_store._FlushWriteCacheByType("test_container")
+
+                plan = test_store._GetAttributeContainerPlan("test_container")
+                test_store._CacheAttributeContainersForUpdate(
+                    plan, {2: {0: "second"}, 3: {0: "third"}}
+                )
+
+                test_store._FlushUpdateCacheByType("test_container")
+                self.assertNotIn("test_container", test_store._update_cache)
+
+                test_store._cursor.execute(
+                    "SELECT attribute FROM test_container ORDER BY _identifier"
+                )
+                rows = test_store._cursor.fetchall()
+                self.assertEqual([row[0] for row in rows], [None, "second", "third"])
+
+            finally:
+                test_store.Close()
+
+    def testFlushWriteCache(self):
+        """Tests the _FlushWriteCache function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        write_cache = [[f"value{index:d}"] for index in range(300)]
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._CreateAttributeContainerTable(
+                    attribute_container.CONTAINER_TYPE
+                )
+                test_store._write_cache_plans[attribute_container.CONTAINER_TYPE] = (
+                    test_store._GetAttributeContainerPlan(
+                        attribute_container.CONTAINER_TYPE
+                    )
+                )
+
+                test_store._FlushWriteCache(
+                    attribute_container.CONTAINER_TYPE, write_cache
+                )
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 300)
+
+                test_store._cursor.execute(
+                    "SELECT attribute FROM test_container WHERE _identifier = 300"
+                )
+                row = test_store._cursor.fetchone()
+                self.assertEqual(row[0], "value299")
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainerPlan(self):
+        """Tests the _GetAttributeContainerPlan function."""
+        test_store = sqlite_store.SQLiteAttributeContainerStore()
+
+        plan = test_store._GetAttributeContainerPlan("test_container")
+        self.assertIsNotNone(plan)
+        self.assertEqual(plan.column_names, ["attribute"])
+
+        cached_plan = test_store._GetAttributeContainerPlan("test_container")
+        self.assertIs(cached_plan, plan)
+
+        with self.assertRaises(OSError):
+            test_store._GetAttributeContainerPlan("bogus")
+
+        containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+            test_lib.TestAttributeContainer
+        )
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            test_lib.TestAttributeContainer
+        )
+
+        cached_plan = test_store._GetAttributeContainerPlan("test_container")
+        self.assertIsNot(cached_plan, plan)
+
+    def testGetAttributeContainersWithFilter(self):
+        """Tests the _GetAttributeContainersWithFilter function."""
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "8f0bf95a7959baad9666b21a7feed79d"
+
+        column_names = ["attribute"]
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                containers = list(
                     test_store._GetAttributeContainersWithFilter(
                         attribute_container.CONTAINER_TYPE, column_names=column_names
                     )
@@ -230,6 +1397,41 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             finally:
                 test_store.Close()
 
+    def testGetAttributeContainersWithFilterInBatches(self):
+        """Tests the _GetAttributeContainersWithFilter function in batches."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallFetches()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(5):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+
+                test_store._FlushWriteCacheByType("test_container")
+
+                containers = list(
+                    test_store._GetAttributeContainersWithFilter(
+                        "test_container", column_names=["attribute"]
+                    )
+                )
+                self.assertEqual(
+                    [container.attribute for container in containers],
+                    ["value0", "value1", "value2", "value3", "value4"],
+                )
+                self.assertEqual(
+                    [
+                        container.GetIdentifier().sequence_number
+                        for container in containers
+                    ],
+                    [1, 2, 3, 4, 5],
+                )
+
+            finally:
+                test_store.Close()
+
     def testGetNumberOfAttributeContainerRows(self):
         """Tests the _GetNumberOfAttributeContainerRows function."""
         attribute_container = test_lib.TestAttributeContainer()
@@ -254,8 +1456,11 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
 
                 # Test for a supported container type that does not have a table
                 # present in the storage file.
+                test_store._FlushWriteCacheByType(attribute_container.CONTAINER_TYPE)
+
                 query = f"DROP TABLE {attribute_container.CONTAINER_TYPE:s}"
                 test_store._cursor.execute(query)
+                test_store._ReadTableNames()
                 number_of_containers = test_store._GetNumberOfAttributeContainerRows(
                     attribute_container.CONTAINER_TYPE
                 )
@@ -264,6 +1469,75 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             finally:
                 test_store.Close()
 
+    def testGetRowsByRowNumbers(self):
+        """Tests the _GetRowsByRowNumbers function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(5):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+
+                test_store._FlushWriteCacheByType("test_container")
+
+                test_store._maximum_number_of_variables = 2
+
+                rows = test_store._GetRowsByRowNumbers(
+                    "test_container", ["attribute"], [2, 3, 4]
+                )
+                self.assertEqual(
+                    [tuple(row) for row in rows],
+                    [(2, "value1"), (3, "value2"), (4, "value3")],
+                )
+
+                rows = test_store._GetRowsByRowNumbers(
+                    "test_container", ["attribute"], [1, 3, 5]
+                )
+                self.assertEqual(
+                    [tuple(row) for row in rows],
+                    [(1, "value0"), (3, "value2"), (5, "value4")],
+                )
+
+            finally:
+                test_store.Close()
+
+    def testGetWriteCache(self):
+        """Tests the _GetWriteCache function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                first_sequence_number, write_cache = test_store._GetWriteCache(
+                    "test_container"
+                )
+                self.assertEqual(first_sequence_number, 1)
+                self.assertEqual(write_cache, [])
+
+                for _ in range(3):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    test_store.AddAttributeContainer(attribute_container)
+
+                test_store._FlushWriteCacheByType("test_container")
+
+                attribute_container = test_lib.TestAttributeContainer()
+                attribute_container.attribute = "value"
+                test_store.AddAttributeContainer(attribute_container)
+
+                first_sequence_number, write_cache = test_store._GetWriteCache(
+                    "test_container"
+                )
+                self.assertEqual(first_sequence_number, 4)
+                self.assertEqual(write_cache, [["value"]])
+
+            finally:
+                test_store.Close()
+
     def testHasTable(self):
         """Tests the _HasTable function."""
         with test_lib.TempDirectory() as temp_directory:
@@ -283,6 +1557,38 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             finally:
                 test_store.Close()
 
+    def testInsertRows(self):
+        """Tests the _InsertRows function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(5):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+
+                # More columns than the maximum number of variables.
+                test_store._maximum_number_of_variables = 0
+
+                test_store._FlushWriteCacheByType("test_container")
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 5)
+
+                containers = list(test_store.GetAttributeContainers("test_container"))
+                self.assertEqual(
+                    [container.attribute for container in containers],
+                    [f"value{index:d}" for index in range(5)],
+                )
+
+            finally:
+                test_store.Close()
+
     def testRaiseIfNotReadable(self):
         """Tests the _RaiseIfNotReadable function."""
         test_store = sqlite_store.SQLiteAttributeContainerStore()
@@ -301,8 +1607,1182 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
     # TODO: add tests for _ReadMetadata
     # TODO: add tests for _UpdateStorageMetadataFormatVersion
 
-    def testWriteExistingAttributeContainer(self):
-        """Tests the _WriteExistingAttributeContainer function."""
+    def testReadTableNames(self):
+        """Tests the _ReadTableNames function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._CreateAttributeContainerTable("test_container")
+
+                test_store._table_names = set()
+                test_store._ReadTableNames()
+
+                self.assertEqual(
+                    test_store._table_names,
+                    {"metadata", "sqlite_sequence", "test_container"},
+                )
+
+            finally:
+                test_store.Close()
+
+    def testWriteExistingAttributeContainer(self):
+        """Tests the _WriteExistingAttributeContainer function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 0)
+
+                test_store._WriteNewAttributeContainer(attribute_container)
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 1)
+
+                test_store._WriteExistingAttributeContainer(attribute_container)
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 1)
+
+            finally:
+                test_store.Close()
+
+    def testWriteExistingAttributeContainers(self):
+        """Tests the _WriteExistingAttributeContainers function."""
+        attribute_containers = [test_lib.TestAttributeContainer() for _ in range(3)]
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._WriteNewAttributeContainers(attribute_containers)
+                test_store._FlushWriteCacheByType("test_container")
+
+                attribute_containers[0].attribute = "first"
+                test_store._WriteExistingAttributeContainers(attribute_containers)
+
+                attribute_containers[0].attribute = "updated"
+                test_store._WriteExistingAttributeContainers(attribute_containers[:1])
+
+                update_cache = test_store._update_cache["test_container"]
+                self.assertEqual(len(update_cache), 3)
+                self.assertEqual(update_cache[1], {0: "updated"})
+
+                test_store._attribute_container_cache.clear()
+
+                container = test_store.GetAttributeContainerByIndex("test_container", 0)
+                self.assertEqual(container.attribute, "updated")
+
+                containers = list(test_store.GetAttributeContainers("test_container"))
+                self.assertEqual(containers[0].attribute, "updated")
+
+                containers = list(
+                    test_store.GetAttributeContainers(
+                        "test_container", filter_expression='attribute == "updated"'
+                    )
+                )
+                self.assertEqual(len(containers), 1)
+                self.assertNotIn("test_container", test_store._update_cache)
+
+            finally:
+                test_store.Close()
+
+    # TODO: add tests for _WriteMetadata
+    # TODO: add tests for _WriteMetadataValue
+
+    def testWriteNewAttributeContainer(self):
+        """Tests the _WriteNewAttributeContainer function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 0)
+
+                test_store._WriteNewAttributeContainer(attribute_container)
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 1)
+
+            finally:
+                test_store.Close()
+
+    def testWriteNewAttributeContainers(self):
+        """Tests the _WriteNewAttributeContainers function."""
+        attribute_containers = []
+        for index in range(3):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{index:d}"
+            attribute_containers.append(attribute_container)
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store._WriteNewAttributeContainers(attribute_containers)
+
+                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 3)
+
+                identifier = attribute_containers[2].GetIdentifier()
+                self.assertEqual(identifier.sequence_number, 3)
+
+                test_store._attribute_container_cache.clear()
+
+                container = test_store.GetAttributeContainerByIndex("test_container", 2)
+                self.assertEqual(container.attribute, "value2")
+
+                with self.assertRaises(OSError):
+                    test_store._WriteNewAttributeContainers(
+                        [test_lib.TestAttributeContainer(), _BogusAttributeContainer()]
+                    )
+
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 3)
+
+            finally:
+                test_store.Close()
+
+    def testAddAttributeContainer(self):
+        """Tests the AddAttributeContainer function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 0)
+
+                test_store.AddAttributeContainer(attribute_container)
+
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    attribute_container.CONTAINER_TYPE
+                )
+                self.assertEqual(number_of_containers, 1)
+
+            finally:
+                test_store.Close()
+
+            with self.assertRaises(OSError):
+                test_store.AddAttributeContainer(attribute_container)
+
+    def testAddAttributeContainers(self):
+        """Tests the AddAttributeContainers function."""
+        attribute_containers = [test_lib.TestAttributeContainer() for _ in range(100)]
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store.AddAttributeContainers(attribute_containers)
+
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 100)
+
+            finally:
+                test_store.Close()
+
+            with self.assertRaises(OSError):
+                test_store.AddAttributeContainers(attribute_containers)
+
+    def testAddAttributeContainersWithCommitPolicy(self):
+        """Tests the AddAttributeContainers function with a commit policy."""
+        attribute_containers = []
+        for index in range(300):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{index:d}"
+            attribute_containers.append(attribute_container)
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(
+                path=test_path,
+                read_only=False,
+                use_writer_thread=True,
+                commit_number_of_rows=1,
+            )
+
+            try:
+                test_store.AddAttributeContainers(attribute_containers)
+
+                test_store._JoinWriteQueue()
+                self.assertFalse(test_store._connection.in_transaction)
+
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 300)
+
+            finally:
+                test_store.Close()
+
+    def testAddAttributeContainersWithWriterThread(self):
+        """Tests the AddAttributeContainers function with a writer thread."""
+        attribute_containers = []
+        for index in range(100):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{index:d}"
+            attribute_containers.append(attribute_container)
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(path=test_path, read_only=False, use_writer_thread=True)
+
+            try:
+                self.assertIsNotNone(test_store._writer_thread)
+
+                test_store.AddAttributeContainers(attribute_containers)
+
+                containers = list(test_store.GetAttributeContainers("test_container"))
+                self.assertEqual(len(containers), 100)
+                self.assertEqual(containers[99].attribute, "value99")
+
+            finally:
+                test_store.Close()
+
+            self.assertIsNone(test_store._writer_thread)
+
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path)
+
+            try:
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container"
+                )
+                self.assertEqual(number_of_containers, 100)
+
+            finally:
+                test_store.Close()
+
+    def testAddAttributeContainersWithWriterThreadFailure(self):
+        """Tests the AddAttributeContainers function with a failing writer thread."""
+        attribute_containers = []
+        for index in range(100):
+            attribute_container = test_lib.TestAttributeContainer()
+            attribute_container.attribute = f"value{index:d}"
+            attribute_containers.append(attribute_container)
+
+        # A list value cannot be bound to a parameter of a query.
+        attribute_containers[10].attribute = ["value10"]
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = _TestSQLiteAttributeContainerStoreWithSmallWriteCache()
+            test_store.Open(path=test_path, read_only=False, use_writer_thread=True)
+
+            try:
+                test_store.AddAttributeContainers(attribute_containers)
+
+                with self.assertRaises(OSError):
+                    test_store._Flush()
+
+                test_store.AddAttributeContainers(attribute_containers[10:11])
+
+                with self.assertRaises(OSError):
+                    test_store.Close()
+
+            finally:
+                if test_store._is_open:
+                    test_store.Close()
+
+            self.assertIsNone(test_store._writer_thread)
+
+    # TODO: add tests for CheckSupportedFormat
+
+    def _AddSizedAttributeContainers(self, test_store):
+        """Adds attribute containers with attributes to aggregate to a store.
+
+        Args:
+          test_store (SQLiteAttributeContainerStore): store.
+        """
+        for name, size, visible in (
+            ("name1", 4, True),
+            ("name2", 1, False),
+            ("name1", 2, False),
+            ("name2", None, True),
+            (None, 8, True),
+        ):
+            attribute_container = _TestSizedAttributeContainer()
+            attribute_container.name = name
+            attribute_container.size = size
+            attribute_container.visible = visible
+            test_store.AddAttributeContainer(attribute_container)
+
+    def testGetAggregatedAttributeValues(self):
+        """Tests the GetAggregatedAttributeValues function."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestSizedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "count"
+                    )
+                    self.assertEqual(value, 0)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "max", attribute_name="size"
+                    )
+                    self.assertIsNone(value)
+
+                    values = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "count", group_by="name"
+                    )
+                    self.assertEqual(values, {})
+
+                    # The attribute containers in the write cache are included.
+                    self._AddSizedAttributeContainers(test_store)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "count"
+                    )
+                    self.assertEqual(value, 5)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "count", attribute_name="size"
+                    )
+                    self.assertEqual(value, 4)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "max", attribute_name="size"
+                    )
+                    self.assertEqual(value, 8)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "min", attribute_name="visible"
+                    )
+                    self.assertIs(value, False)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container",
+                        "sum",
+                        attribute_name="size",
+                        filter_expression='name == "name1"',
+                    )
+                    self.assertEqual(value, 6)
+
+                    values = test_store.GetAggregatedAttributeValues(
+                        "sized_container", "count", group_by="name"
+                    )
+                    self.assertEqual(values, {None: 1, "name1": 2, "name2": 2})
+
+                    values = test_store.GetAggregatedAttributeValues(
+                        "sized_container",
+                        "max",
+                        attribute_name="size",
+                        group_by="visible",
+                    )
+                    self.assertEqual(values, {False: 2, True: 8})
+
+                    values = test_store.GetAggregatedAttributeValues(
+                        "sized_container",
+                        "sum",
+                        attribute_name="size",
+                        group_by="name",
+                        filter_expression="visible == True",
+                    )
+                    self.assertEqual(values, {None: 8, "name1": 4, "name2": None})
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetAggregatedAttributeValues(
+                            "sized_container", "avg", attribute_name="size"
+                        )
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetAggregatedAttributeValues(
+                            "sized_container", "max"
+                        )
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetAggregatedAttributeValues(
+                            "sized_container", "count", group_by="bogus"
+                        )
+
+                    with self.assertRaises(OSError):
+                        test_store.GetAggregatedAttributeValues("bogus", "count")
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestSizedAttributeContainer
+            )
+
+    def testGetAggregatedAttributeValuesWithJSON(self):
+        """Tests the GetAggregatedAttributeValues function with JSON values."""
+        schema.SchemaHelper.RegisterDataType(
+            "List[str]", {"json": _TestListSerializer()}
+        )
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestListAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    for items in (["a", "b"], ["b"], None):
+                        attribute_container = _TestListAttributeContainer()
+                        attribute_container.name = "name"
+                        attribute_container.items = items
+                        test_store.AddAttributeContainer(attribute_container)
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "list_container", "count", attribute_name="items"
+                    )
+                    self.assertEqual(value, 2)
+
+                    for function_name in ("max", "min", "sum"):
+                        with self.assertRaises(ValueError):
+                            test_store.GetAggregatedAttributeValues(
+                                "list_container", function_name, attribute_name="items"
+                            )
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetAggregatedAttributeValues(
+                            "list_container", "count", group_by="items"
+                        )
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestListAttributeContainer
+            )
+            schema.SchemaHelper.DeregisterDataType("List[str]")
+
+    def testGetAttributeContainerByIdentifier(self):
+        """Tests the GetAttributeContainerByIdentifier function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_store.AddAttributeContainer(attribute_container)
+
+                identifier = attribute_container.GetIdentifier()
+
+                container = test_store.GetAttributeContainerByIdentifier(
+                    attribute_container.CONTAINER_TYPE, identifier
+                )
+                self.assertIsNotNone(container)
+
+                identifier.sequence_number = 99
+
+                container = test_store.GetAttributeContainerByIdentifier(
+                    attribute_container.CONTAINER_TYPE, identifier
+                )
+                self.assertIsNone(container)
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainerByIndex(self):
+        """Tests the GetAttributeContainerByIndex function."""
+        attribute_container = test_lib.TestAttributeContainer()
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                container = test_store.GetAttributeContainerByIndex(
+                    attribute_container.CONTAINER_TYPE, 0
+                )
+                self.assertIsNone(container)
+
+                test_store.AddAttributeContainer(attribute_container)
+
+                container = test_store.GetAttributeContainerByIndex(
+                    attribute_container.CONTAINER_TYPE, 0
+                )
+                self.assertIsNotNone(container)
+
+                container = test_store.GetAttributeContainerByIndex("bogus", 0)
+                self.assertIsNone(container)
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainerByIndexFromWriteCache(self):
+        """Tests the GetAttributeContainerByIndex function with a write cache."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(4):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+
+                    if index == 1:
+                        test_store._FlushWriteCacheByType("test_container")
+
+                test_store._attribute_container_cache.clear()
+
+                container = test_store.GetAttributeContainerByIndex("test_container", 3)
+                self.assertIsNotNone(container)
+                self.assertEqual(container.attribute, "value3")
+                self.assertEqual(container.GetIdentifier().sequence_number, 4)
+
+                container = test_store.GetAttributeContainerByIndex("test_container", 0)
+                self.assertIsNotNone(container)
+                self.assertEqual(container.attribute, "value0")
+
+                self.assertEqual(len(test_store._write_cache["test_container"]), 2)
+
+                containers = list(test_store.GetAttributeContainers("test_container"))
+                self.assertEqual(
+                    [container.attribute for container in containers],
+                    ["value0", "value1", "value2", "value3"],
+                )
+
+                self.assertEqual(len(test_store._write_cache["test_container"]), 2)
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainerByIndexWithReadAhead(self):
+        """Tests the GetAttributeContainerByIndex function with read-ahead."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for index in range(40):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+
+                test_store._FlushWriteCacheByType("test_container")
+                test_store._attribute_container_cache.clear()
+
+                for index in range(40):
+                    container = test_store.GetAttributeContainerByIndex(
+                        "test_container", index
+                    )
+                    self.assertEqual(container.attribute, f"value{index:d}")
+
+                    if index == 2:
+                        # Containers 2 to 17 have been read ahead.
+                        self.assertEqual(len(test_store._attribute_container_cache), 18)
+
+                hit_rate = test_store.GetReadAheadHitRate("test_container")
+                self.assertEqual(hit_rate, 1.0)
+
+                container = test_store.GetAttributeContainerByIndex(
+                    "test_container", 40
+                )
+                self.assertIsNone(container)
+
+                # Cached attribute containers are not read ahead.
+                test_store._read_ahead_states = {}
+
+                for index in range(10):
+                    container = test_store.GetAttributeContainerByIndex(
+                        "test_container", index
+                    )
+                    self.assertEqual(container.attribute, f"value{index:d}")
+
+                self.assertIsNone(test_store.GetReadAheadHitRate("test_container"))
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainerByIndexWithAttributeNames(self):
+        """Tests the GetAttributeContainerByIndex function with attribute names."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    for index in range(2):
+                        attribute_container = _TestTrackedAttributeContainer()
+                        attribute_container.attribute = f"value{index:d}"
+                        attribute_container.other = f"other{index:d}"
+                        test_store.AddAttributeContainer(attribute_container)
+
+                        if index == 0:
+                            test_store._FlushWriteCacheByType("tracked_container")
+
+                    test_store._attribute_container_cache.clear()
+
+                    for index in range(2):
+                        container = test_store.GetAttributeContainerByIndex(
+                            "tracked_container", index, attribute_names=["other"]
+                        )
+                        self.assertIsNone(container.attribute)
+                        self.assertEqual(container.other, f"other{index:d}")
+                        self.assertEqual(
+                            container.GetIdentifier().sequence_number, index + 1
+                        )
+
+                    self.assertEqual(len(test_store._attribute_container_cache), 0)
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testGetAttributeContainers(self):
+        """Tests the GetAttributeContainers function."""
+        attribute_container = test_lib.TestAttributeContainer()
+        attribute_container.attribute = "8f0bf95a7959baad9666b21a7feed79d"
+
+        with test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "acstore.sqlite")
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                containers = list(
+                    test_store.GetAttributeContainers(
+                        attribute_container.CONTAINER_TYPE
+                    )
+                )
+                self.assertEqual(len(containers), 0)
+
+                test_store.AddAttributeContainer(attribute_container)
+
+                containers = list(
+                    test_store.GetAttributeContainers(
+                        attribute_container.CONTAINER_TYPE
+                    )
+                )
+                self.assertEqual(len(containers), 1)
+
+                filter_expression = 'attribute == "8f0bf95a7959baad9666b21a7feed79d"'
+                containers = list(
+                    test_store.GetAttributeContainers(
+                        attribute_container.CONTAINER_TYPE,
+                        filter_expression=filter_expression,
+                    )
+                )
+                self.assertEqual(len(containers), 1)
+
+                filter_expression = 'attribute != "8f0bf95a7959baad9666b21a7feed79d"'
+                containers = list(
+                    test_store.GetAttributeContainers(
+                        attribute_container.CONTAINER_TYPE,
+                        filter_expression=filter_expression,
+                    )
+                )
+                self.assertEqual(len(containers), 0)
+
+                with self.assertRaises(OSError):
+                    list(test_store.GetAttributeContainers("bogus"))
+
+            finally:
+                test_store.Close()
+
+    def testGetAttributeContainersWithComparisonFilter(self):
+        """Tests the GetAttributeContainers function with comparison filters."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestSizedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    self._AddSizedAttributeContainers(test_store)
+
+                    # The filter expressions have the same semantics as in
+                    # the fake store, where the attribute containers do not
+                    # match if the filter expression fails to evaluate.
+                    reference_store = fake_store.FakeAttributeContainerStore()
+                    reference_store.Open()
+                    self._AddSizedAttributeContainers(reference_store)
+
+                    for filter_expression, expected_sizes in (
+                        ("size >= 2 and size < 8", [4, 2]),
+                        ("1 < size <= 8", [4, 2, 8]),
+                        ("size < 4 < 9", [1, 2]),
+                        ('name != "name"', [4, 1, 2, None]),
+                        ('name > "name1"', [1, None]),
+                        ('name in ("name2", "other")', [1, None]),
+                        ('name not in ["name2"]', [4, 2]),
+                        ("name is None", []),
+                        ("name != None", [4, 1, 2, None]),
+                        ("size == None", []),
+                        ("size is not None and not visible", [1, 2]),
+                        ("not (size < 2 or size > 4)", [4, 2]),
+                        ("size > -1 and (visible == False or size == 8)", [1, 2, 8]),
+                        ("visible", [4, None, 8]),
+                        ("not name", []),
+                        ("not size", []),
+                        ("name > 5", []),
+                        ("name != 5", [4, 1, 2, None]),
+                        ("visible and size > 2", [4, 8]),
+                        ("visible or size > 2", [4, None, 8]),
+                        ("size > 1 or bogus == 1", [4, 2, 8]),
+                        ("not (1 < size < 8)", [1, 8]),
+                        ("(size > 2) == visible", [4, 1, 2, 8]),
+                        ("size == 10000000000000000000000", []),
+                        ("size < 10000000000000000000000", [4, 1, 2, 8]),
+                        ("size > 1 or size == -10000000000000000000000", [4, 2, 8]),
+                    ):
+                        containers = test_store.GetAttributeContainers(
+                            "sized_container", filter_expression=filter_expression
+                        )
+                        sizes = [container.size for container in containers]
+                        self.assertEqual(sizes, expected_sizes, filter_expression)
+
+                        containers = reference_store.GetAttributeContainers(
+                            "sized_container", filter_expression=filter_expression
+                        )
+                        sizes = [container.size for container in containers]
+                        self.assertEqual(sizes, expected_sizes, filter_expression)
+
+                        number_of_containers = (
+                            test_store.GetNumberOfAttributeContainers(
+                                "sized_container", filter_expression=filter_expression
+                            )
+                        )
+                        self.assertEqual(
+                            number_of_containers, len(expected_sizes), filter_expression
+                        )
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestSizedAttributeContainer
+            )
+
+    def testGetAttributeContainersWithJSONFilter(self):
+        """Tests the GetAttributeContainers function with JSON and identifiers."""
+        schema.SchemaHelper.RegisterDataTypes(
+            {
+                "Dict[str, object]": {"json": _TestDictSerializer()},
+                "List[str]": {"json": _TestListSerializer()},
+                "SimpleNamespace": {"json": _TestNamespaceSerializer()},
+            }
+        )
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestReferenceAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                reference_store = fake_store.FakeAttributeContainerStore()
+                reference_store.Open()
+
+                try:
+                    for items, mapping, parent, properties in (
+                        (
+                            ["a", "b"],
+                            {"x": 1, "names": ["a"]},
+                            "event.1",
+                            {"size": 4, "names": {"x": 1}},
+                        ),
+                        (["b"], {"y": "ab"}, "event.2", {"size": 8, "names": {"y": 2}}),
+                        (None, None, "event.1", {"size": 1}),
+                        (["c"], {"x": 2}, None, None),
+                    ):
+                        attribute_container = _TestReferenceAttributeContainer()
+                        attribute_container.items = items
+                        attribute_container.mapping = mapping
+                        if properties:
+                            attribute_container.properties = types.SimpleNamespace(
+                                **properties
+                            )
+                        if parent:
+                            attribute_container.parent = (
+                                containers_interface.AttributeContainerIdentifier()
+                            )
+                            attribute_container.parent.CopyFromString(parent)
+                        test_store.AddAttributeContainer(attribute_container)
+                        reference_store.AddAttributeContainer(
+                            copy.deepcopy(attribute_container)
+                        )
+
+                    plan = test_store._GetAttributeContainerPlan("reference_container")
+
+                    for filter_expression, expected_indexes in (
+                        ('parent == "event.1"', [0, 2]),
+                        ('parent in ("event.2", "event.3")', [1]),
+                        ('items[0] == "b"', [1]),
+                        ('"b" in items', [0, 1]),
+                        ('"b" not in items', [3]),
+                        ("properties.size >= 4", [0, 1]),
+                        ('"x" in properties.names', [0]),
+                        ('properties.names["y"] == 2', [1]),
+                        ('"x" not in properties.names', [1]),
+                        ('"a" in items[0]', [0]),
+                        ('items[0] != "b"', [0, 3]),
+                        ("properties.size != 4", [1, 2]),
+                        ('properties.size > "x"', []),
+                        ("properties.names is None", []),
+                        ('properties.names != "x"', [0, 1]),
+                        ("1 in properties.names", []),
+                        ('-2 < properties.names["x"]', [0]),
+                        ('mapping["x"] == 1', [0]),
+                        ('"x" in mapping', [0, 3]),
+                        ('"y" not in mapping', [0, 3]),
+                        ('"a" in mapping["names"]', [0]),
+                        ('"a" in mapping["y"]', [1]),
+                    ):
+                        _, _, residual_expression = plan.CompileFilterExpression(
+                            filter_expression
+                        )
+                        self.assertIsNone(residual_expression, filter_expression)
+
+                        containers = test_store.GetAttributeContainers(
+                            "reference_container", filter_expression=filter_expression
+                        )
+                        indexes = [
+                            container.GetIdentifier().sequence_number - 1
+                            for container in containers
+                        ]
+                        self.assertEqual(indexes, expected_indexes, filter_expression)
+
+                        # The filter expression has the same semantics as when
+                        # evaluated on the attribute containers.
+                        code = compile(filter_expression, "<string>", mode="eval")
+                        indexes = [
+                            index
+                            for index, container in enumerate(
+                                test_store.GetAttributeContainers("reference_container")
+                            )
+                            if container.MatchesExpression(code)
+                        ]
+                        self.assertEqual(indexes, expected_indexes, filter_expression)
+
+                    # Accesses that do not correspond to the type of the runtime
+                    # value are evaluated on the attribute containers.
+                    for filter_expression, expected_indexes in (
+                        ('properties["size"] == 4', []),
+                        ('"size" in properties', []),
+                        ('"size" not in properties', []),
+                        ("properties.names.x == 1", []),
+                        ("mapping.x == 1", []),
+                        ('"a" == mapping["names"][0]', [0]),
+                        ('items[0][0] == "a"', [0]),
+                    ):
+                        _, _, residual_expression = plan.CompileFilterExpression(
+                            filter_expression
+                        )
+                        self.assertIsNotNone(residual_expression, filter_expression)
+
+                    # The filter expressions have the same semantics as in
+                    # the fake store.
+                    for filter_expression, expected_indexes in (
+                        ('properties["size"] == 4', []),
+                        ('"size" in properties', []),
+                        ('"size" not in properties', []),
+                        ("properties.names.x == 1", []),
+                        ("mapping.x == 1", []),
+                        ('"a" == mapping["names"][0]', [0]),
+                        ('items[0][0] == "a"', [0]),
+                        ('"x" in mapping', [0, 3]),
+                        ('"a" in mapping["y"]', [1]),
+                        ('"x" in properties.names', [0]),
+                    ):
+                        for store in (test_store, reference_store):
+                            containers = store.GetAttributeContainers(
+                                "reference_container",
+                                filter_expression=filter_expression,
+                            )
+                            indexes = [
+                                container.GetIdentifier().sequence_number - 1
+                                for container in containers
+                            ]
+                            self.assertEqual(
+                                indexes, expected_indexes, filter_expression
+                            )
+
+                    # Values stored as JSON cannot be ordered by.
+                    for order_by in ("items", "mapping", "properties"):
+                        with self.assertRaises(ValueError):
+                            test_store.GetAttributeContainers(
+                                "reference_container", order_by=order_by
+                            )
+
+                        with self.assertRaises(ValueError):
+                            list(
+                                reference_store.GetAttributeContainers(
+                                    "reference_container", order_by=order_by
+                                )
+                            )
+
+                finally:
+                    reference_store.Close()
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestReferenceAttributeContainer
+            )
+            schema.SchemaHelper.DeregisterDataType("Dict[str, object]")
+            schema.SchemaHelper.DeregisterDataType("List[str]")
+            schema.SchemaHelper.DeregisterDataType("SimpleNamespace")
+
+    def testGetAttributeContainersWithResidualFilter(self):
+        """Tests the GetAttributeContainers function with a residual filter."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestSizedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    self._AddSizedAttributeContainers(test_store)
+
+                    filter_expression = 'name.endswith("1") and size > 1'
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "sized_container", filter_expression=filter_expression
+                        )
+                    )
+                    self.assertEqual(
+                        [container.size for container in containers], [4, 2]
+                    )
+
+                    # Only the attributes used by the residual filter are retrieved
+                    # in addition to the requested attributes.
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "sized_container",
+                            filter_expression=filter_expression,
+                            attribute_names=["visible"],
+                            limit=1,
+                        )
+                    )
+                    self.assertEqual(len(containers), 1)
+                    self.assertEqual(containers[0].name, "name1")
+                    self.assertIsNone(containers[0].size)
+                    self.assertTrue(containers[0].visible)
+
+                    number_of_containers = test_store.GetNumberOfAttributeContainers(
+                        "sized_container", filter_expression=filter_expression
+                    )
+                    self.assertEqual(number_of_containers, 2)
+
+                    result = test_store.HasAttributeContainers(
+                        "sized_container", filter_expression=filter_expression
+                    )
+                    self.assertTrue(result)
+
+                    result = test_store.HasAttributeContainers(
+                        "sized_container", filter_expression='name.endswith("3")'
+                    )
+                    self.assertFalse(result)
+
+                    values = list(
+                        test_store.IterateAttributeValues(
+                            "sized_container",
+                            attribute_names=["size"],
+                            filter_expression=filter_expression,
+                        )
+                    )
+                    self.assertEqual(values, [(1, (4,)), (3, (2,))])
+
+                    value = test_store.GetAggregatedAttributeValues(
+                        "sized_container",
+                        "sum",
+                        attribute_name="size",
+                        filter_expression=filter_expression,
+                    )
+                    self.assertEqual(value, 6)
+
+                    values = test_store.GetDistinctAttributeValues(
+                        "sized_container",
+                        "visible",
+                        filter_expression=filter_expression,
+                    )
+                    self.assertEqual(sorted(values), [False, True])
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestSizedAttributeContainer
+            )
+
+    def testGetAttributeContainersWithAttributeNames(self):
+        """Tests the GetAttributeContainers function with attribute names."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    for index in range(2):
+                        attribute_container = _TestTrackedAttributeContainer()
+                        attribute_container.attribute = f"value{index:d}"
+                        attribute_container.other = f"other{index:d}"
+                        test_store.AddAttributeContainer(attribute_container)
+
+                        if index == 0:
+                            test_store._FlushWriteCacheByType("tracked_container")
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "tracked_container", attribute_names=["other"]
+                        )
+                    )
+                    self.assertEqual(len(containers), 2)
+                    self.assertEqual(
+                        [container.attribute for container in containers], [None, None]
+                    )
+                    self.assertEqual(
+                        [container.other for container in containers],
+                        ["other0", "other1"],
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "tracked_container", attribute_names=[]
+                        )
+                    )
+                    self.assertEqual(len(containers), 2)
+                    self.assertIsNone(containers[0].other)
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testGetDistinctAttributeValues(self):
+        """Tests the GetDistinctAttributeValues function."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestSizedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    values = test_store.GetDistinctAttributeValues(
+                        "sized_container", "name"
+                    )
+                    self.assertEqual(values, [])
+
+                    self._AddSizedAttributeContainers(test_store)
+
+                    values = test_store.GetDistinctAttributeValues(
+                        "sized_container", "name"
+                    )
+                    self.assertEqual(
+                        sorted(values, key=lambda value: (value is not None, value)),
+                        [None, "name1", "name2"],
+                    )
+
+                    values = test_store.GetDistinctAttributeValues(
+                        "sized_container",
+                        "visible",
+                        filter_expression='name == "name2"',
+                    )
+                    self.assertEqual(sorted(values), [False, True])
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetDistinctAttributeValues(
+                            "sized_container", "bogus"
+                        )
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestSizedAttributeContainer
+            )
+
+    def testGetNumberOfAttributeContainers(self):
+        """Tests the GetNumberOfAttributeContainers function."""
         attribute_container = test_lib.TestAttributeContainer()
 
         with test_lib.TempDirectory() as temp_directory:
@@ -311,58 +2791,61 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
                     attribute_container.CONTAINER_TYPE
                 )
                 self.assertEqual(number_of_containers, 0)
 
-                test_store._WriteNewAttributeContainer(attribute_container)
+                test_store.AddAttributeContainer(attribute_container)
 
-                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
                     attribute_container.CONTAINER_TYPE
                 )
                 self.assertEqual(number_of_containers, 1)
 
-                test_store._WriteExistingAttributeContainer(attribute_container)
-
-                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
-                    attribute_container.CONTAINER_TYPE
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "bogus"
                 )
-                self.assertEqual(number_of_containers, 1)
+                self.assertEqual(number_of_containers, 0)
 
             finally:
                 test_store.Close()
 
-    # TODO: add tests for _WriteMetadata
-    # TODO: add tests for _WriteMetadataValue
-
-    def testWriteNewAttributeContainer(self):
-        """Tests the _WriteNewAttributeContainer function."""
-        attribute_container = test_lib.TestAttributeContainer()
-
+    def testGetNumberOfAttributeContainersWithFilter(self):
+        """Tests the GetNumberOfAttributeContainers function with a filter."""
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
             test_store = sqlite_store.SQLiteAttributeContainerStore()
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
-                    attribute_container.CONTAINER_TYPE
+                filter_expression = 'attribute == "value1"'
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container", filter_expression=filter_expression
                 )
                 self.assertEqual(number_of_containers, 0)
 
-                test_store._WriteNewAttributeContainer(attribute_container)
+                for index in range(4):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index % 2:d}"
+                    test_store.AddAttributeContainer(attribute_container)
 
-                number_of_containers = test_store._GetNumberOfAttributeContainerRows(
-                    attribute_container.CONTAINER_TYPE
+                # The attribute containers in the write cache are included.
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container", filter_expression=filter_expression
                 )
-                self.assertEqual(number_of_containers, 1)
+                self.assertEqual(number_of_containers, 2)
+
+                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                    "test_container", filter_expression='attribute == "bogus"'
+                )
+                self.assertEqual(number_of_containers, 0)
 
             finally:
                 test_store.Close()
 
-    def testAddAttributeContainer(self):
-        """Tests the AddAttributeContainer function."""
+    def testHasAttributeContainers(self):
+        """Tests the HasAttributeContainers function."""
         attribute_container = test_lib.TestAttributeContainer()
 
         with test_lib.TempDirectory() as temp_directory:
@@ -371,136 +2854,495 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                result = test_store.HasAttributeContainers(
                     attribute_container.CONTAINER_TYPE
                 )
-                self.assertEqual(number_of_containers, 0)
+                self.assertFalse(result)
 
                 test_store.AddAttributeContainer(attribute_container)
 
-                number_of_containers = test_store.GetNumberOfAttributeContainers(
+                result = test_store.HasAttributeContainers(
                     attribute_container.CONTAINER_TYPE
                 )
-                self.assertEqual(number_of_containers, 1)
+                self.assertTrue(result)
+
+                result = test_store.HasAttributeContainers("bogus")
+                self.assertFalse(result)
 
             finally:
                 test_store.Close()
 
-            with self.assertRaises(OSError):
-                test_store.AddAttributeContainer(attribute_container)
-
-    # TODO: add tests for CheckSupportedFormat
-
-    def testGetAttributeContainerByIdentifier(self):
-        """Tests the GetAttributeContainerByIdentifier function."""
-        attribute_container = test_lib.TestAttributeContainer()
-
+    def testHasAttributeContainersWithFilter(self):
+        """Tests the HasAttributeContainers function with a filter."""
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
             test_store = sqlite_store.SQLiteAttributeContainerStore()
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                test_store.AddAttributeContainer(attribute_container)
+                filter_expression = 'attribute == "value"'
+                result = test_store.HasAttributeContainers(
+                    "test_container", filter_expression=filter_expression
+                )
+                self.assertFalse(result)
 
-                identifier = attribute_container.GetIdentifier()
+                attribute_container = test_lib.TestAttributeContainer()
+                attribute_container.attribute = "value"
+                test_store.AddAttributeContainer(attribute_container)
 
-                container = test_store.GetAttributeContainerByIdentifier(
-                    attribute_container.CONTAINER_TYPE, identifier
+                result = test_store.HasAttributeContainers(
+                    "test_container", filter_expression=filter_expression
                 )
-                self.assertIsNotNone(container)
+                self.assertTrue(result)
 
-                identifier.sequence_number = 99
+                result = test_store.HasAttributeContainers(
+                    "test_container", filter_expression='attribute == "bogus"'
+                )
+                self.assertFalse(result)
 
-                container = test_store.GetAttributeContainerByIdentifier(
-                    attribute_container.CONTAINER_TYPE, identifier
+                result = test_store.HasAttributeContainers(
+                    "bogus", filter_expression=filter_expression
                 )
-                self.assertIsNone(container)
+                self.assertFalse(result)
 
             finally:
                 test_store.Close()
 
-    def testGetAttributeContainerByIndex(self):
-        """Tests the GetAttributeContainerByIndex function."""
-        attribute_container = test_lib.TestAttributeContainer()
-
+    def testGetAttributeContainersByIdentifiers(self):
+        """Tests the GetAttributeContainersByIdentifiers function."""
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
             test_store = sqlite_store.SQLiteAttributeContainerStore()
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                container = test_store.GetAttributeContainerByIndex(
-                    attribute_container.CONTAINER_TYPE, 0
+                identifiers = []
+                for index in range(3):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
+                    identifiers.append(attribute_container.GetIdentifier())
+
+                containers = test_store.GetAttributeContainersByIdentifiers(
+                    "test_container", [identifiers[2], identifiers[0]]
                 )
-                self.assertIsNone(container)
-
-                test_store.AddAttributeContainer(attribute_container)
-
-                container = test_store.GetAttributeContainerByIndex(
-                    attribute_container.CONTAINER_TYPE, 0
+                self.assertEqual(
+                    [container.attribute for container in containers],
+                    ["value2", "value0"],
                 )
-                self.assertIsNotNone(container)
-
-                container = test_store.GetAttributeContainerByIndex("bogus", 0)
-                self.assertIsNone(container)
 
             finally:
                 test_store.Close()
 
-    def testGetAttributeContainers(self):
-        """Tests the GetAttributeContainers function."""
-        attribute_container = test_lib.TestAttributeContainer()
-        attribute_container.attribute = "8f0bf95a7959baad9666b21a7feed79d"
-
+    def testGetAttributeContainersByIndexes(self):
+        """Tests the GetAttributeContainersByIndexes function."""
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
             test_store = sqlite_store.SQLiteAttributeContainerStore()
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                containers = list(
-                    test_store.GetAttributeContainers(
-                        attribute_container.CONTAINER_TYPE
-                    )
+                containers = test_store.GetAttributeContainersByIndexes(
+                    "test_container", [0, 1]
                 )
-                self.assertEqual(len(containers), 0)
+                self.assertEqual(containers, [None, None])
 
-                test_store.AddAttributeContainer(attribute_container)
+                for index in range(6):
+                    attribute_container = test_lib.TestAttributeContainer()
+                    attribute_container.attribute = f"value{index:d}"
+                    test_store.AddAttributeContainer(attribute_container)
 
-                containers = list(
-                    test_store.GetAttributeContainers(
-                        attribute_container.CONTAINER_TYPE
-                    )
+                    if index == 2:
+                        test_store._FlushWriteCacheByType("test_container")
+
+                attribute_container = test_store.GetAttributeContainerByIndex(
+                    "test_container", 1
                 )
-                self.assertEqual(len(containers), 1)
+                attribute_container.attribute = "updated1"
+                test_store.UpdateAttributeContainer(attribute_container)
 
-                filter_expression = 'attribute == "8f0bf95a7959baad9666b21a7feed79d"'
-                containers = list(
-                    test_store.GetAttributeContainers(
-                        attribute_container.CONTAINER_TYPE,
-                        filter_expression=filter_expression,
-                    )
+                test_store._attribute_container_cache.clear()
+
+                containers = test_store.GetAttributeContainersByIndexes(
+                    "test_container", [4, 0, 2, 1, 0, 99, -1]
                 )
-                self.assertEqual(len(containers), 1)
+                self.assertEqual(len(containers), 7)
+                self.assertEqual(
+                    [container.attribute for container in containers[:5]],
+                    ["value4", "value0", "value2", "updated1", "value0"],
+                )
+                self.assertIs(containers[1], containers[4])
+                self.assertIsNone(containers[5])
+                self.assertIsNone(containers[6])
 
-                filter_expression = 'attribute != "8f0bf95a7959baad9666b21a7feed79d"'
-                containers = list(
-                    test_store.GetAttributeContainers(
-                        attribute_container.CONTAINER_TYPE,
-                        filter_expression=filter_expression,
-                    )
+                identifier = containers[0].GetIdentifier()
+                self.assertEqual(identifier.sequence_number, 5)
+
+                self.assertEqual(len(test_store._attribute_container_cache), 4)
+
+                cached_containers = test_store.GetAttributeContainersByIndexes(
+                    "test_container", [2]
                 )
-                self.assertEqual(len(containers), 0)
+                self.assertIs(cached_containers[0], containers[2])
 
-                with self.assertRaises(OSError):
-                    list(test_store.GetAttributeContainers("bogus"))
+                test_store._attribute_container_cache.clear()
+
+                containers = test_store.GetAttributeContainersByIndexes(
+                    "test_container", [0, 1], attribute_names=[]
+                )
+                self.assertEqual(
+                    [container.attribute for container in containers], [None, None]
+                )
+                self.assertEqual(len(test_store._attribute_container_cache), 0)
 
             finally:
                 test_store.Close()
 
-    def testGetNumberOfAttributeContainers(self):
-        """Tests the GetNumberOfAttributeContainers function."""
+    def testGetAttributeContainersWithOrderAndRange(self):
+        """Tests the GetAttributeContainers function with order and range."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = _TestSQLiteAttributeContainerStoreWithSmallFetches()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    for index in range(6):
+                        attribute_container = _TestTrackedAttributeContainer()
+                        attribute_container.attribute = f"value{index:d}"
+                        attribute_container.other = f"other{5 - index:d}"
+                        test_store.AddAttributeContainer(attribute_container)
+
+                        if index == 2:
+                            test_store._FlushWriteCacheByType("tracked_container")
+
+                    # Page through the attribute containers, which are partially
+                    # stored in the write cache.
+                    pages = []
+                    start_index = 0
+                    while True:
+                        containers = list(
+                            test_store.GetAttributeContainers(
+                                "tracked_container", start_index=start_index, limit=4
+                            )
+                        )
+                        if not containers:
+                            break
+
+                        pages.append([container.attribute for container in containers])
+                        start_index = containers[-1].GetIdentifier().sequence_number
+
+                    self.assertEqual(
+                        pages,
+                        [
+                            ["value0", "value1", "value2", "value3"],
+                            ["value4", "value5"],
+                        ],
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "tracked_container", start_index=1, end_index=4
+                        )
+                    )
+                    self.assertEqual(
+                        [container.attribute for container in containers],
+                        ["value1", "value2", "value3"],
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "tracked_container", order_by="other", limit=2
+                        )
+                    )
+                    self.assertEqual(
+                        [container.attribute for container in containers],
+                        ["value5", "value4"],
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "tracked_container",
+                            filter_expression='other != "other0"',
+                            order_by="other",
+                            start_index=2,
+                        )
+                    )
+                    self.assertEqual(
+                        [container.attribute for container in containers],
+                        ["value4", "value3", "value2"],
+                    )
+
+                    with self.assertRaises(ValueError):
+                        test_store.GetAttributeContainers(
+                            "tracked_container", order_by="bogus"
+                        )
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testGetAttributeContainersWithOrderAndAfterKey(self):
+        """Tests the GetAttributeContainers function with order and after key."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = _TestSQLiteAttributeContainerStoreWithSmallFetches()
+                test_store.Open(path=test_path, read_only=False)
+
+                reference_store = fake_store.FakeAttributeContainerStore()
+                reference_store.Open()
+
+                try:
+                    for index, value in enumerate(
+                        ["b", None, "a", "b", None, "a", "b"]
+                    ):
+                        for store in (test_store, reference_store):
+                            attribute_container = _TestTrackedAttributeContainer()
+                            attribute_container.attribute = f"value{index:d}"
+                            attribute_container.other = value
+                            store.AddAttributeContainer(attribute_container)
+
+                        if index == 2:
+                            test_store._FlushWriteCacheByType("tracked_container")
+
+                    for store in (test_store, reference_store):
+                        # Page through the attribute containers in order of
+                        # an attribute with duplicate and without values.
+                        pages = []
+                        after_key = None
+                        while True:
+                            containers = list(
+                                store.GetAttributeContainers(
+                                    "tracked_container",
+                                    order_by="other",
+                                    limit=2,
+                                    after_key=after_key,
+                                )
+                            )
+                            if not containers:
+                                break
+
+                            pages.append(
+                                [container.attribute for container in containers]
+                            )
+                            identifier = containers[-1].GetIdentifier()
+                            after_key = (
+                                containers[-1].other,
+                                identifier.sequence_number - 1,
+                            )
+
+                        self.assertEqual(
+                            pages,
+                            [
+                                ["value1", "value4"],
+                                ["value2", "value5"],
+                                ["value0", "value3"],
+                                ["value6"],
+                            ],
+                        )
+
+                        containers = list(
+                            store.GetAttributeContainers(
+                                "tracked_container",
+                                filter_expression='attribute != "value3"',
+                                order_by="other",
+                                after_key=("a", 2),
+                            )
+                        )
+                        self.assertEqual(
+                            [container.attribute for container in containers],
+                            ["value5", "value0", "value6"],
+                        )
+
+                        with self.assertRaises(ValueError):
+                            list(
+                                store.GetAttributeContainers(
+                                    "tracked_container", after_key=("a", 2)
+                                )
+                            )
+
+                    # Test negative indexes and limits.
+                    for arguments in (
+                        {"start_index": -2, "limit": 2},
+                        {"end_index": -2},
+                        {"limit": 0},
+                        {"limit": -1},
+                        {"order_by": "other", "start_index": -1, "limit": -2},
+                    ):
+                        containers = list(
+                            test_store.GetAttributeContainers(
+                                "tracked_container", **arguments
+                            )
+                        )
+                        expected_containers = list(
+                            reference_store.GetAttributeContainers(
+                                "tracked_container", **arguments
+                            )
+                        )
+                        self.assertEqual(
+                            [container.attribute for container in containers],
+                            [container.attribute for container in expected_containers],
+                            arguments,
+                        )
+
+                finally:
+                    reference_store.Close()
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testGetAttributeContainersWithLazyDeserialization(self):
+        """Tests the GetAttributeContainers function with lazy deserialization."""
+        schema.SchemaHelper.RegisterDataType(
+            "List[str]", {"json": _TestListSerializer()}
+        )
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestListAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    attribute_container = _TestListAttributeContainer()
+                    attribute_container.name = "name"
+                    attribute_container.items = ["value1", "value2"]
+                    test_store.AddAttributeContainer(attribute_container)
+
+                finally:
+                    test_store.Close()
+
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, lazy_deserialization=True)
+
+                try:
+                    containers = list(
+                        test_store.GetAttributeContainers("list_container")
+                    )
+                    self.assertEqual(len(containers), 1)
+
+                    container = containers[0]
+                    self.assertEqual(container.name, "name")
+                    self.assertNotIn("items", container.__dict__)
+                    self.assertEqual(container.items, ["value1", "value2"])
+                    self.assertIn("items", container.__dict__)
+
+                    container = test_store.GetAttributeContainerByIndex(
+                        "list_container", 0
+                    )
+                    self.assertEqual(
+                        container.CopyToDict(),
+                        {"name": "name", "items": ["value1", "value2"]},
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            "list_container", filter_expression='name == "name"'
+                        )
+                    )
+                    self.assertTrue(
+                        containers[0].MatchesExpression('"value1" in items')
+                    )
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestListAttributeContainer
+            )
+            schema.SchemaHelper.DeregisterDataType("List[str]")
+
+    def testIterateAttributeValues(self):
+        """Tests the IterateAttributeValues function."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
+
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = _TestSQLiteAttributeContainerStoreWithSmallFetches()
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    for index in range(4):
+                        attribute_container = _TestTrackedAttributeContainer()
+                        attribute_container.attribute = f"value{index:d}"
+                        test_store.AddAttributeContainer(attribute_container)
+
+                        if index == 2:
+                            test_store._FlushWriteCacheByType("tracked_container")
+
+                    attribute_container = test_store.GetAttributeContainerByIndex(
+                        "tracked_container", 1
+                    )
+                    attribute_container.other = "other1"
+                    test_store.UpdateAttributeContainer(attribute_container)
+
+                    values = list(
+                        test_store.IterateAttributeValues("tracked_container")
+                    )
+                    self.assertEqual(
+                        values,
+                        [
+                            (1, ("value0", None)),
+                            (2, ("value1", "other1")),
+                            (3, ("value2", None)),
+                            (4, ("value3", None)),
+                        ],
+                    )
+
+                    values = list(
+                        test_store.IterateAttributeValues(
+                            "tracked_container", attribute_names=["other", "bogus"]
+                        )
+                    )
+                    self.assertEqual(values[1], (2, ("other1", None)))
+
+                    values = list(
+                        test_store.IterateAttributeValues(
+                            "tracked_container",
+                            attribute_names=["attribute"],
+                            filter_expression='attribute == "value3"',
+                        )
+                    )
+                    self.assertEqual(values, [(4, ("value3",))])
+
+                    with self.assertRaises(OSError):
+                        list(test_store.IterateAttributeValues("bogus"))
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    # TODO: add tests for Open and Close
+
+    def testUpdateAttributeContainer(self):
+        """Tests the UpdateAttributeContainer function."""
         attribute_container = test_lib.TestAttributeContainer()
 
         with test_lib.TempDirectory() as temp_directory:
@@ -521,47 +3363,68 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
                 )
                 self.assertEqual(number_of_containers, 1)
 
+                test_store.UpdateAttributeContainer(attribute_container)
+
                 number_of_containers = test_store.GetNumberOfAttributeContainers(
-                    "bogus"
+                    attribute_container.CONTAINER_TYPE
                 )
-                self.assertEqual(number_of_containers, 0)
+                self.assertEqual(number_of_containers, 1)
 
             finally:
                 test_store.Close()
 
-    def testHasAttributeContainers(self):
-        """Tests the HasAttributeContainers function."""
-        attribute_container = test_lib.TestAttributeContainer()
+    def testUpdateAttributeContainerWithTrackedAttributes(self):
+        """Tests the UpdateAttributeContainer function with tracked attributes."""
+        containers_manager.AttributeContainersManager.RegisterAttributeContainer(
+            _TestTrackedAttributeContainer
+        )
 
-        with test_lib.TempDirectory() as temp_directory:
-            test_path = os.path.join(temp_directory, "acstore.sqlite")
-            test_store = sqlite_store.SQLiteAttributeContainerStore()
-            test_store.Open(path=test_path, read_only=False)
+        try:
+            with test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "acstore.sqlite")
+                test_store = sqlite_store.SQLiteAttributeContainerStore()
+                test_store.Open(path=test_path, read_only=False)
 
-            try:
-                result = test_store.HasAttributeContainers(
-                    attribute_container.CONTAINER_TYPE
-                )
-                self.assertFalse(result)
+                try:
+                    attribute_container = _TestTrackedAttributeContainer()
+                    attribute_container.attribute = "value"
+                    attribute_container.other = "other value"
 
-                test_store.AddAttributeContainer(attribute_container)
+                    test_store.AddAttributeContainer(attribute_container)
+                    self.assertEqual(
+                        attribute_container.GetChangedAttributeNames(), set()
+                    )
+                    test_store._FlushWriteCacheByType("tracked_container")
 
-                result = test_store.HasAttributeContainers(
-                    attribute_container.CONTAINER_TYPE
-                )
-                self.assertTrue(result)
+                    test_store.UpdateAttributeContainer(attribute_container)
+                    self.assertNotIn("tracked_container", test_store._update_cache)
 
-                result = test_store.HasAttributeContainers("bogus")
-                self.assertFalse(result)
+                    attribute_container.other = "updated"
+                    test_store.UpdateAttributeContainer(attribute_container)
 
-            finally:
-                test_store.Close()
+                    update_cache = test_store._update_cache["tracked_container"]
+                    self.assertEqual(update_cache, {1: {1: "updated"}})
 
-    # TODO: add tests for Open and Close
+                    test_store._attribute_container_cache.clear()
 
-    def testUpdateAttributeContainer(self):
-        """Tests the UpdateAttributeContainer function."""
-        attribute_container = test_lib.TestAttributeContainer()
+                    container = test_store.GetAttributeContainerByIndex(
+                        "tracked_container", 0
+                    )
+                    self.assertEqual(container.attribute, "value")
+                    self.assertEqual(container.other, "updated")
+                    self.assertEqual(container.GetChangedAttributeNames(), set())
+
+                finally:
+                    test_store.Close()
+
+        finally:
+            containers_manager.AttributeContainersManager.DeregisterAttributeContainer(
+                _TestTrackedAttributeContainer
+            )
+
+    def testUpdateAttributeContainers(self):
+        """Tests the UpdateAttributeContainers function."""
+        attribute_containers = [test_lib.TestAttributeContainer() for _ in range(3)]
 
         with test_lib.TempDirectory() as temp_directory:
             test_path = os.path.join(temp_directory, "acstore.sqlite")
@@ -569,24 +3432,25 @@ class SQLiteAttributeContainerStoreTest(test_lib.BaseTestCase):
             test_store.Open(path=test_path, read_only=False)
 
             try:
-                number_of_containers = test_store.GetNumberOfAttributeContainers(
-                    attribute_container.CONTAINER_TYPE
-                )
-                self.assertEqual(number_of_containers, 0)
+                test_store.AddAttributeContainers(attribute_containers)
 
-                test_store.AddAttributeContainer(attribute_container)
+                for attribute_container in attribute_containers:
+                    attribute_container.attribute = "updated"
 
-                number_of_containers = test_store.GetNumberOfAttributeContainers(
-                    attribute_container.CONTAINER_TYPE
-                )
-                self.assertEqual(number_of_containers, 1)
+                test_store.UpdateAttributeContainers(attribute_containers)
 
-                test_store.UpdateAttributeContainer(attribute_container)
+            finally:
+                test_store.Close()
 
-                number_of_containers = test_store.GetNumberOfAttributeContainers(
-                    attribute_container.CONTAINER_TYPE
+            test_store = sqlite_store.SQLiteAttributeContainerStore()
+            test_store.Open(path=test_path)
+
+            try:
+                containers = list(test_store.GetAttributeContainers("test_container"))
+                self.assertEqual(
+                    [container.attribute for container in containers],
+                    ["updated", "updated", "updated"],
                 )
-                self.assertEqual(number_of_containers, 1)
 
             finally:
                 test_store.Close()